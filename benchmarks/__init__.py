@@ -0,0 +1,6 @@
+"""
+Micro-benchmarks for performance sensitive code paths.
+
+They are not collected by ``pytest``, run them manually from the project root:
+``python -m benchmarks.<name>``
+"""
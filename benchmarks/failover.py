@@ -0,0 +1,52 @@
+"""
+Spread calls between a fast and a slow :term:`Placeholder API` mirror.
+
+Run with: ``python -m benchmarks.failover``
+
+Compares latency when every call goes to the (slow) primary
+with latency when calls are balanced between both mirrors.
+"""
+
+import statistics
+import time
+
+from benchmarks.standin import photos, standin_server
+from server.apps.pictures.intrastructure.services.placeholder import (
+    PicturesFetch,
+)
+from server.common.services import balancing
+
+_CALLS = 200
+_SLOW_LATENCY = 0.05
+
+
+def _measure(name: str, fetcher: PicturesFetch) -> None:
+    timings = []
+    for _ in range(_CALLS):
+        start = time.perf_counter()
+        fetcher(limit=10)
+        timings.append(time.perf_counter() - start)
+    print('{0:>8}: mean={1:.1f}ms total={2:.2f}s'.format(
+        name, statistics.mean(timings) * 1000, sum(timings),
+    ))
+
+
+def main() -> None:
+    """Run the benchmark."""
+    payload = photos(10)
+    with standin_server(payload, delay=_SLOW_LATENCY) as slow:
+        with standin_server(payload) as fast:
+            _measure('single', PicturesFetch(api_url=slow.url, api_timeout=5))
+            slow_hits = slow.hits
+            _measure('mirrors', PicturesFetch(
+                api_url=slow.url,
+                api_timeout=5,
+                endpoints=balancing.EndpointPool(urls=(slow.url, fast.url)),
+            ))
+            print('mirrors: slow served {0}, fast served {1}'.format(
+                slow.hits - slow_hits, fast.hits,
+            ))
+
+
+if __name__ == '__main__':
+    main()
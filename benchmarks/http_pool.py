@@ -0,0 +1,56 @@
+"""
+Compare pooled keep-alive requests with one-connection-per-call requests.
+
+Run with: ``python -m benchmarks.http_pool``
+
+The stand-in server speaks plain HTTP, so this only measures TCP setup.
+With TLS (which the real :term:`Placeholder API` uses) the difference
+is even bigger, since the handshake is saved as well.
+"""
+
+import statistics
+import time
+from typing import Callable, List
+
+import requests
+
+from benchmarks.standin import photos, standin_server
+from server.common.services import sessions
+
+_CALLS = 500
+
+
+def _measure(call: Callable[[], object]) -> List[float]:
+    timings = []
+    for _ in range(_CALLS):
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _report(name: str, timings: List[float]) -> None:
+    quantiles = statistics.quantiles(timings, n=100)
+    print('{0:>10}: p50={1:.3f}ms p99={2:.3f}ms total={3:.2f}s'.format(
+        name,
+        quantiles[49] * 1000,
+        quantiles[98] * 1000,
+        sum(timings),
+    ))
+
+
+def main() -> None:
+    """Run the benchmark."""
+    with standin_server(photos(10)) as standin:
+        photos_url = '{0}photos'.format(standin.url)
+        session = sessions.pooled_session(pool_size=10)
+        _report('unpooled', _measure(
+            lambda: requests.get(photos_url, timeout=5),
+        ))
+        _report('pooled', _measure(
+            lambda: session.get(photos_url, timeout=5),
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+Compare JSON codecs on :term:`Placeholder API` bodies.
+
+Run with: ``python -m benchmarks.json_codec``
+
+Encoding uses ``_serialize_user`` payloads, the baseline is what
+``requests`` does with ``json=``. Decoding uses ``/photos`` payloads,
+the baseline is ``response.json()`` that builds ``response.text`` first.
+"""
+
+import datetime as dt
+import json
+import os
+import time
+from typing import Any, Callable, List, Tuple
+
+import django
+
+from benchmarks.standin import photos
+
+_USERS = 1000
+_SIZES = (10, 1000, 100000)
+_MIN_DURATION = 0.5
+_REPORT = '{0:>24}: {1:>12.0f} {2}/s'
+
+#: Codec name with its `dumps` or `loads`:
+_Candidate = Tuple[str, Callable[[Any], Any]]
+
+
+def _requests_dumps(body: Any) -> bytes:
+    return json.dumps(body).encode('utf8')
+
+
+def _response_json(raw: bytes) -> Any:
+    return json.loads(raw.decode('utf8'))
+
+
+def _per_second(call: Callable[[Any], Any], inputs: List[Any]) -> float:
+    calls_count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < _MIN_DURATION:
+        for single_input in inputs:
+            call(single_input)
+        calls_count += len(inputs)
+    return calls_count / (time.perf_counter() - start)
+
+
+def _payloads() -> List[Any]:
+    from server.apps.identity.intrastructure.services import (  # noqa: WPS433
+        placeholder,
+    )
+    from server.apps.identity.models import User  # noqa: WPS433
+
+    return [
+        placeholder._serialize_user(User(  # noqa: WPS437
+            email='user{0}@example.com'.format(index),
+            first_name='Имя',
+            last_name='Last name {0}'.format(index),
+            date_of_birth=dt.date(1990, 1, 1),
+            address='City',
+            job_title='Developer',
+            phone='+7 900 000-00-00',
+        ))
+        for index in range(_USERS)
+    ]
+
+
+def _encoding(candidates: List[_Candidate]) -> None:
+    payloads = _payloads()
+    print('Encoding users:')
+    for name, dumps in (('requests json=', _requests_dumps), *candidates):
+        print(_REPORT.format(name, _per_second(dumps, payloads), 'users'))
+
+
+def _decoding(candidates: List[_Candidate]) -> None:
+    for size in _SIZES:
+        raw = [json.dumps(photos(size)).encode('utf8')]
+        print('Decoding {0} photos:'.format(size))
+        for name, loads in (('response.json()', _response_json), *candidates):
+            items_per_second = size * _per_second(loads, raw)
+            print(_REPORT.format(name, items_per_second, 'items'))
+
+
+def main() -> None:
+    """Run the benchmark."""
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'server.settings')
+    django.setup()
+    from server.common.services import json_codec  # noqa: WPS433
+
+    codecs = [json_codec.STDLIB]
+    if json_codec.ORJSON is None:
+        print('orjson is not installed, only stdlib is measured')
+    else:
+        codecs.append(json_codec.ORJSON)
+
+    _encoding([(codec.name, codec.dumps) for codec in codecs])
+    _decoding([(codec.name, codec.loads) for codec in codecs])
+
+
+if __name__ == '__main__':
+    main()
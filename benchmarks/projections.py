@@ -0,0 +1,113 @@
+"""
+Compare model instances and projection rows for favourites listings.
+
+Run with: ``python -m benchmarks.projections``
+
+Both load the same newest-first pictures of a single user
+from a temporary test database, model instances are the baseline.
+Memory is what the loaded list keeps alive, divided by its length.
+"""
+
+import contextlib
+import os
+import time
+import tracemalloc
+from typing import Callable, Iterator, List
+
+import django
+
+_SIZES = (100, 10000, 50000)
+_MIN_DURATION = 0.5
+_REPORT = '{0:>8}: {1:>10.0f} rows/s, {2:>6.0f} bytes/row'
+
+#: Loads the first `size` pictures of a user:
+_Loader = Callable[[int, int], List[object]]
+
+
+def _rows_per_second(load: _Loader, user_id: int, size: int) -> float:
+    rows_count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < _MIN_DURATION:
+        rows_count += len(load(user_id, size))
+    return rows_count / (time.perf_counter() - start)
+
+
+def _bytes_per_row(load: _Loader, user_id: int, size: int) -> float:
+    tracemalloc.start()
+    loaded = load(user_id, size)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retained / len(loaded)
+
+
+def _load_models(user_id: int, size: int) -> List[object]:
+    from server.apps.pictures.logic.repo.queries import (  # noqa: WPS433
+        favourite_pictures,
+    )
+
+    return list(favourite_pictures.by_user(user_id)[:size])
+
+
+def _load_rows(user_id: int, size: int) -> List[object]:
+    from server.apps.pictures.logic.repo.queries import (  # noqa: WPS433
+        favourite_pictures,
+    )
+
+    return list(favourite_pictures.recent_by_user(
+        user_id, before=None, limit=size,
+    ))
+
+
+def _fill(size: int) -> int:
+    from server.apps.identity.models import User  # noqa: WPS433
+    from server.apps.pictures.models import FavouritePicture  # noqa: WPS433
+
+    user = User.objects.create(email='projections@example.com')
+    FavouritePicture.objects.bulk_create(
+        [
+            FavouritePicture(
+                user=user,
+                foreign_id=foreign_id,
+                url='https://via.placeholder.com/600/{0}'.format(foreign_id),
+                thumbnail_url='https://via.placeholder.com/150/{0}'.format(
+                    foreign_id,
+                ),
+            )
+            for foreign_id in range(size)
+        ],
+        batch_size=1000,
+    )
+    return user.id
+
+
+@contextlib.contextmanager
+def _test_database() -> Iterator[None]:
+    from django.db import connection  # noqa: WPS433
+
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'server.settings')
+    django.setup()
+
+    with _test_database():
+        user_id = _fill(max(_SIZES))
+        for size in _SIZES:
+            print('Loading {0} pictures:'.format(size))
+            for name, load in (('models', _load_models), ('rows', _load_rows)):
+                print(_REPORT.format(
+                    name,
+                    _rows_per_second(load, user_id, size),
+                    _bytes_per_row(load, user_id, size),
+                ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Compare strict and trusted decoding of :term:`Placeholder API` payloads.
+
+Run with: ``python -m benchmarks.pydantic_decoding``
+
+Both modes decode the same already parsed JSON,
+so only the cost of building models is measured.
+"""
+
+import time
+from typing import Any, Callable, List
+
+from benchmarks.standin import photos
+from server.apps.pictures.intrastructure.services.placeholder import (
+    PictureResponse,
+)
+from server.common import pydantic_model
+
+_SIZES = (10, 1000, 100000)
+_MIN_DURATION = 0.5
+_REPORT = '{0:>7} items: strict {1:>9.0f}/s, trusted {2:>9.0f}/s, x{3:.1f}'
+
+
+def _items_per_second(
+    decode: Callable[[Any], PictureResponse],
+    payload: List[Any],
+) -> float:
+    decoded_count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < _MIN_DURATION:
+        for raw_item in payload:
+            decode(raw_item)
+        decoded_count += len(payload)
+    return decoded_count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    for size in _SIZES:
+        payload = photos(size)
+        strict, trusted = (
+            _items_per_second(
+                pydantic_model.decoder(PictureResponse, trusted=mode),
+                payload,
+            )
+            for mode in (False, True)
+        )
+        print(_REPORT.format(size, strict, trusted, trusted / strict))
+
+
+if __name__ == '__main__':
+    main()
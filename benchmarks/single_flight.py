@@ -0,0 +1,74 @@
+"""
+Count upstream calls made by concurrent identical requests.
+
+Run with: ``python -m benchmarks.single_flight``
+
+Simulates a cache expiry under load: many threads miss at the same time
+and call the same slow endpoint.
+"""
+
+import threading
+import time
+from functools import partial
+from typing import Callable, TypeVar
+
+import requests
+from django.core.cache.backends.locmem import LocMemCache
+
+from benchmarks.standin import photos, standin_server
+from server.common.services.single_flight import SingleFlight
+
+_ValueT = TypeVar('_ValueT')
+
+_CONCURRENCY = 50
+_LATENCY = 0.2
+
+
+def _direct(fetch: Callable[[], _ValueT]) -> _ValueT:
+    return fetch()
+
+
+def _coalesced(fetch: Callable[[], _ValueT]) -> _ValueT:
+    return SingleFlight(cache=LocMemCache('benchmark', {}), timeout=5)(
+        'photos', fetch,
+    )
+
+
+def _worker(barrier: threading.Barrier, call: Callable[[], object]) -> None:
+    barrier.wait()
+    call()
+
+
+def _run_concurrently(call: Callable[[], object]) -> float:
+    barrier = threading.Barrier(_CONCURRENCY)
+    threads = [
+        threading.Thread(target=_worker, args=(barrier, call))
+        for _ in range(_CONCURRENCY)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for running in threads:
+        running.join()
+    return time.perf_counter() - start
+
+
+def _measure(name: str, strategy: Callable[[Callable[[], object]], object]):
+    with standin_server(photos(10), delay=_LATENCY) as standin:
+        fetch = partial(
+            requests.get, '{0}photos'.format(standin.url), timeout=5,
+        )
+        elapsed = _run_concurrently(partial(strategy, fetch))
+        print('{0:>14}: {1} callers, {2} upstream calls, {3:.2f}s'.format(
+            name, _CONCURRENCY, standin.hits, elapsed,
+        ))
+
+
+def main() -> None:
+    """Run the benchmark."""
+    _measure('direct', _direct)
+    _measure('single-flight', _coalesced)
+
+
+if __name__ == '__main__':
+    main()
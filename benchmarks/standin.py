@@ -0,0 +1,112 @@
+import contextlib
+import json
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator, List, Mapping, Union, final
+
+_Payload = Union[List[object], Mapping[str, object], bytes]
+
+#: Photos are grouped in albums of this size upstream:
+_ALBUM_SIZE = 50
+
+
+@final
+class StandIn(object):
+    """Running local stand-in for :term:`Placeholder API`."""
+
+    def __init__(self, url: str) -> None:
+        """Server is already listening on `url`."""
+        self.url = url
+        self.hits = 0
+        self._lock = threading.Lock()
+
+    def record_hit(self) -> None:
+        """Count a single request served."""
+        with self._lock:
+            self.hits += 1
+
+
+def photos(count: int) -> List[object]:
+    """Payload in the same shape as `/photos` returns."""
+    return [
+        {
+            'albumId': index // _ALBUM_SIZE + 1,
+            'id': index,
+            'title': 'picture number {0}'.format(index),
+            'url': 'https://via.placeholder.com/600/{0:06x}'.format(index),
+            'thumbnailUrl': 'https://via.placeholder.com/150/{0:06x}'.format(
+                index,
+            ),
+        }
+        for index in range(1, count + 1)
+    ]
+
+
+@contextlib.contextmanager
+def standin_server(
+    payload: _Payload,
+    *,
+    delay: float = 0,
+    content_type: str = 'application/json',
+) -> Iterator[StandIn]:
+    """
+    Run a local keep-alive HTTP server that always returns `payload`.
+
+    Every response is delayed by `delay` seconds to simulate latency.
+    Raw bytes are returned as is, other payloads are encoded as JSON.
+    """
+    body = payload if isinstance(payload, bytes) else json.dumps(
+        payload,
+    ).encode('utf8')
+    handler_type = type('Handler', (_Handler,), {
+        'body': body,
+        'delay': delay,
+        'content_type': content_type,
+    })
+    server = _Server(('127.0.0.1', 0), handler_type)
+    standin = StandIn('http://127.0.0.1:{0}/'.format(server.server_port))
+    handler_type.standin = standin  # type: ignore[attr-defined]
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield standin
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class _Handler(BaseHTTPRequestHandler):  # noqa: WPS110
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    standin: StandIn
+    body: bytes
+    delay: float
+    content_type: str
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._respond()
+
+    def do_POST(self) -> None:  # noqa: N802
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self._respond()
+
+    def log_message(self, *args: object) -> None:
+        """Keep benchmark output clean."""
+
+    def _respond(self) -> None:
+        self.standin.record_hit()
+        time.sleep(self.delay)
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', self.content_type)
+        self.send_header('Content-Length', str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
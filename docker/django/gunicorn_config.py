@@ -15,3 +15,12 @@ max_requests_jitter = 400
 log_file = '-'
 chdir = '/code'
 worker_tmp_dir = '/dev/shm'  # noqa: S108
+
+
+def worker_exit(server, worker) -> None:
+    """Wait for background tasks before the worker process exits."""
+    from django.conf import settings  # noqa: WPS433
+
+    from server.common.services import background  # noqa: WPS433
+
+    background.drain(settings)
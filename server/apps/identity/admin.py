@@ -2,7 +2,7 @@ from typing import final
 
 from django.contrib import admin
 
-from server.apps.identity.models import User
+from server.apps.identity.models import LeadOutbox, User
 from server.common.django.admin import TimeReadOnlyMixin
 
 
@@ -17,3 +17,13 @@ class UserAdmin(TimeReadOnlyMixin, admin.ModelAdmin[User]):
         'first_name',
         'last_name',
     )
+
+
+@final
+@admin.register(LeadOutbox)
+class LeadOutboxAdmin(TimeReadOnlyMixin, admin.ModelAdmin[LeadOutbox]):
+    """This class represents `LeadOutbox` in admin panel."""
+
+    list_display = ('id', 'user_id', 'available_at', 'attempts')
+    list_select_related = ('user',)
+    raw_id_fields = ('user',)
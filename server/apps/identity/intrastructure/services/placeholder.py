@@ -1,7 +1,7 @@
+import hashlib
+import json
 from typing import Dict, final
 
-import requests
-
 from server.apps.identity.models import User
 from server.common import pydantic_model
 from server.common.services import http
@@ -14,10 +14,16 @@ class UserResponse(pydantic_model.BaseModel):
     id: int
 
 
-# TODO: use redis-based caching
 @final
 class LeadCreate(http.BaseFetcher):
-    """Service around creating new users and fething their :term:`lead_id`."""
+    """
+    Service around creating new users and fething their :term:`lead_id`.
+
+    Users with an idempotency key send it with every attempt,
+    so it is safe to retry: the API can deduplicate repeated calls.
+    Callers save created :term:`lead_id` right away,
+    so successful calls are never repeated.
+    """
 
     _url_path = '/users'
 
@@ -27,13 +33,18 @@ class LeadCreate(http.BaseFetcher):
         user: User,
     ) -> UserResponse:
         """Create remote user and return assigned ids."""
-        response = requests.post(
+        key = user.lead_idempotency_key
+        response = self._request(
+            'POST',
             self.url_path(),
+            idempotent=key is not None,
+            headers={'Idempotency-Key': str(key)} if key else None,
             json=_serialize_user(user),
-            timeout=self._api_timeout,
         )
-        response.raise_for_status()
-        return UserResponse.parse_raw(response.text)
+        decode = pydantic_model.decoder(
+            UserResponse, trusted=self._trusted_decoding,
+        )
+        return decode(self._codec.loads(response.content))
 
 
 @final
@@ -47,13 +58,24 @@ class LeadUpdate(http.BaseFetcher):
         *,
         user: User,
     ) -> None:
-        """Update remote user."""
-        response = requests.patch(
+        """Update remote user, it is safe to retry: we send the full state."""
+        self._request(
+            'PATCH',
             self.url_path().format(user.lead_id),
+            idempotent=True,
             json=_serialize_user(user),
-            timeout=self._api_timeout,
         )
-        response.raise_for_status()
+
+
+def fingerprint(user: User) -> str:
+    """
+    Fingerprint of the user state that we sync to the lead.
+
+    Users with the same fingerprint have nothing new to send.
+    """
+    return hashlib.sha256(
+        json.dumps(_serialize_user(user), sort_keys=True).encode('utf8'),
+    ).hexdigest()
 
 
 def _serialize_user(user: User) -> Dict[str, str]:
@@ -0,0 +1,80 @@
+import datetime as dt
+import operator
+from functools import reduce
+from typing import List, Sequence
+
+from django.db import models, transaction
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from server.apps.identity.models import LeadOutbox, LeadOutboxKind, User
+
+
+def claim(limit: int, lease: dt.timedelta) -> List[LeadOutbox]:
+    """
+    Claim available :class:`LeadOutbox` rows together with their users.
+
+    Rows locked by other dispatchers are skipped.
+    Claimed rows are hidden from others for ``lease``,
+    they become available again if we crash before processing them.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        claimed = list(
+            LeadOutbox.objects.select_for_update(
+                skip_locked=True,
+                of=('self',),
+            ).filter(
+                available_at__lte=now,
+            ).select_related(
+                'user',
+            ).order_by(
+                'available_at',
+            )[:limit],
+        )
+        LeadOutbox.objects.filter(
+            id__in=[row.id for row in claimed],
+        ).update(available_at=now + lease)
+    return claimed
+
+
+def merge_update(user: User, available_at: dt.datetime) -> None:
+    """
+    Schedule a single update of the user's lead, merged with pending ones.
+
+    Merging postpones the pending update to ``available_at``
+    and bumps its version, so the in-flight one is not deleted after it.
+    Claimed rows are never made available before their lease ends,
+    so there is at most one in-flight update per user.
+    """
+    merged = LeadOutbox.objects.filter(
+        user=user,
+        kind=LeadOutboxKind.UPDATE,
+    ).update(
+        available_at=Greatest(
+            models.F('available_at'),
+            models.Value(available_at),
+        ),
+        version=models.F('version') + 1,
+        updated_at=timezone.now(),
+    )
+    if not merged:
+        LeadOutbox.objects.get_or_create(
+            user=user,
+            kind=LeadOutboxKind.UPDATE,
+            defaults={'available_at': available_at},
+        )
+
+
+def delete_processed(processed: Sequence[LeadOutbox]) -> None:
+    """
+    Delete processed :class:`LeadOutbox` rows.
+
+    Rows merged with newer updates while we were processing them
+    have a new version, they are kept to be processed once again.
+    """
+    if not processed:
+        return
+    LeadOutbox.objects.filter(reduce(operator.or_, (
+        models.Q(id=row.id, version=row.version) for row in processed
+    ))).delete()
@@ -0,0 +1,66 @@
+import uuid
+from typing import List, Sequence
+
+from server.apps.identity.models import LeadOutboxKind, User
+
+
+def without_lead(after_id: int, limit: int) -> List[User]:
+    """
+    Page of users without :term:`lead_id`, ordered by their ids.
+
+    Users waiting in the :term:`outbox` are skipped,
+    their leads are created by the dispatcher.
+    """
+    return list(
+        User.objects.filter(
+            lead_id__isnull=True,
+            id__gt=after_id,
+        ).exclude(
+            lead_outbox__kind=LeadOutboxKind.CREATE,
+        ).order_by('id')[:limit],
+    )
+
+
+def with_lead(after_id: int, limit: int) -> List[User]:
+    """Page of users with :term:`lead_id`, ordered by their ids."""
+    return list(
+        User.objects.filter(
+            lead_id__isnull=False,
+            id__gt=after_id,
+        ).order_by('id')[:limit],
+    )
+
+
+def assign_idempotency_keys(users: Sequence[User]) -> None:
+    """Save new idempotency keys for users that do not have them yet."""
+    missing = [user for user in users if user.lead_idempotency_key is None]
+    for user in missing:
+        user.lead_idempotency_key = uuid.uuid4()
+    User.objects.bulk_update(missing, fields=['lead_idempotency_key'])
+
+
+def save_created_lead(user: User) -> None:
+    """
+    Save :term:`lead_id` created with the user's idempotency key.
+
+    It is called right after the lead is created, in its own transaction,
+    so the created lead is never lost and never created again.
+    """
+    User.objects.filter(
+        id=user.id,
+        lead_id__isnull=True,
+        lead_idempotency_key=user.lead_idempotency_key,
+    ).update(
+        lead_id=user.lead_id,
+        lead_fingerprint=user.lead_fingerprint,
+    )
+
+
+def save_created_leads(users: Sequence[User]) -> None:
+    """
+    Save :term:`lead_id` of many users with a single query.
+
+    Leads are created with idempotency keys, so when it is never run,
+    the next attempt gets the very same leads back.
+    """
+    User.objects.bulk_update(users, fields=['lead_id', 'lead_fingerprint'])
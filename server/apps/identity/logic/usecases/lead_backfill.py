@@ -0,0 +1,114 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Iterable, Iterator, List, Optional, final
+
+import attr
+import structlog
+
+from server.apps.identity.intrastructure.services import placeholder
+from server.apps.identity.logic.repo.queries import users
+from server.apps.identity.models import User
+from server.common.django.types import Settings
+from server.common.services import rate_limit
+
+logger = structlog.get_logger(__name__)
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class BackfillProgress(object):
+    """
+    Outcome of backfilled chunks of users.
+
+    All users up to ``last_id`` are done, so it is safe to resume after it.
+    It never moves past the first failed user, so they are retried.
+    """
+
+    last_id: int
+    created: int = 0
+    failed: int = 0
+
+    def __add__(self, other: 'BackfillProgress') -> 'BackfillProgress':
+        """Sum progress of several chunks."""
+        return BackfillProgress(
+            last_id=self.last_id if self.failed else other.last_id,
+            created=self.created + other.created,
+            failed=self.failed + other.failed,
+        )
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class LeadBackfill(object):
+    """
+    Create leads for all users without :term:`lead_id`.
+
+    Users are processed in chunks ordered by their ids,
+    so the backfill can be resumed after any chunk by its ``last_id``.
+    API calls are made concurrently, but under the given ``rate``.
+    Created leads are saved with one query per chunk.
+    Failed users are skipped, the next backfill will try them again.
+    """
+
+    _settings: Settings
+
+    def __call__(
+        self,
+        *,
+        after_id: int,
+        chunk_size: int,
+        concurrency: int,
+        rate: Optional[float],
+    ) -> Iterator[BackfillProgress]:
+        """Backfill users one chunk at a time, yield progress for each."""
+        create = partial(
+            _create_lead,
+            placeholder.LeadCreate.from_settings(self._settings),
+            rate_limit.Pacer(rate) if rate else None,
+        )
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            while True:  # noqa: WPS457
+                chunk = users.without_lead(after_id, chunk_size)
+                if not chunk:
+                    return
+                users.assign_idempotency_keys(chunk)
+                yield _save(after_id, chunk, executor.map(create, chunk))
+                after_id = chunk[-1].id
+
+
+def _save(
+    after_id: int,
+    chunk: List[User],
+    lead_ids: Iterable[Optional[int]],
+) -> BackfillProgress:
+    created = []
+    last_id = chunk[-1].id
+    previous_id = after_id
+    for user, lead_id in zip(chunk, lead_ids):
+        if lead_id is None:  # we resume right before the first failure
+            last_id = min(last_id, previous_id)
+        else:
+            user.lead_id = lead_id
+            user.lead_fingerprint = placeholder.fingerprint(user)
+            created.append(user)
+        previous_id = user.id
+    users.save_created_leads(created)
+    return BackfillProgress(
+        last_id=last_id,
+        created=len(created),
+        failed=len(chunk) - len(created),
+    )
+
+
+def _create_lead(
+    create: placeholder.LeadCreate,
+    pacer: Optional[rate_limit.Pacer],
+    user: User,
+) -> Optional[int]:
+    if pacer is not None:
+        pacer.wait()
+    try:
+        return create(user=user).id
+    except Exception:
+        logger.warning('lead_backfill_failed', user_id=user.id, exc_info=True)
+        return None
@@ -0,0 +1,157 @@
+import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Iterable, List, Optional, final
+
+import attr
+import structlog
+from django.db import transaction
+from django.utils import timezone
+
+from server.apps.identity.intrastructure.services import placeholder
+from server.apps.identity.logic.repo.queries import lead_outbox, users
+from server.apps.identity.models import LeadOutbox, LeadOutboxKind, User
+from server.common.django.types import Settings
+
+#: Claimed rows are hidden from other dispatchers for this long:
+_LEASE = dt.timedelta(minutes=5)
+
+#: Failed rows are retried with exponential backoff up to this delay:
+_MAX_RETRY_DELAY = dt.timedelta(hours=1)
+
+logger = structlog.get_logger(__name__)
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class DispatchResult(object):
+    """How many :class:`LeadOutbox` rows were processed by a single batch."""
+
+    sent: int = 0
+    failed: int = 0
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class LeadOutboxDispatch(object):
+    """
+    Create and update pending users in :term:`Placeholder API`.
+
+    Claims a batch of :class:`LeadOutbox` rows, calls the API
+    with limited concurrency, and saves new :term:`lead_id` back.
+    Failed rows are retried later with exponential backoff.
+    Updates that have nothing new to send are skipped,
+    we compare fingerprints of the synced and the current user state.
+
+    Several dispatchers can run at once, they never claim the same rows.
+    """
+
+    _settings: Settings
+
+    def __call__(self, *, batch_size: int, concurrency: int) -> DispatchResult:
+        """Process a single batch of pending rows."""
+        claimed = lead_outbox.claim(batch_size, lease=_LEASE)
+        if not claimed:
+            return DispatchResult()
+        # Keys are saved before the first attempt, so retries reuse them:
+        users.assign_idempotency_keys([
+            row.user for row in claimed if row.kind == LeadOutboxKind.CREATE
+        ])
+
+        send = partial(
+            _send,
+            placeholder.LeadCreate.from_settings(self._settings),
+            placeholder.LeadUpdate.from_settings(self._settings),
+        )
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            errors = _save_created_leads(
+                claimed,
+                executor.map(send, claimed),
+            )
+        return self._save(claimed, errors)
+
+    def _save(
+        self,
+        claimed: List[LeadOutbox],
+        errors: List[Optional[Exception]],
+    ) -> DispatchResult:
+        sent: List[LeadOutbox] = []
+        failed: List[LeadOutbox] = []
+        for row, error in zip(claimed, errors):
+            if error is None:
+                sent.append(row)
+            else:
+                _schedule_retry(row, error)
+                failed.append(row)
+
+        with transaction.atomic():
+            User.objects.bulk_update(
+                [sent_row.user for sent_row in sent],
+                fields=['lead_id', 'lead_fingerprint'],
+            )
+            lead_outbox.delete_processed(sent)
+            LeadOutbox.objects.bulk_update(
+                failed,
+                fields=['available_at', 'attempts', 'last_error', 'updated_at'],
+            )
+        return DispatchResult(sent=len(sent), failed=len(failed))
+
+
+def _save_created_leads(
+    claimed: List[LeadOutbox],
+    errors: Iterable[Optional[Exception]],
+) -> List[Optional[Exception]]:
+    sent_errors = []
+    # We don't wait for the whole batch to save new leads:
+    for row, error in zip(claimed, errors):
+        if error is None and row.kind == LeadOutboxKind.CREATE:
+            users.save_created_lead(row.user)
+        sent_errors.append(error)
+    return sent_errors
+
+
+def _send(
+    create: placeholder.LeadCreate,
+    update: placeholder.LeadUpdate,
+    row: LeadOutbox,
+) -> Optional[Exception]:
+    try:
+        _sync_lead(create, update, row)
+    except Exception as exc:
+        logger.warning(
+            'lead_sync_failed',
+            user_id=row.user_id,
+            kind=row.kind,
+            exc_info=True,
+        )
+        return exc
+    return None
+
+
+def _sync_lead(
+    create: placeholder.LeadCreate,
+    update: placeholder.LeadUpdate,
+    row: LeadOutbox,
+) -> None:
+    # We always send the latest user state, not the one at enqueue time:
+    synced = placeholder.fingerprint(row.user)
+    if row.kind == LeadOutboxKind.CREATE:
+        if row.user.lead_id is None:
+            row.user.lead_id = create(user=row.user).id
+            row.user.lead_fingerprint = synced
+    elif row.user.lead_id is None:
+        raise ValueError('Lead is not created yet, cannot update it')
+    elif row.user.lead_fingerprint != synced:
+        update(user=row.user)
+        row.user.lead_fingerprint = synced
+
+
+def _schedule_retry(row: LeadOutbox, error: Exception) -> None:
+    row.attempts += 1
+    row.last_error = repr(error)
+    # `bulk_update` does not touch `auto_now` fields:
+    row.updated_at = timezone.now()
+    row.available_at = row.updated_at + min(
+        _MAX_RETRY_DELAY,
+        dt.timedelta(seconds=2 ** row.attempts),
+    )
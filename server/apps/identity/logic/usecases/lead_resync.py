@@ -0,0 +1,50 @@
+from typing import Iterable, Iterator, List, final
+
+import attr
+from django.utils import timezone
+
+from server.apps.identity.intrastructure.services import placeholder
+from server.apps.identity.logic.repo.queries import lead_outbox, users
+from server.apps.identity.models import User
+from server.common.django.types import Settings
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class LeadResync(object):
+    """
+    Find users whose leads have drifted from their local state.
+
+    We only compare fingerprints of the synced and the current state,
+    so no API calls are made to find them.
+    Drifted users are scheduled for an update in the :term:`outbox`.
+    """
+
+    _settings: Settings
+
+    def __call__(
+        self,
+        *,
+        chunk_size: int,
+        dry_run: bool = False,
+    ) -> Iterator[List[int]]:
+        """Yield ids of drifted users, one chunk at a time."""
+        after_id = 0
+        while True:  # noqa: WPS457
+            chunk = users.with_lead(after_id, chunk_size)
+            if not chunk:
+                return
+            drifted = [
+                user
+                for user in chunk
+                if placeholder.fingerprint(user) != user.lead_fingerprint
+            ]
+            if not dry_run:
+                _schedule_updates(drifted)
+            yield [user.id for user in drifted]
+            after_id = chunk[-1].id
+
+
+def _schedule_updates(drifted: Iterable[User]) -> None:
+    for user in drifted:
+        lead_outbox.merge_update(user, available_at=timezone.now())
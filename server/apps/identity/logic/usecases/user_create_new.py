@@ -2,8 +2,7 @@ from typing import final
 
 import attr
 
-from server.apps.identity.intrastructure.services import placeholder
-from server.apps.identity.models import User
+from server.apps.identity.models import LeadOutbox, User
 from server.common.django.types import Settings
 
 
@@ -11,12 +10,14 @@ from server.common.django.types import Settings
 @attr.dataclass(slots=True, frozen=True)
 class UserCreateNew(object):
     """
-    Create new user in :term:`Placeholder API`.
+    Schedule creating new user in :term:`Placeholder API`.
 
-    Get their :term:`lead_id` back and save it locally.
+    We only write a :class:`LeadOutbox` row here,
+    their :term:`lead_id` is fetched later by ``dispatch_lead_outbox``.
 
     .. warning:
         This use-case does not handle transactions!
+        Call it in the same transaction that creates the user.
 
     """
 
@@ -29,20 +30,4 @@ class UserCreateNew(object):
         Ideally this docstring must contain a link to the user-story, like:
         https://sobolevn.me/2019/02/engineering-guide-to-user-stories
         """
-        new_ids = self._create_lead(user)
-        return self._update_user_ids(user, new_ids)
-
-    def _create_lead(self, user: User) -> placeholder.UserResponse:
-        return placeholder.LeadCreate(
-            api_url=self._settings.PLACEHOLDER_API_URL,
-            api_timeout=self._settings.PLACEHOLDER_API_TIMEOUT,
-        )(user=user)
-
-    def _update_user_ids(
-        self,
-        user: User,
-        new_ids: placeholder.UserResponse,
-    ) -> None:
-        # This can be moved to some other place once this becomes too complex:
-        user.lead_id = new_ids.id
-        user.save(update_fields=['lead_id'])
+        LeadOutbox.objects.create(user=user)
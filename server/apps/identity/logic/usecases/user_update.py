@@ -1,8 +1,11 @@
+import datetime as dt
 from typing import final
 
 import attr
+from django.utils import timezone
 
 from server.apps.identity.intrastructure.services import placeholder
+from server.apps.identity.logic.repo.queries import lead_outbox
 from server.apps.identity.models import User
 from server.common.django.types import Settings
 
@@ -11,9 +14,13 @@ from server.common.django.types import Settings
 @attr.dataclass(slots=True, frozen=True)
 class UserUpdate(object):
     """
-    Update existing user in :term:`Placeholder API`.
+    Schedule updating existing user in :term:`Placeholder API`.
 
-    Get their :term:`lead_id` back and save it locally.
+    Updates are debounced: edits made within
+    ``PLACEHOLDER_API_LEAD_UPDATE_DEBOUNCE`` seconds are merged
+    into a single call with the latest user state,
+    it is sent later by ``dispatch_lead_outbox``.
+    Edits that change nothing for the remote api are not sent at all.
 
     .. warning:
         This use-case does not handle transactions!
@@ -24,10 +31,11 @@ class UserUpdate(object):
 
     def __call__(self, user: User) -> None:
         """Update existing user in the remote api."""
-        return self._update_lead(user)
-
-    def _update_lead(self, user: User) -> None:
-        return placeholder.LeadUpdate(
-            api_url=self._settings.PLACEHOLDER_API_URL,
-            api_timeout=self._settings.PLACEHOLDER_API_TIMEOUT,
-        )(user=user)
+        if placeholder.fingerprint(user) == user.lead_fingerprint:
+            return  # nothing has changed for the remote api
+        lead_outbox.merge_update(
+            user,
+            available_at=timezone.now() + dt.timedelta(
+                seconds=self._settings.PLACEHOLDER_API_LEAD_UPDATE_DEBOUNCE,
+            ),
+        )
@@ -0,0 +1,98 @@
+import time
+from pathlib import Path
+from typing import Any, Optional, final
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from server.apps.identity.container import container
+from server.apps.identity.logic.usecases.lead_backfill import (
+    BackfillProgress,
+    LeadBackfill,
+)
+
+_DEFAULT_CHUNK_SIZE = 500
+_DEFAULT_CONCURRENCY = 16
+_DEFAULT_RATE = 200.0
+
+
+@final
+class Command(BaseCommand):
+    """Create :term:`Placeholder API` leads for users without them."""
+
+    help = 'Create leads for all users without lead_id, can be resumed'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Chunking, concurrency, rate, and checkpoint options."""
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=_DEFAULT_CHUNK_SIZE,
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=_DEFAULT_CONCURRENCY,
+            help='How many API calls are made at once',
+        )
+        parser.add_argument(
+            '--rate',
+            type=float,
+            default=_DEFAULT_RATE,
+            help='Max API calls per second, 0 means no limit',
+        )
+        parser.add_argument(
+            '--checkpoint',
+            type=Path,
+            help='File with the last processed user id, to resume from',
+        )
+        parser.add_argument(
+            '--after-id',
+            type=int,
+            help='Start after this user id, overrides the checkpoint',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: WPS110
+        """Run the backfill and report progress and throughput."""
+        after_id = _start_after(options['after_id'], options['checkpoint'])
+        chunks = container.instantiate(LeadBackfill)(
+            after_id=after_id,
+            chunk_size=options['chunk_size'],
+            concurrency=options['concurrency'],
+            rate=options['rate'],
+        )
+
+        total = BackfillProgress(last_id=after_id)
+        start = time.monotonic()
+        for chunk in chunks:
+            total += chunk
+            _write_checkpoint(options['checkpoint'], total.last_id)
+            self.stdout.write(_format(total, time.monotonic() - start))
+        self.stdout.write(self.style.SUCCESS('Done: {0}'.format(
+            _format(total, time.monotonic() - start),
+        )))
+
+
+def _format(progress: BackfillProgress, elapsed: float) -> str:
+    return 'last_id={0} created={1} failed={2} {3:.1f} users/s'.format(
+        progress.last_id,
+        progress.created,
+        progress.failed,
+        (progress.created + progress.failed) / elapsed,
+    )
+
+
+def _start_after(after_id: Optional[int], checkpoint: Optional[Path]) -> int:
+    if after_id is not None:
+        return after_id
+    if checkpoint is None or not checkpoint.exists():
+        return 0
+    return int(checkpoint.read_text())
+
+
+def _write_checkpoint(checkpoint: Optional[Path], last_id: int) -> None:
+    if checkpoint is None:
+        return
+    # Replacing is atomic, so we never leave a half-written checkpoint:
+    temporary = checkpoint.with_suffix('.tmp')
+    temporary.write_text(str(last_id))
+    temporary.replace(checkpoint)
@@ -0,0 +1,63 @@
+import time
+from typing import Any, final
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from server.apps.identity.container import container
+from server.apps.identity.logic.usecases.lead_outbox_dispatch import (
+    LeadOutboxDispatch,
+)
+
+_DEFAULT_BATCH_SIZE = 100
+_DEFAULT_CONCURRENCY = 8
+_DEFAULT_POLL_INTERVAL = 1.0
+
+
+@final
+class Command(BaseCommand):
+    """Send pending users from the :term:`outbox` to :term:`Placeholder API`."""
+
+    help = 'Create leads for registered users in the Placeholder API'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Batching, concurrency and polling options."""
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=_DEFAULT_BATCH_SIZE,
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=_DEFAULT_CONCURRENCY,
+            help='How many API calls are made at once',
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=_DEFAULT_POLL_INTERVAL,
+            help='How long to sleep when there is nothing to send',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Exit when there is nothing to send instead of polling',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: WPS110
+        """Dispatch batches until stopped."""
+        dispatch = container.instantiate(LeadOutboxDispatch)
+        while True:  # noqa: WPS457
+            dispatched = dispatch(
+                batch_size=options['batch_size'],
+                concurrency=options['concurrency'],
+            )
+            if dispatched.sent or dispatched.failed:
+                self.stdout.write('sent={0} failed={1}'.format(
+                    dispatched.sent,
+                    dispatched.failed,
+                ))
+            elif options['once']:
+                return
+            else:
+                time.sleep(options['poll_interval'])
@@ -0,0 +1,43 @@
+from typing import Any, final
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from server.apps.identity.container import container
+from server.apps.identity.logic.usecases.lead_resync import LeadResync
+
+_DEFAULT_CHUNK_SIZE = 1000
+
+
+@final
+class Command(BaseCommand):
+    """Schedule updates for users whose leads have drifted."""
+
+    help = 'Find users out of sync with their Placeholder API leads'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Chunking and dry-run options."""
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=_DEFAULT_CHUNK_SIZE,
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report drifted users, do not schedule updates',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: WPS110
+        """Report drifted users by their ids."""
+        chunks = container.instantiate(LeadResync)(
+            chunk_size=options['chunk_size'],
+            dry_run=options['dry_run'],
+        )
+        drifted_count = 0
+        for drifted in chunks:
+            drifted_count += len(drifted)
+            if options['verbosity'] > 1 and drifted:
+                self.stdout.write(' '.join(map(str, drifted)))
+        self.stdout.write(self.style.SUCCESS('Drifted users: {0}'.format(
+            drifted_count,
+        )))
@@ -0,0 +1,53 @@
+# Generated by Django 3.2.25 on 2026-10-17 20:42
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Outbox also keeps merged lead updates."""
+
+    dependencies = [
+        ('identity', '0002_leadoutbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='leadoutbox',
+            name='kind',
+            field=models.CharField(
+                choices=[('create', 'Create'), ('update', 'Update')],
+                default='create',
+                max_length=16,
+            ),
+        ),
+        migrations.AddField(
+            model_name='leadoutbox',
+            name='version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='leadoutbox',
+            name='user',
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=models.CASCADE,
+                related_name='lead_outbox',
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='leadoutbox',
+            constraint=models.UniqueConstraint(
+                fields=('user', 'kind'),
+                name='identity_leadoutbox_user_kind',
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='leadoutbox',
+            constraint=models.CheckConstraint(
+                check=models.Q(('kind__in', ['create', 'update'])),
+                name='identity_leadoutbox_kind_valid',
+            ),
+        ),
+    ]
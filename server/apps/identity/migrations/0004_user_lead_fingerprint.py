@@ -0,0 +1,19 @@
+# Generated by Django 3.2.25 on 2026-10-17 20:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Fingerprint of the last user state synced to the lead."""
+
+    dependencies = [
+        ('identity', '0003_leadoutbox_kind'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='lead_fingerprint',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+    ]
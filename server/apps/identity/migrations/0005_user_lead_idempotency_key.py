@@ -0,0 +1,36 @@
+# Generated by Django 3.2.25 on 2026-10-17 20:49
+
+import uuid
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Idempotency keys for creating leads.
+
+    The field is added without a default first,
+    otherwise all existing users would share the same key.
+    They get their own keys right before their leads are created.
+    """
+
+    dependencies = [
+        ('identity', '0004_user_lead_fingerprint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='lead_idempotency_key',
+            field=models.UUIDField(editable=False, null=True),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='lead_idempotency_key',
+            field=models.UUIDField(
+                default=uuid.uuid4,
+                editable=False,
+                null=True,
+            ),
+        ),
+    ]
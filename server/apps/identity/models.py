@@ -1,3 +1,4 @@
+import uuid
 from typing import TYPE_CHECKING, Final, final
 
 from django.contrib.auth.models import (
@@ -6,11 +7,14 @@ from django.contrib.auth.models import (
     PermissionsMixin,
 )
 from django.db import models
+from django.utils import timezone
 
 from server.common.django.models import TimedMixin
 
 # For now we use a single length for all items, later it can be changed.
 _NAME_LENGTH: Final = 254
+_KIND_LENGTH: Final = 16
+_FINGERPRINT_LENGTH: Final = 64  # sha256 hex digest
 
 
 @final
@@ -68,6 +72,17 @@ class User(AbstractBaseUser, PermissionsMixin, TimedMixin):
 
     # Integration with Placeholder API:
     lead_id = models.IntegerField(null=True, blank=True)
+    # Fingerprint of the last payload synced to the lead:
+    lead_fingerprint = models.CharField(
+        max_length=_FINGERPRINT_LENGTH,
+        blank=True,
+    )
+    # Sent with every attempt to create the lead, so retries are safe:
+    lead_idempotency_key = models.UUIDField(
+        default=uuid.uuid4,
+        null=True,
+        editable=False,
+    )
 
     # Security:
     is_staff = models.BooleanField(default=False)
@@ -90,3 +105,67 @@ class User(AbstractBaseUser, PermissionsMixin, TimedMixin):
         # Raw password that is stored in the instance before it is saved,
         # it is actually `str | None` in runtime, but `str` in most tests.
         _password: str
+
+
+@final
+class LeadOutboxKind(models.TextChoices):
+    """What :class:`LeadOutbox` row asks to do with the lead."""
+
+    CREATE = 'create'  # noqa: WPS115
+    UPDATE = 'update'  # noqa: WPS115
+
+
+@final
+class LeadOutbox(TimedMixin, models.Model):
+    """
+    Pending :term:`Placeholder API` call for a :term:`user`.
+
+    Rows are written in the same transaction as users,
+    and are sent later by ``manage.py dispatch_lead_outbox``,
+    so slow API never holds our transactions open.
+
+    There is at most one row of each kind per user:
+    repeated updates are merged into a single one,
+    and the latest user state is sent.
+    """
+
+    # Linking:
+    user = models.ForeignKey(
+        User,
+        related_name='lead_outbox',
+        on_delete=models.CASCADE,
+        db_index=False,  # unique constraint below starts with `user`
+    )
+    kind = models.CharField(
+        max_length=_KIND_LENGTH,
+        choices=LeadOutboxKind.choices,
+        default=LeadOutboxKind.CREATE,
+    )
+
+    # Delivery:
+    available_at = models.DateTimeField(default=timezone.now, db_index=True)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+
+    # Bumped every time the row is merged with a newer one:
+    version = models.PositiveIntegerField(default=0)
+
+    class Meta(object):
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'kind'],
+                name='identity_leadoutbox_user_kind',
+            ),
+            models.CheckConstraint(
+                check=models.Q(kind__in=LeadOutboxKind.values),
+                name='identity_leadoutbox_kind_valid',
+            ),
+        ]
+
+    def __str__(self) -> str:
+        """Beatuful representation."""
+        return '<LeadOutbox {0} {1} for {2}>'.format(
+            self.id,
+            self.kind,
+            self.user_id,
+        )
@@ -44,7 +44,7 @@ class UserUpdateView(RatelimitMixin, UpdateView[User, UserUpdateForm]):
 
         In this case we need to:
         1. Show success message
-        2. Sync information with :term:`Placeholder API`
+        2. Schedule syncing information with :term:`Placeholder API`
         """
         user_update = container.instantiate(UserUpdate)
 
@@ -2,7 +2,7 @@ from typing import final
 
 from django.contrib import admin
 
-from server.apps.pictures.models import FavouritePicture
+from server.apps.pictures.models import FavouritePicture, PictureCatalog
 from server.common.django.admin import TimeReadOnlyMixin
 
 
@@ -14,6 +14,18 @@ class FavouritePictureAdmin(
 ):
     """This class represents `FavouritePicture` in admin panel."""
 
-    list_display = ('id', 'foreign_id', 'url', 'user_id')
+    list_display = ('id', 'foreign_id', 'thumbnail_url', 'user_id')
     list_select_related = ('user',)
     raw_id_fields = ('user',)
+
+
+@final
+@admin.register(PictureCatalog)
+class PictureCatalogAdmin(
+    TimeReadOnlyMixin,
+    admin.ModelAdmin[PictureCatalog],
+):
+    """This class represents `PictureCatalog` in admin panel."""
+
+    list_display = ('id', 'title', 'url')
+    search_fields = ('title',)
@@ -2,11 +2,16 @@ import punq
 from django.conf import settings
 
 from server.common.django.types import Settings
+from server.common.services import background
 
 container = punq.Container()
 
 # Custom dependencies go here:
-# TODO: add custom deps
+container.register(
+    background.BackgroundExecutor,
+    factory=background.executor,
+    settings=settings,
+)
 
 # Django stuff:
 container.register(Settings, instance=settings)
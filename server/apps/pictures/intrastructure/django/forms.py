@@ -1,27 +1,88 @@
-from typing import Any, final
+from typing import Any, List, final
 
 from django import forms
 
+from server.apps.pictures.logic.repo.queries import favourite_pictures
+from server.apps.pictures.logic.usecases.catalog_list import CatalogItem
 from server.apps.pictures.models import FavouritePicture
 
 
 @final
 class FavouritesForm(forms.ModelForm[FavouritePicture]):
-    """Model form for :class:`FavouritePicture`."""
+    """
+    Model form for :class:`FavouritePicture`.
+
+    Like in :class:`FavouritesBulkForm`, only pictures shown
+    on the :term:`dashboard` can be added, with urls from the catalog.
+    """
 
     class Meta(object):
         model = FavouritePicture
-        fields = ('foreign_id', 'url')
+        fields = ('foreign_id',)
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
-        """We need an extra context: which user is adding items."""
+        """We need the user and the pictures they could add."""
         self._user = kwargs.pop('user')
+        self._pictures = {
+            picture.id: picture
+            for picture in kwargs.pop('pictures')
+        }
         super().__init__(*args, **kwargs)
 
+    def clean_foreign_id(self) -> int:
+        """Only pictures from the catalog can be added."""
+        foreign_id = self.cleaned_data['foreign_id']
+        if foreign_id not in self._pictures:
+            raise forms.ValidationError('Unknown picture')
+        return foreign_id
+
     def save(self, commit: bool = True) -> FavouritePicture:
-        """Add user to the model instance."""
+        """Add user and urls to the instance, pictures are only added once."""
         instance = super().save(commit=False)
+        picture = self._pictures[instance.foreign_id]
         instance.user_id = self._user.id
+        instance.url = picture.url
+        instance.thumbnail_url = picture.thumbnail_url
         if commit:
-            instance.save()
+            instance = favourite_pictures.add(instance)
         return instance
+
+
+@final
+class FavouritesBulkForm(forms.Form):
+    """
+    Several :term:`pictures` selected to be saved in :term:`favourites`.
+
+    Only pictures shown on the :term:`dashboard` can be selected,
+    so we take their urls from the catalog, not from the request.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """We need the user and the pictures they could select."""
+        self._user = kwargs.pop('user')
+        self._pictures = {
+            picture.id: picture
+            for picture in kwargs.pop('pictures')
+        }
+        super().__init__(*args, **kwargs)
+        self.fields['selected'] = forms.TypedMultipleChoiceField(
+            coerce=int,
+            choices=[
+                (picture_id, picture_id) for picture_id in self._pictures
+            ],
+        )
+
+    def save(self) -> List[FavouritePicture]:
+        """Add all selected pictures at once."""
+        return favourite_pictures.add_many(self._user.id, [
+            _favourite(self._pictures[picture_id])
+            for picture_id in self.cleaned_data['selected']
+        ])
+
+
+def _favourite(picture: CatalogItem) -> FavouritePicture:
+    return FavouritePicture(
+        foreign_id=picture.id,
+        url=picture.url,
+        thumbnail_url=picture.thumbnail_url,
+    )
@@ -0,0 +1,79 @@
+import contextlib
+import mimetypes
+from typing import FrozenSet, Iterable, Iterator, final
+from urllib.parse import urlsplit
+
+import attr
+
+from server.common.services import content_store, sessions
+from server.common.services.json_stream import PayloadTooLargeError
+
+#: Size of raw chunks we read from image responses:
+_CHUNK_SIZE = 65536  # 64 KiB
+
+
+class NotAnImageError(ValueError):
+    """Raised when a downloaded file is not an image."""
+
+
+class ImageHostNotAllowedError(ValueError):
+    """Raised when an image is not hosted on one of the allowed hosts."""
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class ImageDownload(object):
+    """
+    Service around downloading third-party images.
+
+    Images are streamed straight into the content store,
+    they are never kept in memory as a whole.
+    Raises :exc:`server.common.services.json_stream.PayloadTooLargeError`
+    for images bigger than ``max_bytes``.
+
+    Only ``allowed_hosts`` are ever requested and redirects are not
+    followed, so we can not be tricked into fetching internal urls.
+    """
+
+    _timeout: float
+    _max_bytes: int
+    _allowed_hosts: FrozenSet[str]
+    _pool_size: int = 10
+
+    def __call__(self, url: str, store: content_store.ContentStore) -> str:
+        """Download image from `url`, return its name in the `store`."""
+        if urlsplit(url).hostname not in self._allowed_hosts:
+            raise ImageHostNotAllowedError(
+                'Images from {0} are not allowed'.format(url),
+            )
+        response = sessions.pooled_session(self._pool_size).get(
+            url, timeout=self._timeout, stream=True, allow_redirects=False,
+        )
+        with contextlib.closing(response):
+            response.raise_for_status()
+            if response.is_redirect:
+                raise NotAnImageError('Got redirect from {0}'.format(url))
+            content_type = response.headers.get('Content-Type', '')
+            content_type = content_type.split(';')[0].strip()
+            if not content_type.startswith('image/'):
+                raise NotAnImageError('Got {0} from {1}'.format(
+                    content_type, url,
+                ))
+            return store.save(
+                _limited(
+                    response.iter_content(chunk_size=_CHUNK_SIZE),
+                    self._max_bytes,
+                ),
+                extension=mimetypes.guess_extension(content_type) or '',
+            )
+
+
+def _limited(chunks: Iterable[bytes], max_bytes: int) -> Iterator[bytes]:
+    bytes_read = 0
+    for chunk in chunks:
+        bytes_read += len(chunk)
+        if bytes_read > max_bytes:
+            raise PayloadTooLargeError(
+                'Image is bigger than {0} bytes'.format(max_bytes),
+            )
+        yield chunk
@@ -1,10 +1,14 @@
-from typing import List, final
+import contextlib
+from typing import Iterator, List, Optional, final
 
 import pydantic
 import requests
 
 from server.common import pydantic_model
-from server.common.services import http
+from server.common.services import conditional, http, json_stream
+
+#: Size of raw chunks we read from streamed responses:
+_STREAM_CHUNK_SIZE = 65536  # 64 KiB
 
 
 @final
@@ -13,12 +17,21 @@ class PictureResponse(pydantic_model.BaseModel):
 
     id: int
     url: str
+    thumbnail_url: str = pydantic.Field(alias='thumbnailUrl')
+    title: str
+
+
+#: First page of pictures with its HTTP cache validators:
+PicturesPage = conditional.Validated[List[PictureResponse]]
 
 
-# TODO: use redis-based caching
 @final
 class PicturesFetch(http.BaseFetcher):
-    """Service around fetching pictures from :term:`Placeholder API`."""
+    """
+    Service around fetching pictures from :term:`Placeholder API`.
+
+    It is not cached on its own, use-cases wrap it with a cache.
+    """
 
     _url_path = '/photos'
 
@@ -27,11 +40,67 @@ class PicturesFetch(http.BaseFetcher):
         *,
         limit: int,
     ) -> List[PictureResponse]:
-        """Create remote user and return assigned ids."""
-        response = requests.get(
+        """Fetch the first page of pictures."""
+        return self.conditional(limit=limit).value
+
+    def conditional(
+        self,
+        *,
+        limit: int,
+        previous: Optional[PicturesPage] = None,
+    ) -> PicturesPage:
+        """
+        Fetch the first page of pictures, unless it is not modified.
+
+        We send validators of the ``previous`` page,
+        it is returned as is when the API responds with ``304``.
+        """
+        response = self._request(
+            'GET',
             self.url_path(),
+            idempotent=True,
             params={'_limit': limit},
-            timeout=self._api_timeout,
+            headers=previous.conditional_headers() if previous else None,
+        )
+        return conditional.validated(response, self._decode_page, previous)
+
+    def stream(
+        self,
+        *,
+        max_bytes: int,
+        max_items: int,
+    ) -> Iterator[PictureResponse]:
+        """
+        Stream all pictures one by one with flat memory usage.
+
+        Raises :exc:`server.common.services.json_stream.PayloadTooLargeError`
+        when the response is bigger than ``max_bytes``
+        or has more than ``max_items`` items.
+        """
+        response = self._request(
+            'GET',
+            self.url_path(),
+            idempotent=True,
+            stream=True,
+        )
+        decode = pydantic_model.decoder(
+            PictureResponse, trusted=self._trusted_decoding,
+        )
+        with contextlib.closing(response):
+            raw_items = json_stream.iter_array(
+                response.iter_content(chunk_size=_STREAM_CHUNK_SIZE),
+                max_bytes=max_bytes,
+                max_items=max_items,
+            )
+            yield from map(decode, raw_items)
+
+    def _decode_page(
+        self,
+        response: requests.Response,
+    ) -> List[PictureResponse]:
+        decode = pydantic_model.decoder(
+            PictureResponse, trusted=self._trusted_decoding,
         )
-        response.raise_for_status()
-        return pydantic.parse_raw_as(List[PictureResponse], response.text)
+        return [
+            decode(raw_item) for raw_item in self._codec.loads(response.content)
+        ]
@@ -1,9 +1,122 @@
-from django.db.models import QuerySet
+import datetime as dt
+from itertools import starmap
+from typing import List, Optional, Sequence, Tuple, final
+
+import attr
+from django.core.files.storage import default_storage
+from django.db import models
 
 from server.apps.pictures.models import FavouritePicture
 
+#: Position in the user's favourites: creation time and id of a picture:
+Key = Tuple[dt.datetime, int]
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class FavouriteRow(object):
+    """
+    Read-only projection of :class:`FavouritePicture` for listings.
+
+    Rows are built straight from ``values_list`` tuples,
+    so they are much smaller and faster to build than model instances.
+    All columns are included in ``favouritepicture_user_recent`` index.
+    """
+
+    id: int  # noqa: WPS125
+    created_at: dt.datetime
+    foreign_id: int
+    url: str
+    thumbnail_url: str
+    local_thumbnail: str
+
+    @property
+    def thumbnail(self) -> str:
+        """Thumbnail to show, the local copy is preferred."""
+        if self.local_thumbnail:
+            return default_storage.url(self.local_thumbnail)
+        return self.thumbnail_url or self.url
+
+
+#: Selected columns, in the order of `FavouriteRow` fields:
+_ROW_FIELDS = tuple(field.name for field in attr.fields(FavouriteRow))
+
+
+def by_user(user_id: int) -> models.QuerySet[FavouritePicture]:
+    """All :class:`FavouritePicture` of a user, newest first."""
+    return FavouritePicture.objects.filter(
+        user_id=user_id,
+    ).order_by('-created_at', '-id')
+
+
+def recent_by_user(
+    user_id: int,
+    *,
+    before: Optional[Key],
+    limit: int,
+) -> List[FavouriteRow]:
+    """
+    Page of user's pictures, newest first, starting right after `before`.
+
+    Pages are seeked with ``favouritepicture_user_recent`` index,
+    so any page costs the same, no matter how deep it is.
+    """
+    pictures = by_user(user_id)
+    if before is not None:
+        created_at, picture_id = before
+        # The first condition is redundant, it bounds the index range scan:
+        pictures = pictures.filter(
+            models.Q(created_at__lte=created_at),
+            models.Q(created_at__lt=created_at) | models.Q(id__lt=picture_id),
+        )
+    return list(
+        starmap(FavouriteRow, pictures.values_list(*_ROW_FIELDS)[:limit]),
+    )
+
+
+def add(picture: FavouritePicture) -> FavouritePicture:
+    """
+    Insert a picture, unless the user already has it in :term:`favourites`.
+
+    It is a single ``INSERT ... ON CONFLICT DO NOTHING``,
+    so it is safe to run concurrently. Returns the stored picture.
+    """
+    FavouritePicture.objects.bulk_create([picture], ignore_conflicts=True)
+    return FavouritePicture.objects.get(
+        user_id=picture.user_id,
+        foreign_id=picture.foreign_id,
+    )
+
+
+def add_many(
+    user_id: int,
+    pictures: Sequence[FavouritePicture],
+) -> List[FavouritePicture]:
+    """
+    Insert many pictures for a user with a single query.
+
+    Pictures the user already has are skipped, like in :func:`add`.
+    Returns all stored pictures, both new and existing ones.
+    """
+    for picture in pictures:
+        picture.user_id = user_id
+    FavouritePicture.objects.bulk_create(pictures, ignore_conflicts=True)
+    return list(
+        FavouritePicture.objects.filter(
+            user_id=user_id,
+            foreign_id__in=[added.foreign_id for added in pictures],
+        ),
+    )
+
 
-def by_user(user_id: int) -> QuerySet[FavouritePicture]:
-    """Search :class:`FavouritePicture` by user id."""
-    # TODO: this should be limited and probably paginated
-    return FavouritePicture.objects.filter(user_id=user_id)
+def without_local_thumbnail(
+    after_id: int,
+    limit: int,
+) -> List[FavouritePicture]:
+    """Page of pictures without a local thumbnail, ordered by their ids."""
+    return list(
+        FavouritePicture.objects.filter(
+            local_thumbnail='',
+            id__gt=after_id,
+        ).order_by('id')[:limit],
+    )
@@ -0,0 +1,36 @@
+from itertools import starmap
+from typing import Dict, Iterable, List, final
+
+import attr
+
+from server.apps.pictures.models import PictureCatalog
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class CatalogRow(object):
+    """Read-only projection of :class:`PictureCatalog` for listings."""
+
+    id: int  # noqa: WPS125
+    url: str
+    thumbnail_url: str
+    title: str
+
+
+#: Selected columns, in the order of `CatalogRow` fields:
+_ROW_FIELDS = tuple(field.name for field in attr.fields(CatalogRow))
+
+
+def first_page(limit: int) -> List[CatalogRow]:
+    """First :class:`PictureCatalog` items, ordered by the primary key."""
+    return list(starmap(
+        CatalogRow,
+        PictureCatalog.objects.order_by('id').values_list(
+            *_ROW_FIELDS,
+        )[:limit],
+    ))
+
+
+def by_ids(ids: Iterable[int]) -> Dict[int, PictureCatalog]:
+    """Map of existing :class:`PictureCatalog` items by their ids."""
+    return PictureCatalog.objects.in_bulk(list(ids))
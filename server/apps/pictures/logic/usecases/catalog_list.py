@@ -0,0 +1,33 @@
+from typing import List, Union, final
+
+import attr
+
+from server.apps.pictures.intrastructure.services import placeholder
+from server.apps.pictures.logic.repo.queries import picture_catalog
+from server.apps.pictures.logic.usecases.pictures_fetch import PicturesFetch
+from server.common.django.types import Settings
+from server.common.services import background
+
+#: Item of the catalog, either a local copy or a remote one:
+CatalogItem = Union[picture_catalog.CatalogRow, placeholder.PictureResponse]
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class CatalogList(object):
+    """
+    List :term:`picture` items from the local catalog.
+
+    Until the catalog is synced with ``manage.py sync_pictures``,
+    we fall back to fetching items from :term:`Placeholder API`.
+    """
+
+    _settings: Settings
+    _executor: background.BackgroundExecutor
+
+    def __call__(self, limit: int = 10) -> List[CatalogItem]:
+        """Return the first page of the catalog."""
+        pictures: List[CatalogItem] = list(picture_catalog.first_page(limit))
+        if pictures:
+            return pictures
+        return list(PicturesFetch(self._settings, self._executor)(limit))
@@ -0,0 +1,110 @@
+import itertools
+from typing import Iterator, List, Tuple, final
+
+import attr
+from django.db import transaction
+from django.utils import timezone
+
+from server.apps.pictures.intrastructure.services import placeholder
+from server.apps.pictures.logic.repo.queries import picture_catalog
+from server.apps.pictures.models import PictureCatalog
+from server.common.django.types import Settings
+
+#: Fields that we copy from the remote API:
+_SYNCED_FIELDS = ('url', 'thumbnail_url', 'title')
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class SyncResult(object):
+    """How many catalog rows were touched by a single sync."""
+
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+
+    def __add__(self, other: 'SyncResult') -> 'SyncResult':
+        """Sum results of several batches."""
+        return SyncResult(
+            created=self.created + other.created,
+            updated=self.updated + other.updated,
+            unchanged=self.unchanged + other.unchanged,
+        )
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class CatalogSync(object):
+    """
+    Sync local :class:`PictureCatalog` with :term:`Placeholder API`.
+
+    Streams all :term:`picture` items and upserts them in batches,
+    so memory usage does not depend on the catalog size.
+    Rows that did not change are not written at all.
+    """
+
+    _settings: Settings
+
+    def __call__(self, batch_size: int) -> Iterator[SyncResult]:
+        """Sync the catalog, yield results for each batch."""
+        pictures = placeholder.PicturesFetch.from_settings(
+            self._settings,
+        ).stream(
+            max_bytes=self._settings.PLACEHOLDER_API_STREAM_MAX_BYTES,
+            max_items=self._settings.PLACEHOLDER_API_STREAM_MAX_ITEMS,
+        )
+        while True:  # noqa: WPS457
+            batch = list(itertools.islice(pictures, batch_size))
+            if not batch:
+                return
+            yield self._upsert(batch)
+
+    def _upsert(self, page: List[placeholder.PictureResponse]) -> SyncResult:
+        existing = picture_catalog.by_ids(picture.id for picture in page)
+        to_create: List[PictureCatalog] = []
+        to_update: List[PictureCatalog] = []
+        for picture in page:
+            row = existing.get(picture.id)
+            if row is None:
+                to_create.append(_new_row(picture))
+            elif _apply_changes(row, picture):
+                to_update.append(row)
+
+        with transaction.atomic():
+            # Another sync might have created some rows in the meantime:
+            PictureCatalog.objects.bulk_create(to_create, ignore_conflicts=True)
+            PictureCatalog.objects.bulk_update(
+                to_update,
+                fields=[*_SYNCED_FIELDS, 'updated_at'],
+            )
+        return SyncResult(
+            created=len(to_create),
+            updated=len(to_update),
+            unchanged=len(page) - len(to_create) - len(to_update),
+        )
+
+
+def _new_row(picture: placeholder.PictureResponse) -> PictureCatalog:
+    return PictureCatalog(
+        id=picture.id,
+        url=picture.url,
+        thumbnail_url=picture.thumbnail_url,
+        title=picture.title,
+    )
+
+
+def _apply_changes(
+    row: PictureCatalog,
+    picture: placeholder.PictureResponse,
+) -> bool:
+    changes: Tuple[Tuple[str, str], ...] = tuple(
+        (field, getattr(picture, field))
+        for field in _SYNCED_FIELDS
+        if getattr(row, field) != getattr(picture, field)
+    )
+    for field, new_value in changes:
+        setattr(row, field, new_value)
+    if changes:
+        # `bulk_update` does not touch `auto_now` fields:
+        row.updated_at = timezone.now()
+    return bool(changes)
@@ -1,21 +1,70 @@
-from typing import final
+import datetime as dt
+from typing import List, Optional, final
 
 import attr
-from django.db.models import QuerySet
 
 # NOTE: this can be a dependency as well
 from server.apps.pictures.logic.repo.queries import favourite_pictures
-from server.apps.pictures.models import FavouritePicture
+
+#: Separates creation time and id of the last picture in cursors:
+_CURSOR_SEPARATOR = '_'
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class FavouritesPage(object):
+    """Single page of :term:`favourites` and a cursor of the next one."""
+
+    pictures: List[favourite_pictures.FavouriteRow]
+    next_cursor: Optional[str] = None
 
 
 @final
 @attr.dataclass(slots=True, frozen=True)
 class FavouritesList(object):
-    """List :term:`favourites` pictures for a given user."""
+    """
+    List :term:`favourites` pictures for a given user.
+
+    Pictures are shown newest first, page by page.
+    Pages are linked with opaque cursors instead of offsets,
+    so they do not shift when new pictures are added.
+    """
+
+    def __call__(
+        self,
+        user_id: int,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ) -> FavouritesPage:
+        """Return the page after `cursor`, or the first one."""
+        # We fetch an extra picture to know whether there is the next page:
+        pictures = favourite_pictures.recent_by_user(
+            user_id,
+            before=_decode_cursor(cursor),
+            limit=limit + 1,
+        )
+        if len(pictures) <= limit:
+            return FavouritesPage(pictures)
+        return FavouritesPage(
+            pictures[:limit],
+            next_cursor=_encode_cursor(pictures[limit - 1]),
+        )
+
+
+def _encode_cursor(picture: favourite_pictures.FavouriteRow) -> str:
+    return '{0}{1}{2}'.format(
+        picture.created_at.isoformat(),
+        _CURSOR_SEPARATOR,
+        picture.id,
+    )
 
-    def __call__(self, user_id: int) -> QuerySet[FavouritePicture]:
-        """Update existing user in the remote api."""
-        return self._list_pictures(user_id)
 
-    def _list_pictures(self, user_id: int) -> QuerySet[FavouritePicture]:
-        return favourite_pictures.by_user(user_id)
+def _decode_cursor(cursor: Optional[str]) -> Optional[favourite_pictures.Key]:
+    if not cursor:
+        return None
+    created_at, _, picture_id = cursor.rpartition(_CURSOR_SEPARATOR)
+    try:
+        return dt.datetime.fromisoformat(created_at), int(picture_id)
+    except ValueError:
+        # Broken cursors just start from the first page:
+        return None
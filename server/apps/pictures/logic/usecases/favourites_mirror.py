@@ -0,0 +1,148 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Iterator, List, Optional, final
+
+import attr
+import requests
+import structlog
+from django.core.files.storage import default_storage
+
+from server.apps.pictures.intrastructure.services import images
+from server.apps.pictures.logic.repo.queries import favourite_pictures
+from server.apps.pictures.models import FavouritePicture
+from server.common.django.types import Settings
+from server.common.services import background, content_store
+
+#: Directory in `MEDIA_ROOT` with mirrored images, same as `upload_to`:
+_MIRROR_PREFIX = 'mirror'
+
+#: Errors that only fail a single picture:
+_MIRROR_ERRORS = (requests.RequestException, ValueError)
+
+logger = structlog.get_logger(__name__)
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class MirrorProgress(object):
+    """Outcome of mirrored chunks of pictures."""
+
+    last_id: int
+    mirrored: int = 0
+    failed: int = 0
+
+    def __add__(self, other: 'MirrorProgress') -> 'MirrorProgress':
+        """Sum progress of several chunks."""
+        return MirrorProgress(
+            last_id=other.last_id,
+            mirrored=self.mirrored + other.mirrored,
+            failed=self.failed + other.failed,
+        )
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class FavouriteMirror(object):
+    """
+    Mirror the thumbnail of a single :term:`favourites` picture.
+
+    Thumbnails are stored in ``MEDIA_ROOT`` by their content hash,
+    so pictures with the same image share a single file.
+    They are downloaded by the background executor,
+    dropped tasks are picked up later by ``manage.py mirror_pictures``.
+    """
+
+    _settings: Settings
+    _executor: background.BackgroundExecutor
+
+    def __call__(self, picture: FavouritePicture) -> None:
+        """Schedule mirroring, it does not block the caller."""
+        self._executor.submit(partial(self._mirror, picture))
+
+    def _mirror(self, picture: FavouritePicture) -> None:
+        local_thumbnail = _mirror(_downloader(self._settings), picture)
+        if local_thumbnail is not None:
+            FavouritePicture.objects.filter(id=picture.id).update(
+                local_thumbnail=local_thumbnail,
+            )
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class FavouritesMirror(object):
+    """
+    Mirror thumbnails of all :term:`favourites` without local copies.
+
+    Pictures are processed in chunks ordered by their ids,
+    images are downloaded concurrently.
+    It can be stopped at any time: mirrored pictures are saved
+    after each chunk, and the next run only picks up the rest.
+    Failed pictures are skipped, the next run will try them again.
+    """
+
+    _settings: Settings
+
+    def __call__(
+        self,
+        *,
+        chunk_size: int,
+        concurrency: int,
+    ) -> Iterator[MirrorProgress]:
+        """Mirror pictures one chunk at a time, yield progress for each."""
+        mirror = partial(_mirror, _downloader(self._settings))
+        after_id = 0
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            while True:  # noqa: WPS457
+                chunk = favourite_pictures.without_local_thumbnail(
+                    after_id, chunk_size,
+                )
+                if not chunk:
+                    return
+                yield _save(chunk, list(executor.map(mirror, chunk)))
+                after_id = chunk[-1].id
+
+
+def _downloader(settings: Settings) -> Callable[[str], str]:
+    return partial(
+        images.ImageDownload(
+            timeout=settings.PLACEHOLDER_IMAGE_MIRROR_TIMEOUT,
+            max_bytes=settings.PLACEHOLDER_IMAGE_MIRROR_MAX_BYTES,
+            allowed_hosts=frozenset(settings.PLACEHOLDER_IMAGE_MIRROR_HOSTS),
+        ),
+        store=content_store.ContentStore(
+            storage=default_storage,
+            prefix=_MIRROR_PREFIX,
+        ),
+    )
+
+
+def _mirror(
+    download: Callable[[str], str],
+    picture: FavouritePicture,
+) -> Optional[str]:
+    try:
+        return download(picture.thumbnail_source)
+    except _MIRROR_ERRORS:
+        logger.warning(
+            'picture_mirror_failed',
+            picture_id=picture.id,
+            exc_info=True,
+        )
+        return None
+
+
+def _save(
+    chunk: List[FavouritePicture],
+    local_thumbnails: List[Optional[str]],
+) -> MirrorProgress:
+    mirrored = []
+    for picture, local_thumbnail in zip(chunk, local_thumbnails):
+        if local_thumbnail is not None:
+            picture.local_thumbnail = local_thumbnail
+            mirrored.append(picture)
+    FavouritePicture.objects.bulk_update(mirrored, fields=['local_thumbnail'])
+    return MirrorProgress(
+        last_id=chunk[-1].id,
+        mirrored=len(mirrored),
+        failed=len(chunk) - len(mirrored),
+    )
@@ -1,24 +1,70 @@
-from typing import List, final
+from functools import partial
+from operator import attrgetter
+from typing import Callable, List, Optional, final
 
 import attr
+from django.core.cache import caches
 
 from server.apps.pictures.intrastructure.services import placeholder
 from server.common.django.types import Settings
+from server.common.services import background, caching, single_flight
 
 
 @final
 @attr.dataclass(slots=True, frozen=True)
 class PicturesFetch(object):
-    """Fetch :term:`picture` items from :term:`Placeholder API`."""
+    """
+    Fetch :term:`picture` items from :term:`Placeholder API`.
+
+    Responses are cached with stale-while-revalidate semantics,
+    see :class:`server.common.services.caching.StaleWhileRevalidate`.
+    Concurrent cache misses for the same request are coalesced
+    into a single upstream call,
+    see :class:`server.common.services.single_flight.SingleFlight`.
+
+    Stale entries are refreshed with conditional requests,
+    unchanged pictures are reused without decoding them again.
+    They run in the background executor, not in the request thread.
+    """
 
     _settings: Settings
+    _executor: background.BackgroundExecutor
 
     def __call__(self, limit: int = 10) -> List[placeholder.PictureResponse]:
         """Update existing user in the remote api."""
         return self._fetch_pictures(limit)
 
     def _fetch_pictures(self, limit: int) -> List[placeholder.PictureResponse]:
-        return placeholder.PicturesFetch(
-            api_url=self._settings.PLACEHOLDER_API_URL,
-            api_timeout=self._settings.PLACEHOLDER_API_TIMEOUT,
-        )(limit=limit)
+        fetcher = placeholder.PicturesFetch.from_settings(self._settings)
+        cache = caches[self._settings.PLACEHOLDER_API_CACHE]
+        cache_key = fetcher.cache_key(limit=limit)
+
+        coalesced = single_flight.SingleFlight(
+            cache=cache,
+            timeout=self._settings.PLACEHOLDER_API_SINGLE_FLIGHT_TIMEOUT,
+        )
+        cached = caching.StaleWhileRevalidate(
+            cache=cache,
+            ttl=self._settings.PLACEHOLDER_API_CACHE_TTL,
+            stale_ttl=self._settings.PLACEHOLDER_API_CACHE_STALE_TTL,
+            executor=self._executor,
+        )
+        return cached.revalidating(
+            cache_key,
+            partial(
+                _coalesced_fetch,
+                coalesced,
+                cache_key,
+                partial(fetcher.conditional, limit=limit),
+            ),
+            not_modified=attrgetter('not_modified'),
+        ).value
+
+
+def _coalesced_fetch(
+    coalesced: single_flight.SingleFlight,
+    cache_key: str,
+    fetch: Callable[..., placeholder.PicturesPage],
+    previous: Optional[placeholder.PicturesPage],
+) -> placeholder.PicturesPage:
+    return coalesced(cache_key, partial(fetch, previous=previous))
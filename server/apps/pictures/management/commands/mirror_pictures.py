@@ -0,0 +1,56 @@
+from typing import Any, final
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from server.apps.pictures.container import container
+from server.apps.pictures.logic.usecases.favourites_mirror import (
+    FavouritesMirror,
+    MirrorProgress,
+)
+
+_DEFAULT_CHUNK_SIZE = 100
+_DEFAULT_CONCURRENCY = 8
+
+
+@final
+class Command(BaseCommand):
+    """Mirror thumbnails of :term:`favourites` into ``MEDIA_ROOT``."""
+
+    help = 'Download favourite thumbnails without local copies, can be resumed'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Chunking and concurrency options."""
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=_DEFAULT_CHUNK_SIZE,
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=_DEFAULT_CONCURRENCY,
+            help='How many images are downloaded at once',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: WPS110
+        """Run the mirroring and report progress."""
+        chunks = container.instantiate(FavouritesMirror)(
+            chunk_size=options['chunk_size'],
+            concurrency=options['concurrency'],
+        )
+
+        total = MirrorProgress(last_id=0)
+        for chunk in chunks:
+            total += chunk
+            self.stdout.write(_format(total))
+        self.stdout.write(self.style.SUCCESS('Done: {0}'.format(
+            _format(total),
+        )))
+
+
+def _format(progress: MirrorProgress) -> str:
+    return 'last_id={0} mirrored={1} failed={2}'.format(
+        progress.last_id,
+        progress.mirrored,
+        progress.failed,
+    )
@@ -0,0 +1,42 @@
+from typing import Any, final
+
+from django.core.cache import caches
+from django.core.management.base import BaseCommand, CommandParser
+
+from server.apps.pictures.container import container
+from server.common.django.types import Settings
+from server.common.services import caching
+
+
+@final
+class Command(BaseCommand):
+    """Show shared counters of the :term:`Placeholder API` cache."""
+
+    help = 'Show hit / miss / stale / 304 counters of the Placeholder API cache'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Optionally reset counters after showing them."""
+        parser.add_argument('--reset', action='store_true')
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: WPS110
+        """Print counters and the hit ratio."""
+        stats = _cache_stats(container.resolve(Settings))
+        counters = stats.snapshot()
+        for name, count in counters.items():
+            self.stdout.write('{0}: {1}'.format(name, count))
+
+        total = counters['hit'] + counters['stale'] + counters['miss']
+        if total:
+            self.stdout.write('hit ratio: {0:.2%}'.format(
+                (counters['hit'] + counters['stale']) / total,
+            ))
+        if options['reset']:
+            stats.reset()
+
+
+def _cache_stats(settings: Settings) -> caching.CacheStats:
+    return caching.StaleWhileRevalidate(
+        cache=caches[settings.PLACEHOLDER_API_CACHE],
+        ttl=settings.PLACEHOLDER_API_CACHE_TTL,
+        stale_ttl=settings.PLACEHOLDER_API_CACHE_STALE_TTL,
+    ).stats
@@ -0,0 +1,46 @@
+from typing import Any, final
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from server.apps.pictures.container import container
+from server.apps.pictures.logic.usecases.catalog_sync import (
+    CatalogSync,
+    SyncResult,
+)
+
+_DEFAULT_BATCH_SIZE = 500
+
+
+@final
+class Command(BaseCommand):
+    """Sync local :term:`picture` catalog with :term:`Placeholder API`."""
+
+    help = 'Page through Placeholder API pictures and upsert them locally'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """How many pictures to fetch and write at once."""
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=_DEFAULT_BATCH_SIZE,
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: WPS110
+        """Run the sync and report progress."""
+        catalog_sync = container.instantiate(CatalogSync)
+
+        total = SyncResult()
+        for batch in catalog_sync(batch_size=options['batch_size']):
+            total += batch
+            self.stdout.write(_format(total))
+        self.stdout.write(self.style.SUCCESS('Done: {0}'.format(
+            _format(total),
+        )))
+
+
+def _format(sync_result: SyncResult) -> str:
+    return 'created={0} updated={1} unchanged={2}'.format(
+        sync_result.created,
+        sync_result.updated,
+        sync_result.unchanged,
+    )
@@ -0,0 +1,28 @@
+# Generated by Django 3.2.25 on 2026-10-17 20:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Local catalog of pictures synced from Placeholder API."""
+
+    dependencies = [
+        ('pictures', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PictureCatalog',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.IntegerField(primary_key=True, serialize=False)),
+                ('url', models.URLField()),
+                ('thumbnail_url', models.URLField()),
+                ('title', models.CharField(max_length=254)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
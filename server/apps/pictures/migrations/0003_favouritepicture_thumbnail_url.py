@@ -0,0 +1,19 @@
+# Generated by Django 3.2.25 on 2026-10-17 21:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Thumbnails of favourite pictures, old favourites have none."""
+
+    dependencies = [
+        ('pictures', '0002_picturecatalog'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='favouritepicture',
+            name='thumbnail_url',
+            field=models.URLField(blank=True),
+        ),
+    ]
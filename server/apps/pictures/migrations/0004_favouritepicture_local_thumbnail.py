@@ -0,0 +1,19 @@
+# Generated by Django 3.2.25 on 2026-10-17 21:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Local copies of favourite thumbnails."""
+
+    dependencies = [
+        ('pictures', '0003_favouritepicture_thumbnail_url'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='favouritepicture',
+            name='local_thumbnail',
+            field=models.FileField(blank=True, upload_to='mirror'),
+        ),
+    ]
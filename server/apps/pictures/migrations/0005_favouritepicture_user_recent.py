@@ -0,0 +1,39 @@
+# Generated by Django 3.2.25 on 2026-10-17 21:11
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Index for keyset pages of favourites, it replaces the user index."""
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('pictures', '0004_favouritepicture_local_thumbnail'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='favouritepicture',
+            index=models.Index(
+                fields=['user', '-created_at', '-id'],
+                include=(
+                    'foreign_id',
+                    'url',
+                    'thumbnail_url',
+                    'local_thumbnail',
+                ),
+                name='favouritepicture_user_recent',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='favouritepicture',
+            name='user',
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=models.CASCADE,
+                related_name='pictures',
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+    ]
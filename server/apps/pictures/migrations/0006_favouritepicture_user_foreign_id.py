@@ -0,0 +1,113 @@
+# Generated by Django 3.2.25 on 2026-10-17 21:13
+
+from django.db import DatabaseError, migrations, models, transaction
+
+#: How many users have their duplicates removed in a single transaction:
+_CHUNK_SIZE = 500
+
+_TABLE = 'pictures_favouritepicture'
+
+#: Columns of the unique index, in the order of constraint fields:
+_COLUMNS = 'user_id, foreign_id'
+
+
+def _delete_duplicates(apps, schema_editor):
+    favourite_picture = apps.get_model('pictures', 'FavouritePicture')
+    after_user_id = 0
+    while True:  # noqa: WPS457
+        user_ids = list(
+            favourite_picture.objects.filter(
+                user_id__gt=after_user_id,
+            ).order_by(
+                'user_id',
+            ).values_list(
+                'user_id', flat=True,
+            ).distinct()[:_CHUNK_SIZE],
+        )
+        if not user_ids:
+            return
+        with transaction.atomic(using=schema_editor.connection.alias):
+            _delete_chunk(favourite_picture, user_ids)
+        after_user_id = user_ids[-1]
+
+
+def _delete_chunk(favourite_picture, user_ids):
+    pictures = favourite_picture.objects.filter(user_id__in=user_ids)
+    # The first saved copy of each picture is kept:
+    originals = pictures.values(
+        'user_id',
+        'foreign_id',
+    ).annotate(
+        original_id=models.Min('id'),
+    ).values('original_id')
+    pictures.exclude(id__in=originals).delete()
+
+
+class _AddUniqueConstraintConcurrently(migrations.AddConstraint):
+    """
+    Build the unique index concurrently, then turn it into a constraint.
+
+    On PostgreSQL inserts are not blocked while the index is built.
+    Duplicates are removed once more right before the build,
+    to catch ones added while the first pass was running.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if not schema_editor.collect_sql:  # `sqlmigrate` has no data
+            _delete_duplicates(from_state.apps, schema_editor)
+        if schema_editor.connection.vendor != 'postgresql':
+            super().database_forwards(
+                app_label, schema_editor, from_state, to_state,
+            )
+            return
+
+        table = schema_editor.quote_name(_TABLE)
+        name = schema_editor.quote_name(self.constraint.name)
+        try:
+            schema_editor.execute(
+                'CREATE UNIQUE INDEX CONCURRENTLY {0} ON {1} ({2})'.format(
+                    name, table, _COLUMNS,
+                ),
+            )
+        except DatabaseError:
+            # Failed concurrent builds leave an invalid index behind,
+            # the whole migration can be safely run again after that:
+            schema_editor.execute(
+                'DROP INDEX CONCURRENTLY IF EXISTS {0}'.format(name),
+            )
+            raise
+        schema_editor.execute(
+            'ALTER TABLE {0} ADD CONSTRAINT {1} UNIQUE USING INDEX {1}'.format(
+                table, name,
+            ),
+        )
+
+
+class Migration(migrations.Migration):
+    """
+    Each user can add a picture to favourites only once.
+
+    Existing duplicates are removed first, a few users at a time,
+    each chunk is committed separately to keep locks short.
+    """
+
+    atomic = False
+
+    dependencies = [
+        ('pictures', '0005_favouritepicture_user_recent'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _delete_duplicates,
+            migrations.RunPython.noop,
+            elidable=True,
+        ),
+        _AddUniqueConstraintConcurrently(
+            model_name='favouritepicture',
+            constraint=models.UniqueConstraint(
+                fields=('user', 'foreign_id'),
+                name='pictures_favouritepicture_user_foreign_id',
+            ),
+        ),
+    ]
@@ -1,10 +1,12 @@
-from typing import final
+from typing import Final, final
 
 from django.conf import settings
 from django.db import models
 
 from server.common.django.models import TimedMixin
 
+_TITLE_LENGTH: Final = 254
+
 
 @final
 class FavouritePicture(TimedMixin, models.Model):
@@ -15,12 +17,75 @@ class FavouritePicture(TimedMixin, models.Model):
         settings.AUTH_USER_MODEL,
         related_name='pictures',
         on_delete=models.CASCADE,
+        # `favouritepicture_user_recent` starts with this column:
+        db_index=False,
     )
 
     # Data:
     foreign_id = models.IntegerField()
     url = models.URLField()
+    thumbnail_url = models.URLField(blank=True)
+
+    # Local copy of the thumbnail, named by its content hash:
+    local_thumbnail = models.FileField(upload_to='mirror', blank=True)
+
+    class Meta(object):
+        constraints = [
+            # Adding the same picture again must not create duplicates:
+            models.UniqueConstraint(
+                fields=['user', 'foreign_id'],
+                name='pictures_favouritepicture_user_foreign_id',
+            ),
+        ]
+        indexes = [
+            # Pages of favourites are read newest first with a keyset,
+            # listed columns are included for index-only scans:
+            models.Index(
+                fields=['user', '-created_at', '-id'],
+                include=[
+                    'foreign_id',
+                    'url',
+                    'thumbnail_url',
+                    'local_thumbnail',
+                ],
+                name='favouritepicture_user_recent',
+            ),
+        ]
 
     def __str__(self) -> str:
         """Beatuful representation."""
         return '<Picture {0} by {1}>'.format(self.foreign_id, self.user_id)
+
+    @property
+    def thumbnail_source(self) -> str:
+        """Remote image we show as a thumbnail, old rows have no thumbnail."""
+        return self.thumbnail_url or self.url
+
+    @property
+    def thumbnail(self) -> str:
+        """Thumbnail to show, the local copy is preferred."""
+        if self.local_thumbnail:
+            return self.local_thumbnail.url
+        return self.thumbnail_source
+
+
+@final
+class PictureCatalog(TimedMixin, models.Model):
+    """
+    Local copy of :term:`picture` items from :term:`Placeholder API`.
+
+    It is filled by ``manage.py sync_pictures``,
+    so the :term:`dashboard` does not depend on the remote API.
+    We reuse remote ids as primary keys.
+    """
+
+    id = models.IntegerField(primary_key=True)  # noqa: WPS125
+
+    # Data:
+    url = models.URLField()
+    thumbnail_url = models.URLField()
+    title = models.CharField(max_length=_TITLE_LENGTH)
+
+    def __str__(self) -> str:
+        """Beatuful representation."""
+        return '<PictureCatalog {0}>'.format(self.id)
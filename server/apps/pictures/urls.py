@@ -1,10 +1,25 @@
 from django.urls import path
 
-from server.apps.pictures.views import DashboardView, FavouritePicturesView
+from server.apps.pictures.views import (
+    DashboardSelectedView,
+    DashboardView,
+    FavouritePicturesView,
+    FavouritesExportView,
+)
 
 app_name = 'pictures'
 
 urlpatterns = [
     path('dashboard', DashboardView.as_view(), name='dashboard'),
+    path(
+        'dashboard/selected',
+        DashboardSelectedView.as_view(),
+        name='dashboard_selected',
+    ),
     path('favourites', FavouritePicturesView.as_view(), name='favourites'),
+    path(
+        'favourites/export',
+        FavouritesExportView.as_view(),
+        name='favourites_export',
+    ),
 ]
@@ -1,18 +1,34 @@
-from typing import Any, Dict, final
+from typing import Any, Dict, List, final
 
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
-from django.db.models import QuerySet
-from django.http import HttpResponse
+from django.http import (
+    Http404,
+    HttpRequest,
+    HttpResponse,
+    HttpResponseRedirect,
+    StreamingHttpResponse,
+)
 from django.urls import reverse_lazy
-from django.views.generic import TemplateView
-from django.views.generic.edit import CreateView
-from django.views.generic.list import ListView
+from django.utils.functional import cached_property
+from django.views.generic import CreateView, FormView, TemplateView, View
 
 from server.apps.pictures.container import container
-from server.apps.pictures.intrastructure.django.forms import FavouritesForm
+from server.apps.pictures.intrastructure.django.forms import (
+    FavouritesBulkForm,
+    FavouritesForm,
+)
+from server.apps.pictures.logic.usecases.catalog_list import (
+    CatalogItem,
+    CatalogList,
+)
+from server.apps.pictures.logic.usecases.favourites_export import (
+    FavouritesExport,
+)
 from server.apps.pictures.logic.usecases.favourites_list import FavouritesList
-from server.apps.pictures.logic.usecases.pictures_fetch import PicturesFetch
+from server.apps.pictures.logic.usecases.favourites_mirror import (
+    FavouriteMirror,
+)
 from server.apps.pictures.models import FavouritePicture
 from server.common.django.decorators import dispatch_decorator
 
@@ -36,6 +52,7 @@ class DashboardView(CreateView[FavouritePicture, FavouritesForm]):
 
     It is a main page of the whole application.
     This is where we show :term:`pictures` to be saved in :term:`favourites`.
+    Pictures are served from the local catalog.
     """
 
     form_class = FavouritesForm
@@ -44,32 +61,124 @@ class DashboardView(CreateView[FavouritePicture, FavouritesForm]):
 
     def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
         """Innject extra context to template rendering."""
-        fetch_puctures = container.instantiate(PicturesFetch)
-
         context = super().get_context_data(**kwargs)
-        context['pictures'] = fetch_puctures()  # sync http call, may hang
+        context['pictures'] = self._pictures
         return context
 
     def get_form_kwargs(self) -> Dict[str, Any]:
-        """Add current user to the context."""
+        """Add current user and the pictures they could add."""
         base_kwargs = super().get_form_kwargs()
         base_kwargs['user'] = self.request.user
+        base_kwargs['pictures'] = self._pictures
         return base_kwargs
 
     def form_valid(self, form: FavouritesForm) -> HttpResponse:
-        """Data is valid: show a message about it."""
+        """Data is valid: show a message and mirror a new thumbnail."""
+        mirror_favourite = container.instantiate(FavouriteMirror)
+
+        picture = form.save()
         messages.success(self.request, 'Добавлено')
+        if not picture.local_thumbnail:
+            mirror_favourite(picture)
+        return HttpResponseRedirect(self.success_url)
+
+    @cached_property
+    def _pictures(self) -> List[CatalogItem]:
+        list_catalog = container.instantiate(CatalogList)
+        return list_catalog()
+
+
+@final
+@dispatch_decorator(login_required)
+class DashboardSelectedView(FormView[FavouritesBulkForm]):
+    """
+    Save :term:`pictures` selected on the :term:`dashboard`.
+
+    All of them are added to :term:`favourites` with a single query.
+    """
+
+    form_class = FavouritesBulkForm
+    http_method_names = ['post']
+    success_url = reverse_lazy('pictures:dashboard')
+
+    def get_form_kwargs(self) -> Dict[str, Any]:
+        """Add current user and the pictures they could select."""
+        list_catalog = container.instantiate(CatalogList)
+
+        base_kwargs = super().get_form_kwargs()
+        base_kwargs['user'] = self.request.user
+        base_kwargs['pictures'] = list_catalog()
+        return base_kwargs
+
+    def form_valid(self, form: FavouritesBulkForm) -> HttpResponse:
+        """Data is valid: show a message and mirror new thumbnails."""
+        mirror_favourite = container.instantiate(FavouriteMirror)
+
+        pictures = form.save()
+        messages.success(self.request, 'Добавлено: {0}'.format(len(pictures)))
+        for picture in pictures:
+            if not picture.local_thumbnail:
+                mirror_favourite(picture)
         return super().form_valid(form)
 
+    def form_invalid(self, form: FavouritesBulkForm) -> HttpResponse:
+        """Nothing is selected: go back to the dashboard."""
+        messages.error(self.request, 'Ничего не выбрано')
+        return HttpResponseRedirect(self.get_success_url())
+
 
 @final
 @dispatch_decorator(login_required)
-class FavouritePicturesView(ListView[FavouritePicture]):
-    """View the :term:`favourites`."""
+class FavouritePicturesView(TemplateView):
+    """View the :term:`favourites`, page by page."""
 
     template_name = 'pictures/pages/favourites.html'
 
-    def get_queryset(self) -> QuerySet[FavouritePicture]:
-        """Return matching pictures."""
+    def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
+        """Innject the requested page of pictures."""
         list_favourites = container.instantiate(FavouritesList)
-        return list_favourites(self.request.user.id)
+
+        assert self.request.user.is_authenticated  # more for mypy  # noqa: S101
+        context = super().get_context_data(**kwargs)
+        context['page'] = list_favourites(
+            self.request.user.id,
+            cursor=self.request.GET.get('after'),
+        )
+        return context
+
+
+@final
+@dispatch_decorator(login_required)
+class FavouritesExportView(View):
+    """
+    Download all :term:`favourites` as ``?format=ndjson`` or ``csv``.
+
+    Staff can export favourites of any user with ``?user_id=<id>``.
+    """
+
+    def get(self, request: HttpRequest) -> StreamingHttpResponse:
+        """Stream the file, it is never fully built in memory."""
+        export_favourites = container.instantiate(FavouritesExport)
+
+        try:
+            exported = export_favourites(
+                self._user_id(request),
+                request.GET.get('format', 'ndjson'),
+            )
+        except (KeyError, ValueError):
+            raise Http404('Unknown export format or user')
+
+        response = StreamingHttpResponse(
+            exported.chunks,
+            content_type=exported.content_type,
+        )
+        response['Content-Disposition'] = 'attachment; filename="{0}"'.format(
+            exported.filename,
+        )
+        return response
+
+    def _user_id(self, request: HttpRequest) -> int:
+        assert request.user.is_authenticated  # more for mypy  # noqa: S101
+        if request.user.is_staff and 'user_id' in request.GET:
+            return int(request.GET['user_id'])
+        return request.user.id
@@ -0,0 +1,48 @@
+from typing import Any, Callable, Dict, cast
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+
+from server.common.django.types import Settings
+from server.common.services import deadline
+
+#: Our settings are defined with `config`, so we need to type them:
+_settings = cast(Settings, settings)
+
+
+class DeadlineMiddleware(object):
+    """
+    Starts the deadline for each request, see `REQUEST_DEADLINE` setting.
+
+    Upstream calls made while serving the request
+    never take longer than the time it has left.
+    """
+
+    def __init__(
+        self,
+        get_response: Callable[[HttpRequest], HttpResponse],
+    ) -> None:
+        """Django's API-compatible constructor."""
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Drop the deadline once the request is served."""
+        response = self.get_response(request)
+        deadline.clear()
+        return response
+
+    def process_view(
+        self,
+        request: HttpRequest,
+        view_func: Callable[..., HttpResponse],
+        view_args: Any,
+        view_kwargs: Dict[str, Any],
+    ) -> None:
+        """Start the deadline with the budget of the resolved view."""
+        budget = _settings.REQUEST_DEADLINE
+        if request.resolver_match is not None:
+            budget = _settings.REQUEST_DEADLINE_VIEWS.get(
+                request.resolver_match.view_name,
+                budget,
+            )
+        deadline.start(budget)
@@ -7,7 +7,7 @@ near each type, so we can easily track them and refactor
 our code when new versions are released.
 """
 
-from typing import Protocol
+from typing import Dict, List, Protocol
 
 
 # TODO: bug in django-stubs with settings
@@ -16,3 +16,31 @@ class Settings(Protocol):
 
     PLACEHOLDER_API_URL: str
     PLACEHOLDER_API_TIMEOUT: int
+    PLACEHOLDER_API_POOL_SIZE: int
+    PLACEHOLDER_API_CONNECT_TIMEOUT: float
+    PLACEHOLDER_API_BREAKER_FAILURES: int
+    PLACEHOLDER_API_BREAKER_COOLDOWN: int
+    PLACEHOLDER_API_BREAKER_SLOW_CALL: float
+    PLACEHOLDER_API_RETRIES: int
+    PLACEHOLDER_API_RETRY_BUDGET: float
+    PLACEHOLDER_API_CACHE: str
+    PLACEHOLDER_API_CACHE_TTL: int
+    PLACEHOLDER_API_CACHE_STALE_TTL: int
+    PLACEHOLDER_API_SINGLE_FLIGHT_TIMEOUT: float
+    PLACEHOLDER_API_STREAM_MAX_BYTES: int
+    PLACEHOLDER_API_STREAM_MAX_ITEMS: int
+    PLACEHOLDER_API_TRUSTED_DECODING: bool
+    PLACEHOLDER_API_ADAPTIVE_TIMEOUT: bool
+    PLACEHOLDER_API_ADAPTIVE_TIMEOUT_PERCENTILE: float
+    PLACEHOLDER_API_MIRROR_URLS: List[str]
+    PLACEHOLDER_API_LEAD_UPDATE_DEBOUNCE: float
+    PLACEHOLDER_API_RATE_LIMITS: Dict[str, float]
+    PLACEHOLDER_API_RATE_LIMIT_MAX_WAIT: float
+    PLACEHOLDER_IMAGE_MIRROR_MAX_BYTES: int
+    PLACEHOLDER_IMAGE_MIRROR_TIMEOUT: float
+    PLACEHOLDER_IMAGE_MIRROR_HOSTS: List[str]
+    REQUEST_DEADLINE: float
+    BACKGROUND_TASKS_WORKERS: int
+    BACKGROUND_TASKS_QUEUE: int
+    BACKGROUND_TASKS_DRAIN_TIMEOUT: float
+    REQUEST_DEADLINE_VIEWS: Dict[str, float]
@@ -1,4 +1,16 @@
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar
+
 import pydantic
+from pydantic.fields import SHAPE_SINGLETON
+
+_ModelT = TypeVar('_ModelT', bound='BaseModel')
+
+#: Field types that we can check without running validators:
+_TRUSTED_TYPES = frozenset((int, float, str))
+
+#: Field name, its alias, and its exact type:
+_TrustedShape = Tuple[Tuple[str, str, type], ...]
 
 
 class BaseModel(pydantic.BaseModel):
@@ -6,3 +18,63 @@ class BaseModel(pydantic.BaseModel):
 
     class Config(object):
         allow_mutation = False
+
+    @classmethod
+    def parse_trusted(cls: Type[_ModelT], raw_data: Any) -> _ModelT:
+        """
+        Fast-path for data from sources that we trust.
+
+        When ``raw_data`` has exactly the expected shape,
+        we build the model without running validators.
+        Otherwise, we fall back to the strict :meth:`parse_obj`.
+        """
+        field_values = _pick_trusted_values(_trusted_shape(cls), raw_data)
+        if field_values is None:
+            return cls.parse_obj(raw_data)
+        return cls.construct(**field_values)
+
+
+def decoder(
+    model: Type[_ModelT],
+    *,
+    trusted: bool,
+) -> Callable[[Any], _ModelT]:
+    """
+    Pick the function to build ``model`` from raw data.
+
+    Trusted decoding skips validators for well-shaped data,
+    see :meth:`BaseModel.parse_trusted`.
+    """
+    return model.parse_trusted if trusted else model.parse_obj
+
+
+def _pick_trusted_values(
+    shape: Optional[_TrustedShape],
+    raw_data: Any,
+) -> Optional[Dict[str, Any]]:
+    if shape is None or not isinstance(raw_data, dict):
+        return None
+
+    field_values = {}
+    for name, alias, field_type in shape:
+        field_value = raw_data.get(alias)
+        if type(field_value) is not field_type:  # noqa: WPS516
+            return None
+        field_values[name] = field_value
+    return field_values
+
+
+@lru_cache(maxsize=None)
+def _trusted_shape(model: Type[BaseModel]) -> Optional[_TrustedShape]:
+    shape = []
+    for name, field in model.__fields__.items():
+        is_trusted = (
+            field.shape == SHAPE_SINGLETON and
+            field.outer_type_ in _TRUSTED_TYPES and
+            not field.class_validators and
+            field.required
+        )
+        if not is_trusted:
+            return None
+        shape.append((name, field.alias, field.outer_type_))
+    return tuple(shape)
@@ -0,0 +1,150 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, Tuple, final
+
+import structlog
+from django.db import DatabaseError, connections
+
+from server.common.django.types import Settings
+
+#: Fire-and-forget task, its result is ignored:
+Task = Callable[[], object]
+
+#: Names of counters we track for each executor:
+_STATS_NAMES: Tuple[str, ...] = (
+    'submitted',
+    'dropped',
+    'completed',
+    'failed',
+)
+
+logger = structlog.get_logger(__name__)
+
+
+@final
+class BackgroundExecutor(object):
+    """
+    Bounded pool for fire-and-forget tasks of the current process.
+
+    - At most ``max_workers`` tasks run at once,
+      at most ``max_queue`` more tasks wait for a free worker
+    - When the queue is full, new tasks are dropped right away and counted,
+      so callers are never blocked and decide what to do with them
+    - Every task gets its own database connection, closed when it ends
+    - :meth:`drain` waits for pending tasks when the worker shuts down
+
+    With ``max_workers=0`` tasks run inline, which is handy in tests.
+    """
+
+    def __init__(self, *, max_workers: int, max_queue: int) -> None:
+        """Threads are only started once tasks are submitted."""
+        self._max_workers = max_workers
+        self._capacity = max_workers + max_queue
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(max_workers, 1),
+            thread_name_prefix='background',
+        )
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending = 0
+        self._closed = False
+        self._stats = dict.fromkeys(_STATS_NAMES, 0)
+
+    def submit(self, task: Task) -> bool:
+        """Run `task` in background, ``False`` means it was dropped."""
+        if not self._max_workers:
+            self._count('submitted')
+            self._call(task)
+            return True
+
+        with self._lock:
+            accepted = not self._closed and self._pending < self._capacity
+            if accepted:
+                self._pending += 1
+            self._stats['submitted' if accepted else 'dropped'] += 1
+
+        if not accepted:
+            logger.warning('background_task_dropped', task=repr(task))
+            return False
+        self._pool.submit(self._run, task)
+        return True
+
+    def drain(self, timeout: float) -> bool:
+        """
+        Stop accepting tasks and wait up to `timeout` for pending ones.
+
+        Returns ``False`` when some tasks were abandoned.
+        """
+        with self._idle:
+            self._closed = True
+            drained = self._idle.wait_for(lambda: not self._pending, timeout)
+            abandoned = self._pending
+        if not drained:
+            logger.warning('background_tasks_abandoned', pending=abandoned)
+        self._pool.shutdown(wait=drained, cancel_futures=True)
+        return drained
+
+    def stats(self) -> Dict[str, int]:
+        """Return current values of all counters and pending tasks."""
+        with self._lock:
+            return {**self._stats, 'pending': self._pending}
+
+    def _run(self, task: Task) -> None:
+        self._call(task)
+        try:
+            # Connections are per thread, so this only closes our own:
+            connections.close_all()
+        except DatabaseError:
+            logger.warning('background_connection_close_failed', exc_info=True)
+        with self._idle:
+            self._pending -= 1
+            self._idle.notify_all()
+
+    def _call(self, task: Task) -> None:
+        try:
+            task()
+        except Exception:
+            self._count('failed')
+            logger.exception('background_task_failed', task=repr(task))
+        else:
+            self._count('completed')
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+
+def executor(settings: Settings) -> BackgroundExecutor:
+    """Executor of the current process, it is created on first use."""
+    return _process_executor(
+        max_workers=settings.BACKGROUND_TASKS_WORKERS,
+        max_queue=settings.BACKGROUND_TASKS_QUEUE,
+    )
+
+
+def drain(settings: Settings) -> None:
+    """
+    Wait for pending tasks of the current process, if there are any.
+
+    Counters of the executor are logged, so dropped tasks are visible.
+    """
+    if not _process_executor.cache_info().currsize:
+        return
+    process_executor = executor(settings)
+    process_executor.drain(settings.BACKGROUND_TASKS_DRAIN_TIMEOUT)
+    logger.info('background_tasks_drained', **process_executor.stats())
+
+
+def reset() -> None:
+    """Forget the executor of the current process, it is used in tests."""
+    _process_executor.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def _process_executor(
+    *,
+    max_workers: int,
+    max_queue: int,
+) -> BackgroundExecutor:
+    return BackgroundExecutor(max_workers=max_workers, max_queue=max_queue)
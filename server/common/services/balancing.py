@@ -0,0 +1,110 @@
+import random
+import threading
+import time
+from typing import Dict, Tuple, final
+from urllib.parse import urlsplit, urlunsplit
+
+import attr
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+@final
+class _Health(object):
+    """Health of a single endpoint as seen by the current process."""
+
+    __slots__ = ('latency', 'failures', 'ejected_until')
+
+    def __init__(self) -> None:
+        # Unknown endpoints look fast, so they are tried soon:
+        self.latency: float = 0
+        self.failures = 0
+        self.ejected_until: float = 0
+
+
+_lock = threading.Lock()
+_health: Dict[str, _Health] = {}
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class EndpointPool(object):
+    """
+    Spreads calls between equivalent API endpoints (mirrors).
+
+    - Each endpoint has a moving average of its latency,
+      failed calls count as ``failure_penalty`` seconds slower
+    - We pick the better one of two random endpoints,
+      so load is spread and slow endpoints get less of it
+    - Endpoints with ``ejection_failures`` consecutive failures
+      are ejected for ``ejection_time`` seconds
+    - ``probe_ratio`` of calls go to a random endpoint,
+      so we notice when a slow one gets better
+
+    Health is tracked in the current process only.
+    """
+
+    _urls: Tuple[str, ...]
+    _decay: float = 0.3
+    _failure_penalty: float = 1
+    _ejection_failures: int = 5
+    _ejection_time: float = 30
+    _probe_ratio: float = 0.05
+
+    def route(self, url: str) -> str:
+        """Send the request for `url` to the best endpoint."""
+        chosen = urlsplit(self._choose())
+        parts = urlsplit(url)
+        return urlunsplit((
+            chosen.scheme,
+            chosen.netloc,
+            parts.path,
+            parts.query,
+            parts.fragment,
+        ))
+
+    def record(self, url: str, *, success: bool, elapsed: float) -> None:
+        """Update health of the endpoint that served `url`."""
+        endpoint = origin(url)
+        sample = elapsed if success else elapsed + self._failure_penalty
+        with _lock:
+            health = _health.setdefault(endpoint, _Health())
+            health.latency += self._decay * (sample - health.latency)
+            health.failures = 0 if success else health.failures + 1
+            if health.failures < self._ejection_failures:
+                return
+            health.failures = 0
+            health.ejected_until = time.monotonic() + self._ejection_time
+        logger.warning('endpoint_ejected', endpoint=endpoint)
+
+    def _choose(self) -> str:
+        health = _snapshot(self._urls)
+        now = time.monotonic()
+        available = [
+            url
+            for url in self._urls
+            if health[url].ejected_until <= now
+        ]
+        if not available:
+            # Everything is ejected, let's try the one to return first:
+            return min(self._urls, key=lambda url: health[url].ejected_until)
+        probing = random.random() < self._probe_ratio  # noqa: S311
+        if probing or len(available) == 1:
+            return random.choice(available)  # noqa: S311
+        pair = random.sample(available, 2)  # noqa: S311
+        return min(pair, key=lambda url: health[url].latency)
+
+
+def _snapshot(urls: Tuple[str, ...]) -> Dict[str, _Health]:
+    with _lock:
+        return {
+            url: _health.setdefault(origin(url), _Health())
+            for url in urls
+        }
+
+
+def origin(url: str) -> str:
+    """Scheme and host of `url`, it identifies the endpoint."""
+    parts = urlsplit(url)
+    return '{0}://{1}'.format(parts.scheme, parts.netloc)
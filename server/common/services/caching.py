@@ -0,0 +1,224 @@
+import threading
+import time
+from functools import partial
+from typing import Callable, Dict, Generic, Optional, Tuple, TypeVar, final
+
+import attr
+import structlog
+from django.core.cache import BaseCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.memcached import BaseMemcachedCache
+from django.core.exceptions import ImproperlyConfigured
+
+from server.common.services import background
+
+_ValueT = TypeVar('_ValueT')
+
+#: Names of counters we track for each cache:
+_STATS_NAMES: Tuple[str, ...] = (
+    'hit',
+    'miss',
+    'stale',
+    'not_modified',
+    'refresh_error',
+)
+
+#: Backends with atomic ``add`` and ``incr``,
+#: the local memory one is only shared by threads of a single process:
+_ATOMIC_BACKENDS = (BaseMemcachedCache, LocMemCache)
+
+logger = structlog.get_logger(__name__)
+
+
+def atomic(
+    instance: object,
+    attribute: 'attr.Attribute[BaseCache]',
+    cache: BaseCache,
+) -> None:
+    """
+    Validates that the cache can hold locks and counters shared by workers.
+
+    They need atomic ``add`` and ``incr``, like in Redis or Memcached.
+    The local memory cache is only fine for development and tests.
+    """
+    is_redis = type(cache).__module__.startswith('django_redis.')
+    if not is_redis and not isinstance(cache, _ATOMIC_BACKENDS):
+        raise ImproperlyConfigured(
+            '{0} needs a cache with atomic add and incr, got {1}'.format(
+                type(instance).__name__, type(cache).__name__,
+            ),
+        )
+
+
+def incr(cache: BaseCache, key: str, *, timeout: Optional[int]) -> int:
+    """
+    Increment a counter, creating it when it is missing.
+
+    It is only atomic on backends with atomic ``add`` and ``incr``,
+    see :func:`atomic`.
+    """
+    cache.add(key, 0, timeout=timeout)
+    try:
+        return cache.incr(key)
+    except ValueError:  # key has expired right between `add` and `incr`
+        cache.add(key, 1, timeout=timeout)
+        return 1
+
+
+def _always_modified(fetched: object) -> bool:
+    return False
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class CacheEntry(Generic[_ValueT]):
+    """Value stored in the cache together with its freshness deadline."""
+
+    value: _ValueT  # noqa: WPS110
+    fresh_until: float
+
+    def is_fresh(self) -> bool:
+        """Tells whether this entry can be served without a refresh."""
+        return time.time() < self.fresh_until
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class CacheStats(object):
+    """
+    Shared hit / miss / stale counters.
+
+    Counters are stored in the same cache as values,
+    so they are shared between all worker processes.
+    """
+
+    _cache: BaseCache
+    _prefix: str
+
+    def incr(self, name: str) -> None:
+        """Increment a single counter."""
+        incr(self._cache, self._key(name), timeout=None)
+
+    def snapshot(self) -> Dict[str, int]:
+        """Return current values of all counters."""
+        stored = self._cache.get_many([
+            self._key(name) for name in _STATS_NAMES
+        ])
+        return {
+            name: stored.get(self._key(name), 0)
+            for name in _STATS_NAMES
+        }
+
+    def reset(self) -> None:
+        """Drop all counters."""
+        self._cache.delete_many([self._key(name) for name in _STATS_NAMES])
+
+    def _key(self, name: str) -> str:
+        return '{0}:stats:{1}'.format(self._prefix, name)
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class StaleWhileRevalidate(object):
+    """
+    TTL cache with stale-while-revalidate semantics.
+
+    - Fresh entries are returned as is
+    - Stale entries are returned right away,
+      while a single background refresh is running
+    - Missing entries are fetched synchronously
+
+    When a background refresh fails, we keep serving the last good value
+    until it falls out of the stale window.
+    Refreshes run in the ``executor`` when it is given,
+    otherwise each of them starts its own thread.
+
+    Use :meth:`revalidating` to refresh entries with conditional requests.
+    """
+
+    _cache: BaseCache = attr.ib(validator=atomic)
+    _ttl: int
+    _stale_ttl: int
+    _prefix: str = 'placeholder'
+    _lock_timeout: int = 30
+    _executor: Optional[background.BackgroundExecutor] = None
+
+    def __call__(self, key: str, fetch: Callable[[], _ValueT]) -> _ValueT:
+        """Return cached value for a key, calling `fetch` when needed."""
+        return self.revalidating(key, lambda _cached: fetch())
+
+    def revalidating(
+        self,
+        key: str,
+        fetch: Callable[[Optional[_ValueT]], _ValueT],
+        *,
+        not_modified: Callable[[_ValueT], bool] = _always_modified,
+    ) -> _ValueT:
+        """
+        Same as calling the cache, but `fetch` gets the cached value.
+
+        Refreshed values that are ``not_modified`` are counted as such.
+        It is a flag on the value, not its identity:
+        values coalesced from other workers are always new objects.
+        """
+        entry: Optional[CacheEntry[_ValueT]] = self._cache.get(key)
+        if entry is None:
+            self.stats.incr('miss')
+            return self._store(key, fetch(None)).value
+
+        if entry.is_fresh():
+            self.stats.incr('hit')
+        else:
+            self.stats.incr('stale')
+            self._revalidate(key, entry.value, fetch, not_modified)
+        return entry.value
+
+    @property
+    def stats(self) -> CacheStats:
+        """Counters for this cache."""
+        return CacheStats(cache=self._cache, prefix=self._prefix)
+
+    def _store(self, key: str, fetched: _ValueT) -> CacheEntry[_ValueT]:
+        entry = CacheEntry(value=fetched, fresh_until=time.time() + self._ttl)
+        self._cache.set(key, entry, timeout=self._ttl + self._stale_ttl)
+        return entry
+
+    def _revalidate(
+        self,
+        key: str,
+        cached: _ValueT,
+        fetch: Callable[[Optional[_ValueT]], _ValueT],
+        not_modified: Callable[[_ValueT], bool],
+    ) -> None:
+        # `add` is atomic, so only one worker runs the refresh:
+        lock_key = '{0}:refresh'.format(key)
+        if not self._cache.add(lock_key, 1, timeout=self._lock_timeout):
+            return
+        refresh = partial(
+            self._refresh, key, lock_key, cached, fetch, not_modified,
+        )
+        if self._executor is None:
+            threading.Thread(target=refresh, daemon=True).start()
+        elif not self._executor.submit(refresh):
+            # We keep serving the stale value, the next call will retry:
+            self._cache.delete(lock_key)
+
+    def _refresh(  # noqa: WPS211
+        self,
+        key: str,
+        lock_key: str,
+        cached: _ValueT,
+        fetch: Callable[[Optional[_ValueT]], _ValueT],
+        not_modified: Callable[[_ValueT], bool],
+    ) -> None:
+        try:
+            fetched = fetch(cached)
+        except Exception:
+            self.stats.incr('refresh_error')
+            logger.warning('cache_refresh_failed', key=key, exc_info=True)
+        else:
+            if not_modified(fetched):
+                self.stats.incr('not_modified')
+            self._store(key, fetched)
+        finally:
+            self._cache.delete(lock_key)
@@ -0,0 +1,53 @@
+from http import HTTPStatus
+from typing import Callable, Dict, Generic, Optional, TypeVar, final
+
+import attr
+import requests
+
+_ValueT = TypeVar('_ValueT')
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class Validated(Generic[_ValueT]):
+    """
+    Decoded response body together with its HTTP cache validators.
+
+    Validators are sent back with conditional requests,
+    so unchanged responses come back as empty ``304 Not Modified``.
+    Values reused after such responses are marked as ``not_modified``.
+    """
+
+    value: _ValueT  # noqa: WPS110
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    not_modified: bool = False
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers to ask whether the response has changed since."""
+        headers = {}
+        if self.etag is not None:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified is not None:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+def validated(
+    response: requests.Response,
+    decode: Callable[[requests.Response], _ValueT],
+    previous: Optional[Validated[_ValueT]] = None,
+) -> Validated[_ValueT]:
+    """
+    Decode response of a conditional request.
+
+    Returns ``previous`` marked as ``not_modified`` when the response
+    is not modified, so we don't spend time decoding the same data again.
+    """
+    if previous is not None and response.status_code == HTTPStatus.NOT_MODIFIED:
+        return attr.evolve(previous, not_modified=True)
+    return Validated(
+        value=decode(response),
+        etag=response.headers.get('ETag'),
+        last_modified=response.headers.get('Last-Modified'),
+    )
@@ -0,0 +1,52 @@
+import hashlib
+import tempfile
+from typing import Iterable, final
+
+import attr
+from django.core.files import File
+from django.core.files.storage import Storage
+
+#: Files smaller than this are kept in memory while we hash them:
+_SPOOL_SIZE = 1024 * 1024  # 1 MiB
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class ContentStore(object):
+    """
+    Content-addressed files in a Django storage.
+
+    Files are named by the sha256 of their content,
+    so the same content is only stored once.
+    """
+
+    _storage: Storage
+    _prefix: str
+
+    def save(self, chunks: Iterable[bytes], *, extension: str) -> str:
+        """Store content from `chunks`, return the name in the storage."""
+        digest = hashlib.sha256()
+        with tempfile.SpooledTemporaryFile(max_size=_SPOOL_SIZE) as spooled:
+            for chunk in chunks:
+                digest.update(chunk)
+                spooled.write(chunk)
+
+            name = self.name(digest.hexdigest(), extension)
+            if self._storage.exists(name):
+                return name  # deduplicated
+            spooled.seek(0)
+            saved = self._storage.save(name, File(spooled))
+        if saved != name:
+            # The same content was stored by someone else in the meantime:
+            self._storage.delete(saved)
+        return name
+
+    def name(self, content_hash: str, extension: str) -> str:
+        """Name for the content, nested to keep directories small."""
+        return '{0}/{1}/{2}/{3}{4}'.format(
+            self._prefix,
+            content_hash[:2],
+            content_hash[2:4],
+            content_hash,
+            extension,
+        )
@@ -0,0 +1,65 @@
+import time
+from contextvars import ContextVar
+from typing import Optional, Tuple
+
+import requests
+
+#: Monotonic time by which the current request must be served:
+_deadline: ContextVar[Optional[float]] = ContextVar('deadline', default=None)
+
+
+class DeadlineExceededError(requests.Timeout):
+    """Raised when the current request has no time left for upstream calls."""
+
+
+def start(budget: float) -> None:
+    """Start the deadline of the current request, ``budget`` is in seconds."""
+    _deadline.set(time.monotonic() + budget)
+
+
+def clear() -> None:
+    """Drop the deadline of the current request."""
+    _deadline.set(None)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left to serve the current request, ``None`` without deadline."""
+    current = _deadline.get()
+    if current is None:
+        return None
+    return current - time.monotonic()
+
+
+def check() -> None:
+    """Raise :exc:`DeadlineExceededError` when there is no time left."""
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceededError('No time left to serve the request')
+
+
+def cap(timeout: float) -> float:
+    """
+    Cap any waiting by the time left to serve the current request.
+
+    Raises :exc:`DeadlineExceededError` when there is no time left.
+    """
+    check()
+    left = remaining()
+    if left is None:
+        return timeout
+    return min(timeout, left)
+
+
+def split(connect: float, read: float) -> Tuple[float, float]:
+    """
+    Cap connect and read timeouts, so together they fit in the time left.
+
+    Connecting gets at most half of the time left, reading gets the rest.
+    Raises :exc:`DeadlineExceededError` when there is no time left.
+    """
+    check()
+    left = remaining()
+    if left is None:
+        return connect, read
+    connect = min(connect, left / 2)
+    return connect, min(read, left - connect)
@@ -1,20 +1,293 @@
-from typing import ClassVar
-from urllib.parse import urljoin
+import hashlib
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from typing import Any, ClassVar, Dict, Optional, Tuple, Type, TypeVar
+from urllib.parse import urlencode, urljoin
 
+import requests
 from attr import dataclass
+from django.core.cache import caches
+
+from server.common.django.types import Settings
+from server.common.services import (
+    balancing,
+    deadline,
+    json_codec,
+    latency,
+    rate_limit,
+    resilience,
+    sessions,
+)
+
+_FetcherT = TypeVar('_FetcherT', bound='BaseFetcher')
+
+#: Errors raised before we even call the API, retrying them makes no sense:
+_NOT_RETRYABLE = (
+    resilience.CircuitOpenError,
+    rate_limit.RateLimitedError,
+    deadline.DeadlineExceededError,
+)
 
 
 @dataclass(frozen=True, slots=True)
 class BaseFetcher(object):
-    """Base class for our HTTP actions."""
+    """
+    Base class for our HTTP actions.
+
+    All requests go through a per-process pooled keep-alive session,
+    so we don't pay for a new TCP / TLS connection on every call.
+    With mirrors configured, requests are spread between them,
+    see :class:`server.common.services.balancing.EndpointPool`.
+
+    When configured, requests are also protected by a shared
+    circuit breaker and retried within a shared retry budget.
+    They can also be limited by a shared per-path rate limiter,
+    see :class:`server.common.services.rate_limit.SharedRateLimiter`.
+
+    Timeouts never exceed the time left to serve the current request,
+    see :mod:`server.common.services.deadline`.
+    They can also adapt to recently observed latency.
+
+    JSON bodies are encoded and decoded as raw bytes by a pluggable codec,
+    see :mod:`server.common.services.json_codec`.
+    """
 
     #: Dependencies:
     _api_url: str
     _api_timeout: int
 
+    #: Transport options:
+    _pool_size: int = 10
+    _connect_timeout: float = 3.05
+    _adaptive_timeout: Optional[latency.AdaptiveTimeout] = None
+    _endpoints: Optional[balancing.EndpointPool] = None
+
+    #: Resilience options:
+    _breaker: Optional[resilience.CircuitBreaker] = None
+    _retry_policy: Optional[resilience.RetryPolicy] = None
+    _rate_limiter: Optional[rate_limit.SharedRateLimiter] = None
+
+    #: Decoding options, see :func:`server.common.pydantic_model.decoder`:
+    _trusted_decoding: bool = False
+    _codec: json_codec.JsonCodec = json_codec.DEFAULT
+
     #: This must be defined in all subclasses:
     _url_path: ClassVar[str]
 
+    @classmethod
+    def from_settings(cls: Type[_FetcherT], settings: Settings) -> _FetcherT:
+        """Create fetcher configured with :term:`Placeholder API` settings."""
+        cache = caches[settings.PLACEHOLDER_API_CACHE]
+        return cls(
+            api_url=settings.PLACEHOLDER_API_URL,
+            api_timeout=settings.PLACEHOLDER_API_TIMEOUT,
+            pool_size=settings.PLACEHOLDER_API_POOL_SIZE,
+            connect_timeout=settings.PLACEHOLDER_API_CONNECT_TIMEOUT,
+            breaker=resilience.CircuitBreaker(
+                cache=cache,
+                failure_threshold=settings.PLACEHOLDER_API_BREAKER_FAILURES,
+                cooldown=settings.PLACEHOLDER_API_BREAKER_COOLDOWN,
+                slow_call=settings.PLACEHOLDER_API_BREAKER_SLOW_CALL,
+            ),
+            rate_limiter=rate_limit.SharedRateLimiter(
+                cache=cache,
+                rates=settings.PLACEHOLDER_API_RATE_LIMITS,
+                max_wait=settings.PLACEHOLDER_API_RATE_LIMIT_MAX_WAIT,
+            ) if settings.PLACEHOLDER_API_RATE_LIMITS else None,
+            retry_policy=resilience.RetryPolicy(
+                budget=resilience.RetryBudget(
+                    cache=cache,
+                    ratio=settings.PLACEHOLDER_API_RETRY_BUDGET,
+                ),
+                attempts=settings.PLACEHOLDER_API_RETRIES,
+            ),
+            adaptive_timeout=latency.AdaptiveTimeout(
+                percentile=settings.PLACEHOLDER_API_ADAPTIVE_TIMEOUT_PERCENTILE,
+            ) if settings.PLACEHOLDER_API_ADAPTIVE_TIMEOUT else None,
+            endpoints=balancing.EndpointPool(urls=(
+                settings.PLACEHOLDER_API_URL,
+                *settings.PLACEHOLDER_API_MIRROR_URLS,
+            )) if settings.PLACEHOLDER_API_MIRROR_URLS else None,
+            trusted_decoding=settings.PLACEHOLDER_API_TRUSTED_DECODING,
+        )
+
     def url_path(self) -> str:
         """Full URL for the request."""
         return urljoin(self._api_url, self._url_path)
+
+    def cache_key(self, **parts: object) -> str:
+        """Stable cache key built from the API url, path, and extra parts."""
+        raw_key = '{0}?{1}'.format(
+            self.url_path(),
+            urlencode(sorted(parts.items())),
+        )
+        return 'placeholder:{0}'.format(
+            hashlib.sha1(raw_key.encode('utf8')).hexdigest(),  # noqa: S324
+        )
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        idempotent: bool = False,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """
+        Send a request and raise on HTTP errors.
+
+        Only ``idempotent`` requests are retried,
+        because we cannot know whether the failed one was processed.
+        JSON bodies passed as ``json`` are encoded with our codec.
+        """
+        kwargs = _encode_json(self._codec, kwargs)
+        if self._retry_policy is not None:
+            self._retry_policy.record_request()
+
+        attempt = 0
+        while True:  # noqa: WPS457
+            try:
+                return self._send(method, url, **kwargs)
+            except requests.RequestException as exc:
+                _slow_down(self._rate_limiter, self._url_path, exc)
+                delay = _retry_delay(
+                    self._retry_policy, exc, attempt, idempotent=idempotent,
+                )
+                if delay is None:
+                    raise
+            attempt += 1
+            time.sleep(delay)
+
+    def _send(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire(self._url_path)
+        target = self._endpoints.route(url) if self._endpoints else url
+        # Each mirror has its own breaker, so one bad mirror
+        # does not open the circuit for all of them:
+        endpoint = self.cache_key(
+            method=method,
+            origin=balancing.origin(target),
+        )
+        probe = self._breaker.guard(endpoint) if self._breaker else False
+        start = time.monotonic()
+        try:
+            response = sessions.pooled_session(self._pool_size).request(
+                method, target, timeout=self._timeouts(endpoint), **kwargs,
+            )
+        except requests.RequestException:
+            self._record(
+                endpoint, target, probe=probe, success=False, start=start,
+            )
+            raise
+
+        self._record(
+            endpoint,
+            target,
+            probe=probe,
+            success=not _is_server_failure(response.status_code),
+            start=start,
+        )
+        # Read timeout is per socket read, slow bodies can take longer:
+        deadline.check()
+        response.raise_for_status()
+        return response
+
+    def _record(  # noqa: WPS211
+        self,
+        endpoint: str,
+        target: str,
+        *,
+        probe: bool,
+        success: bool,
+        start: float,
+    ) -> None:
+        elapsed = time.monotonic() - start
+        if self._breaker is not None:
+            self._breaker.record(
+                endpoint, probe=probe, success=success, elapsed=elapsed,
+            )
+        if self._endpoints is not None:
+            self._endpoints.record(target, success=success, elapsed=elapsed)
+        if self._adaptive_timeout is not None and success:
+            self._adaptive_timeout.observe(endpoint, elapsed)
+
+    def _timeouts(self, endpoint: str) -> Tuple[float, float]:
+        read_timeout: float = self._api_timeout
+        if self._adaptive_timeout is not None:
+            read_timeout = self._adaptive_timeout.read_timeout(
+                endpoint, read_timeout,
+            )
+        return deadline.split(self._connect_timeout, read_timeout)
+
+
+def _encode_json(
+    codec: json_codec.JsonCodec,
+    kwargs: Dict[str, Any],
+) -> Dict[str, Any]:
+    if 'json' not in kwargs:
+        return kwargs
+    body = kwargs.pop('json')
+    headers = {'Content-Type': 'application/json'}
+    headers.update(kwargs.pop('headers', None) or {})
+    return {**kwargs, 'data': codec.dumps(body), 'headers': headers}
+
+
+def _slow_down(
+    rate_limiter: Optional[rate_limit.SharedRateLimiter],
+    path: str,
+    exc: requests.RequestException,
+) -> None:
+    if rate_limiter is None or exc.response is None:
+        return
+    if exc.response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+        rate_limiter.throttled(path, retry_after=_retry_after(exc.response))
+
+
+def _retry_after(response: requests.Response) -> Optional[float]:
+    retry_after = response.headers.get('Retry-After')
+    if retry_after is None:
+        return None
+    if retry_after.isdigit():
+        return float(retry_after)
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:  # `-0000` zone means UTC
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _retry_delay(
+    policy: Optional[resilience.RetryPolicy],
+    exc: requests.RequestException,
+    attempt: int,
+    *,
+    idempotent: bool,
+) -> Optional[float]:
+    if not idempotent or policy is None or not _is_retryable(exc):
+        return None
+    if not policy.allows(attempt):
+        return None
+    delay = policy.delay(attempt + 1)
+    left = deadline.remaining()
+    if left is not None and delay >= left:
+        return None  # there is no time left to retry
+    return delay
+
+
+def _is_retryable(exc: requests.RequestException) -> bool:
+    if isinstance(exc, _NOT_RETRYABLE):
+        return False
+    if exc.response is None:
+        return True  # connection errors and timeouts
+    return _is_server_failure(exc.response.status_code)
+
+
+def _is_server_failure(status_code: int) -> bool:
+    return (
+        status_code >= HTTPStatus.INTERNAL_SERVER_ERROR or
+        status_code == HTTPStatus.TOO_MANY_REQUESTS
+    )
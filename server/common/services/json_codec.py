@@ -0,0 +1,46 @@
+import json
+from typing import Any, Callable, final
+
+import attr
+
+try:
+    import orjson  # noqa: WPS433
+except ImportError:  # pragma: no cover
+    orjson = None  # noqa: WPS440
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class JsonCodec(object):
+    """
+    Encodes and decodes JSON bodies as raw bytes.
+
+    We never build intermediate ``str`` bodies,
+    both directions work with bytes sent or received over the wire.
+    """
+
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[bytes], Any]
+
+
+#: Compact like ``orjson``, created once instead of on every call:
+_ENCODER = json.JSONEncoder(separators=(',', ':'))
+
+
+def _stdlib_dumps(body: Any) -> bytes:
+    return _ENCODER.encode(body).encode('utf8')
+
+
+#: Always available codec built with stdlib :mod:`json`:
+STDLIB = JsonCodec(name='json', dumps=_stdlib_dumps, loads=json.loads)
+
+#: Much faster C-backed codec, when ``orjson`` is installed:
+ORJSON = JsonCodec(
+    name='orjson',
+    dumps=orjson.dumps,
+    loads=orjson.loads,
+) if orjson is not None else None
+
+#: The fastest codec available:
+DEFAULT = ORJSON or STDLIB
@@ -0,0 +1,107 @@
+import codecs
+import json
+from typing import Any, Iterable, Iterator, Tuple
+
+_decoder = json.JSONDecoder()
+
+#: JSON whitespace and array separators we skip between items:
+_SKIPPED = ' \t\n\r,'
+
+#: Chars that can follow a complete array item:
+_SEPARATORS = frozenset(' \t\n\r,]')
+
+
+class PayloadTooLargeError(ValueError):
+    """Raised when streamed payload exceeds configured limits."""
+
+
+def iter_array(
+    chunks: Iterable[bytes],
+    *,
+    max_bytes: int,
+    max_items: int,
+) -> Iterator[Any]:
+    """
+    Decode top-level JSON array item by item from raw byte chunks.
+
+    Only the current item is kept in memory, not the whole payload.
+    Raises :exc:`PayloadTooLargeError` when the payload
+    is bigger than ``max_bytes`` or has more than ``max_items`` items.
+    Raises :exc:`ValueError` on invalid JSON.
+
+    >>> chunks = [b'[{"id": 1}, {"i', b'd": 2}]']
+    >>> list(iter_array(chunks, max_bytes=100, max_items=2))
+    [{'id': 1}, {'id': 2}]
+
+    """
+    reader = _ChunkReader(iter(chunks), max_bytes=max_bytes)
+    reader.expect('[')
+    items_count = 0
+    while reader.skip(_SKIPPED) != ']':
+        if items_count >= max_items:
+            raise PayloadTooLargeError(
+                'More than {0} items in payload'.format(max_items),
+            )
+        yield reader.decode_value()
+        items_count += 1
+
+
+class _ChunkReader(object):
+    """Text buffer over byte chunks that only keeps the unparsed tail."""
+
+    def __init__(self, chunks: Iterator[bytes], *, max_bytes: int) -> None:
+        self._chunks = chunks
+        self._max_bytes = max_bytes
+        self._bytes_read = 0
+        self._text_decoder = codecs.getincrementaldecoder('utf8')()
+        self._buffer = ''
+        self._exhausted = False
+
+    def expect(self, char: str) -> None:
+        if self.skip(' \t\n\r') != char:
+            raise ValueError('Expected {0!r} in JSON payload'.format(char))
+        self._buffer = self._buffer[1:]
+
+    def skip(self, chars: str) -> str:
+        """Skip given chars and return the next one without consuming it."""
+        while True:  # noqa: WPS457
+            self._buffer = self._buffer.lstrip(chars)
+            if self._buffer:
+                return self._buffer[0]
+            if not self._read_more():
+                raise ValueError('Unexpected end of JSON payload')
+
+    def decode_value(self) -> Any:
+        while True:  # noqa: WPS457
+            decoded, end = self._raw_decode()
+            # Values like numbers can be cut in the middle by a chunk border,
+            # so we only trust values followed by a separator:
+            is_complete = self._buffer[end:end + 1] in _SEPARATORS
+            if is_complete or not self._read_more():
+                self._buffer = self._buffer[end:]
+                return decoded
+
+    def _raw_decode(self) -> Tuple[Any, int]:
+        while True:  # noqa: WPS457
+            try:
+                return _decoder.raw_decode(self._buffer)
+            except json.JSONDecodeError:
+                if not self._read_more():
+                    raise
+
+    def _read_more(self) -> bool:
+        if self._exhausted:
+            return False
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._exhausted = True
+            self._buffer += self._text_decoder.decode(b'', final=True)
+            return False
+
+        self._bytes_read += len(chunk)
+        if self._bytes_read > self._max_bytes:
+            raise PayloadTooLargeError(
+                'Payload is bigger than {0} bytes'.format(self._max_bytes),
+            )
+        self._buffer += self._text_decoder.decode(chunk)
+        return True
@@ -0,0 +1,48 @@
+import threading
+from collections import deque
+from typing import Deque, Dict, final
+
+import attr
+
+_lock = threading.Lock()
+_samples: Dict[str, Deque[float]] = {}
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class AdaptiveTimeout(object):
+    """
+    Read timeouts derived from recently observed latency.
+
+    We keep the last ``window`` durations of successful calls
+    to each endpoint in the current process.
+    The timeout is their ``percentile`` times ``multiplier``,
+    it is never bigger than the configured static timeout
+    and is not used until we have seen ``min_samples`` calls.
+    """
+
+    _percentile: float
+    _multiplier: float = 2
+    _window: int = 100
+    _min_samples: int = 20
+    _floor: float = 0.5
+
+    def observe(self, endpoint: str, elapsed: float) -> None:
+        """Remember how long a successful call took."""
+        with _lock:
+            samples = _samples.get(endpoint)
+            if samples is None:
+                samples = deque(maxlen=self._window)
+                _samples[endpoint] = samples
+            samples.append(elapsed)
+
+    def read_timeout(self, endpoint: str, default: float) -> float:
+        """Timeout for the next call, ``default`` until we know enough."""
+        with _lock:
+            samples = sorted(_samples.get(endpoint, ()))
+        if len(samples) < self._min_samples:
+            return default
+        observed = samples[min(
+            len(samples) - 1, int(self._percentile * len(samples)),
+        )]
+        return min(default, max(self._floor, observed * self._multiplier))
@@ -0,0 +1,159 @@
+import math
+import threading
+import time
+from typing import Mapping, Optional, Tuple, final
+
+import attr
+import requests
+import structlog
+from django.core.cache import BaseCache
+
+from server.common.services import caching, deadline
+
+#: Names of shared state we keep for each limited path:
+_FACTOR = 'factor'
+_PAUSED_UNTIL = 'paused_until'
+
+logger = structlog.get_logger(__name__)
+
+
+class RateLimitedError(requests.RequestException):
+    """Raised when a call cannot be made without exceeding the rate limit."""
+
+
+@final
+class Pacer(object):
+    """
+    Spaces calls evenly to keep them under ``rate`` per second.
+
+    It is thread-safe, but only limits the current process.
+    """
+
+    __slots__ = ('_interval', '_lock', '_next_at')
+
+    def __init__(self, rate: float) -> None:
+        """Calls are allowed once in ``1 / rate`` seconds."""
+        self._interval = 1 / rate
+        self._lock = threading.Lock()
+        self._next_at = time.monotonic()
+
+    def wait(self) -> None:
+        """Sleep until the next call is allowed."""
+        with self._lock:
+            now = time.monotonic()
+            allowed_at = max(self._next_at, now)
+            self._next_at = allowed_at + self._interval
+        time.sleep(allowed_at - now)
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class SharedRateLimiter(object):
+    """
+    Token bucket per API path, shared between processes via cache.
+
+    - ``rates`` map path prefixes to calls per second,
+      paths without a configured rate are not limited
+    - Buckets are refilled every window, at least a second long,
+      tokens are taken with atomic cache increments
+    - Calls wait up to ``max_wait`` seconds for a token,
+      ``0`` makes them fail fast with :exc:`RateLimitedError`
+    - When we are throttled, the rate is halved for ``recovery`` seconds,
+      and no calls are made until ``Retry-After`` is over
+
+    Waiting never exceeds the deadline of the current request.
+    """
+
+    _cache: BaseCache = attr.ib(validator=caching.atomic)
+    _rates: Mapping[str, float]
+    _max_wait: float
+    _recovery: int = 60
+    _min_factor: float = 0.1
+    _prefix: str = 'placeholder:rate'
+
+    def acquire(self, path: str) -> None:
+        """
+        Take a token to call `path`, waiting for it when allowed.
+
+        Raises :exc:`RateLimitedError` when there is no token in time.
+        """
+        limited = self._limited_path(path)
+        if limited is None:
+            return
+
+        wait_until = time.monotonic() + deadline.cap(self._max_wait)
+        while True:  # noqa: WPS457
+            delay = self._paused_for(limited)
+            if delay is None:
+                delay = self._take_token(limited)
+            if delay is None:
+                return
+            if time.monotonic() + delay > wait_until:
+                raise RateLimitedError(
+                    'Rate limit is exceeded for {0}'.format(limited),
+                )
+            time.sleep(delay)
+
+    def throttled(self, path: str, *, retry_after: Optional[float]) -> None:
+        """Slow down calls to `path`, the API responded with ``429``."""
+        limited = self._limited_path(path)
+        if limited is None:
+            return
+
+        factor = max(self._factor(limited) / 2, self._min_factor)
+        self._cache.set(
+            self._key(limited, _FACTOR), factor, timeout=self._recovery,
+        )
+        if retry_after is not None:
+            self._cache.set(
+                self._key(limited, _PAUSED_UNTIL),
+                time.time() + retry_after,
+                timeout=math.ceil(retry_after) + 1,
+            )
+        logger.warning(
+            'rate_limit_lowered',
+            path=limited,
+            factor=factor,
+            retry_after=retry_after,
+        )
+
+    def _paused_for(self, limited: str) -> Optional[float]:
+        paused_until = self._cache.get(self._key(limited, _PAUSED_UNTIL))
+        if paused_until is None or paused_until <= time.time():
+            return None
+        return paused_until - time.time()
+
+    def _take_token(self, limited: str) -> Optional[float]:
+        """Returns ``None`` when a token is taken, or delay for the next try."""
+        rate = self._rates[limited] * self._factor(limited)
+        window, capacity = _bucket(rate)
+        slot = math.floor(time.time() / window)
+        taken = caching.incr(
+            self._cache,
+            self._key(limited, 'tokens:{0}:{1}'.format(window, slot)),
+            timeout=math.ceil(window) + 1,
+        )
+        if taken <= capacity:
+            return None
+        return (slot + 1) * window - time.time()
+
+    def _limited_path(self, path: str) -> Optional[str]:
+        for limited in self._rates:
+            prefix = '{0}/'.format(limited.rstrip('/'))
+            if path == limited or path.startswith(prefix):
+                return limited
+        return None
+
+    def _factor(self, limited: str) -> float:
+        return self._cache.get(
+            self._key(limited, _FACTOR), 1,
+        )
+
+    def _key(self, limited: str, name: str) -> str:
+        return '{0}:{1}:{2}'.format(self._prefix, limited, name)
+
+
+def _bucket(rate: float) -> Tuple[float, int]:
+    # Slow rates get longer windows, so every window has at least one token:
+    window = max(1, 1 / rate)
+    return window, max(1, math.floor(rate * window))
@@ -0,0 +1,171 @@
+import random
+import time
+from typing import Optional, final
+
+import attr
+import requests
+import structlog
+from django.core.cache import BaseCache
+
+from server.common.services import caching
+
+logger = structlog.get_logger(__name__)
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised when calls to an endpoint are blocked by a circuit breaker."""
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class CircuitBreaker(object):
+    """
+    Circuit breaker, its state is shared between processes via cache.
+
+    - Closed: all calls are allowed, failures and slow calls are counted
+    - Open: after too many failures within a window all calls fail fast
+      with :exc:`CircuitOpenError` until the cool-down is over
+    - Half-open: after the cool-down a single probe call is allowed,
+      it either closes the circuit or opens it again
+
+    """
+
+    _cache: BaseCache = attr.ib(validator=caching.atomic)
+    _failure_threshold: int
+    _cooldown: int
+    _slow_call: float
+    _failure_window: int = 60
+
+    def guard(self, endpoint: str) -> bool:
+        """
+        Check that the endpoint can be called right now.
+
+        Returns whether this call is a half-open probe.
+        Raises :exc:`CircuitOpenError` when the call is not allowed.
+        """
+        open_until: Optional[float] = self._cache.get(
+            self._key(endpoint, 'open_until'),
+        )
+        if open_until is None:
+            return False
+        if time.time() < open_until or not self._take_probe(endpoint):
+            raise CircuitOpenError('Circuit is open for {0}'.format(endpoint))
+        return True
+
+    def record(
+        self,
+        endpoint: str,
+        *,
+        probe: bool,
+        success: bool,
+        elapsed: float,
+    ) -> None:
+        """Record the outcome of a call allowed by :meth:`guard`."""
+        if success and elapsed <= self._slow_call:
+            if probe:
+                self._close(endpoint)
+        elif probe:
+            self._open(endpoint)
+        elif self._count_failure(endpoint) >= self._failure_threshold:
+            self._open(endpoint)
+
+    def _take_probe(self, endpoint: str) -> bool:
+        return self._cache.add(
+            self._key(endpoint, 'probe'), 1, timeout=self._cooldown,
+        )
+
+    def _count_failure(self, endpoint: str) -> int:
+        return caching.incr(
+            self._cache,
+            self._key(endpoint, 'failures'),
+            timeout=self._failure_window,
+        )
+
+    def _open(self, endpoint: str) -> None:
+        logger.warning('circuit_opened', endpoint=endpoint)
+        self._cache.set(
+            self._key(endpoint, 'open_until'),
+            time.time() + self._cooldown,
+            timeout=None,
+        )
+        self._cache.delete(self._key(endpoint, 'probe'))
+
+    def _close(self, endpoint: str) -> None:
+        logger.info('circuit_closed', endpoint=endpoint)
+        self._cache.delete_many([
+            self._key(endpoint, 'open_until'),
+            self._key(endpoint, 'probe'),
+            self._key(endpoint, 'failures'),
+        ])
+
+    def _key(self, endpoint: str, name: str) -> str:
+        return '{0}:breaker:{1}'.format(endpoint, name)
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class RetryBudget(object):
+    """
+    Global retry budget shared between processes via cache.
+
+    Retries are allowed only while they stay under ``ratio``
+    of all requests made within the current time window
+    (plus a small constant allowance for low traffic).
+    This way retries cannot amplify an outage.
+    """
+
+    _cache: BaseCache = attr.ib(validator=caching.atomic)
+    _ratio: float
+    _min_retries: int = 3
+    _window: int = 10
+    _prefix: str = 'placeholder:retry_budget'
+
+    def record_request(self) -> None:
+        """Every request made adds to the budget."""
+        self._incr(self._key('requests'))
+
+    def spend(self) -> bool:
+        """Try to take a single retry from the budget."""
+        requests_key = self._key('requests')
+        retries_key = self._key('retries')
+        counters = self._cache.get_many([requests_key, retries_key])
+        allowance = self._min_retries + self._ratio * counters.get(
+            requests_key, 0,
+        )
+        if counters.get(retries_key, 0) >= allowance:
+            return False
+        self._incr(retries_key)
+        return True
+
+    def _incr(self, key: str) -> None:
+        caching.incr(self._cache, key, timeout=self._window * 2)
+
+    def _key(self, name: str) -> str:
+        return '{0}:{1}:{2}'.format(
+            self._prefix, name, int(time.time() // self._window),
+        )
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class RetryPolicy(object):
+    """Exponential backoff with full jitter, capped by :class:`RetryBudget`."""
+
+    _budget: RetryBudget
+    _attempts: int
+    _backoff: float = 0.1
+    _max_backoff: float = 2
+
+    def record_request(self) -> None:
+        """Count the request in the shared budget."""
+        self._budget.record_request()
+
+    def allows(self, attempt: int) -> bool:
+        """Tells whether one more retry is allowed after `attempt`."""
+        return attempt < self._attempts and self._budget.spend()
+
+    def delay(self, attempt: int) -> float:
+        """How long to sleep before the next attempt."""
+        return random.uniform(  # noqa: S311
+            0, min(self._max_backoff, self._backoff * 2 ** attempt),
+        )
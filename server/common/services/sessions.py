@@ -0,0 +1,51 @@
+import os
+import threading
+from typing import Dict, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+#: How many different hosts can have their own connection pool:
+_POOL_CONNECTIONS = 10
+
+_SessionKey = Tuple[int, int]
+
+_lock = threading.Lock()
+_sessions: Dict[_SessionKey, requests.Session] = {}
+
+
+def pooled_session(pool_size: int) -> requests.Session:
+    """
+    Return a keep-alive :class:`requests.Session` for the current process.
+
+    Sessions are never shared between processes:
+    sockets inherited from the parent after ``fork`` (gunicorn does that
+    for every worker) are unsafe to use, so a fresh session is created
+    when we detect a new process id.
+    """
+    key = (os.getpid(), pool_size)
+    session = _sessions.get(key)
+    if session is not None:
+        return session
+
+    with _lock:
+        if key[0] not in {pid for pid, _ in _sessions}:
+            # We are in a new process, sessions from the parent are stale:
+            _sessions.clear()
+        session = _sessions.get(key)
+        if session is None:
+            session = _create_session(pool_size)
+            _sessions[key] = session
+        return session
+
+
+def _create_session(pool_size: int) -> requests.Session:
+    adapter = HTTPAdapter(
+        pool_connections=_POOL_CONNECTIONS,
+        pool_maxsize=pool_size,
+        max_retries=0,
+    )
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
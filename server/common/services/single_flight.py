@@ -0,0 +1,136 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, TypeVar, final
+
+import attr
+import structlog
+from django.core.cache import BaseCache
+
+from server.common.services import caching, deadline
+
+_ValueT = TypeVar('_ValueT')
+
+logger = structlog.get_logger(__name__)
+
+
+@final
+class _Flight(object):
+    """Single in-process call that other threads can wait for."""
+
+    __slots__ = ('done', 'outcome', 'error')
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.outcome: Any = None
+        self.error: Optional[Exception] = None
+
+
+_lock = threading.Lock()
+_flights: Dict[str, _Flight] = {}
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class SingleFlight(object):
+    """
+    Coalesces concurrent identical calls into a single one.
+
+    - Threads of the same process wait for the in-flight call
+      and share its result or its error
+    - Processes take a lock in the shared cache, the lock owner publishes
+      its result in the cache for others to pick up
+
+    When waiting takes longer than ``timeout`` or the lock owner fails,
+    callers fall back to calling ``fetch`` on their own.
+    Waiting never exceeds the deadline of the current request.
+    """
+
+    _cache: BaseCache = attr.ib(validator=caching.atomic)
+    _timeout: float
+    _poll_interval: float = 0.05
+
+    def __call__(self, key: str, fetch: Callable[[], _ValueT]) -> _ValueT:
+        """Call `fetch` unless the same `key` is already in flight."""
+        with _lock:
+            flight = _flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = _Flight()
+                _flights[key] = flight
+
+        if leader:
+            return self._lead(key, flight, fetch)
+        return self._follow(flight, fetch)
+
+    def _lead(
+        self,
+        key: str,
+        flight: _Flight,
+        fetch: Callable[[], _ValueT],
+    ) -> _ValueT:
+        try:
+            flight.outcome = self._across_processes(key, fetch)
+        except Exception as exc:
+            flight.error = exc
+            raise
+        finally:
+            _land(key, flight)
+        return flight.outcome
+
+    def _follow(
+        self,
+        flight: _Flight,
+        fetch: Callable[[], _ValueT],
+    ) -> _ValueT:
+        if not flight.done.wait(deadline.cap(self._timeout)):
+            logger.warning('single_flight_timeout')
+            return fetch()
+        if flight.error is not None:
+            raise flight.error
+        return flight.outcome
+
+    def _across_processes(
+        self,
+        key: str,
+        fetch: Callable[[], _ValueT],
+    ) -> _ValueT:
+        lock_key = '{0}:flight:lock'.format(key)
+        result_key = '{0}:flight:result'.format(key)
+        lock_timeout = int(self._timeout) + 1
+        if not self._cache.add(lock_key, 1, timeout=lock_timeout):
+            return self._wait_for_result(lock_key, result_key, fetch)
+
+        try:
+            fetched = fetch()
+        except Exception:
+            self._cache.delete(lock_key)
+            raise
+        # Results are wrapped into a tuple to tell them apart from misses:
+        self._cache.set(result_key, (fetched,), timeout=lock_timeout)
+        self._cache.delete(lock_key)
+        return fetched
+
+    def _wait_for_result(
+        self,
+        lock_key: str,
+        result_key: str,
+        fetch: Callable[[], _ValueT],
+    ) -> _ValueT:
+        wait_until = time.monotonic() + deadline.cap(self._timeout)
+        while time.monotonic() < wait_until:
+            time.sleep(self._poll_interval)
+            stored = self._cache.get_many([lock_key, result_key])
+            published = stored.get(result_key)
+            if published is not None:
+                return published[0]
+            if lock_key not in stored:
+                break  # lock owner has failed
+
+        logger.warning('single_flight_fallback', key=lock_key)
+        return fetch()
+
+
+def _land(key: str, flight: _Flight) -> None:
+    with _lock:
+        _flights.pop(key, None)
+    flight.done.set()
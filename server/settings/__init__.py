@@ -29,6 +29,7 @@ _base_settings = (
     'components/csp.py',
     'components/caches.py',
     'components/placeholder.py',
+    'components/background.py',
 
     # Select the right env:
     'environments/{0}.py'.format(_ENV),
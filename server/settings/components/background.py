@@ -0,0 +1,28 @@
+# Settings for fire-and-forget tasks run inside each worker process,
+# see `server/common/services/background.py`.
+# All settings must be documented!
+
+from server.settings.components import config
+
+# How many background tasks run at once in each process,
+# `0` runs them inline in the calling thread:
+BACKGROUND_TASKS_WORKERS = config(
+    'DJANGO_BACKGROUND_TASKS_WORKERS',
+    cast=int,
+    default=4,
+)
+
+# How many more tasks can wait for a free worker, new ones are dropped:
+BACKGROUND_TASKS_QUEUE = config(
+    'DJANGO_BACKGROUND_TASKS_QUEUE',
+    cast=int,
+    default=100,
+)
+
+# How long (in seconds) worker processes wait for pending tasks on shutdown,
+# keep it lower than gunicorn's `graceful_timeout`:
+BACKGROUND_TASKS_DRAIN_TIMEOUT = config(
+    'DJANGO_BACKGROUND_TASKS_DRAIN_TIMEOUT',
+    cast=float,
+    default=20,
+)
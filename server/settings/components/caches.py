@@ -7,6 +7,14 @@ CACHES = {
         # like https://github.com/jazzband/django-redis
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
     },
+
+    # Placeholder API rate limits, circuit breakers, retry budget,
+    # single-flight locks and cached responses. They need atomic `add`
+    # and `incr` shared by all workers, so memcached is used in production:
+    'placeholder': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'placeholder',
+    },
 }
 
 
@@ -53,6 +53,9 @@ MIDDLEWARE: Tuple[str, ...] = (
     # Logging:
     'server.settings.components.logging.LoggingContextVarsMiddleware',
 
+    # Request deadlines:
+    'server.common.django.middleware.DeadlineMiddleware',
+
     # Content Security Policy:
     'csp.middleware.CSPMiddleware',
 
@@ -1,6 +1,10 @@
 # Custom settings for Placeholder API integration.
 # All settings must be documented!
 
+from typing import Tuple
+
+from decouple import Csv
+
 from server.settings.components import config
 
 # API url we use to fetch data, can be switched from real Placeholder API
@@ -9,3 +13,193 @@ PLACEHOLDER_API_URL = config('DJANGO_PLACEHOLDER_API_URL')
 
 # API default timeout in seconds:
 PLACEHOLDER_API_TIMEOUT = config('DJANGO_PLACEHOLDER_API_TIMEOUT', cast=int)
+
+# API connect timeout in seconds, `PLACEHOLDER_API_TIMEOUT` is used for reads:
+PLACEHOLDER_API_CONNECT_TIMEOUT = config(
+    'DJANGO_PLACEHOLDER_API_CONNECT_TIMEOUT',
+    cast=float,
+    default=3.05,
+)
+
+# How many keep-alive connections each worker process keeps per API host:
+PLACEHOLDER_API_POOL_SIZE = config(
+    'DJANGO_PLACEHOLDER_API_POOL_SIZE',
+    cast=int,
+    default=10,
+)
+
+# Circuit breaker opens after this many failed or slow calls to an endpoint
+# within a minute, then all calls fail fast during the cool-down (seconds).
+# Its state is stored in `PLACEHOLDER_API_CACHE` shared by all workers:
+PLACEHOLDER_API_BREAKER_FAILURES = config(
+    'DJANGO_PLACEHOLDER_API_BREAKER_FAILURES',
+    cast=int,
+    default=5,
+)
+PLACEHOLDER_API_BREAKER_COOLDOWN = config(
+    'DJANGO_PLACEHOLDER_API_BREAKER_COOLDOWN',
+    cast=int,
+    default=30,
+)
+
+# Calls slower than this (in seconds) count as failures for circuit breaker:
+PLACEHOLDER_API_BREAKER_SLOW_CALL = config(
+    'DJANGO_PLACEHOLDER_API_BREAKER_SLOW_CALL',
+    cast=float,
+    default=2.0,
+)
+
+# How many times idempotent requests are retried with backoff and jitter:
+PLACEHOLDER_API_RETRIES = config(
+    'DJANGO_PLACEHOLDER_API_RETRIES',
+    cast=int,
+    default=2,
+)
+
+# Retries cannot exceed this ratio of all requests made by all workers:
+PLACEHOLDER_API_RETRY_BUDGET = config(
+    'DJANGO_PLACEHOLDER_API_RETRY_BUDGET',
+    cast=float,
+    default=0.1,
+)
+
+# Cache alias from `CACHES` to store API responses and shared state in,
+# it must be shared by all workers and have atomic `add` and `incr`:
+PLACEHOLDER_API_CACHE = config(
+    'DJANGO_PLACEHOLDER_API_CACHE',
+    default='placeholder',
+)
+
+# How long (in seconds) cached API responses are considered fresh:
+PLACEHOLDER_API_CACHE_TTL = config(
+    'DJANGO_PLACEHOLDER_API_CACHE_TTL',
+    cast=int,
+    default=60,
+)
+
+# How long (in seconds) after the TTL stale responses are still served,
+# while a background refresh is running or the API is failing:
+PLACEHOLDER_API_CACHE_STALE_TTL = config(
+    'DJANGO_PLACEHOLDER_API_CACHE_STALE_TTL',
+    cast=int,
+    default=60 * 60 * 24,
+)
+
+# How long (in seconds) concurrent identical requests wait for the single
+# in-flight one, before falling back to calling the API on their own:
+PLACEHOLDER_API_SINGLE_FLIGHT_TIMEOUT = config(
+    'DJANGO_PLACEHOLDER_API_SINGLE_FLIGHT_TIMEOUT',
+    cast=float,
+    default=10.0,
+)
+
+# Limits for streamed responses used by bulk consumers, like catalog sync.
+# Streaming stops with an error when the payload is bigger than that:
+PLACEHOLDER_API_STREAM_MAX_BYTES = config(
+    'DJANGO_PLACEHOLDER_API_STREAM_MAX_BYTES',
+    cast=int,
+    default=64 * 1024 * 1024,
+)
+PLACEHOLDER_API_STREAM_MAX_ITEMS = config(
+    'DJANGO_PLACEHOLDER_API_STREAM_MAX_ITEMS',
+    cast=int,
+    default=100000,
+)
+
+# Build API response models without running validators,
+# when the payload has exactly the expected shape.
+# Payloads with any mismatch are still validated strictly:
+PLACEHOLDER_API_TRUSTED_DECODING = config(
+    'DJANGO_PLACEHOLDER_API_TRUSTED_DECODING',
+    cast=bool,
+    default=False,
+)
+
+# How long (in seconds) a view has to serve a request.
+# Placeholder API timeouts are capped by the time the request has left:
+REQUEST_DEADLINE = config(
+    'DJANGO_REQUEST_DEADLINE',
+    cast=float,
+    default=10.0,
+)
+
+# Custom deadlines (in seconds) for specific views, by their url names:
+REQUEST_DEADLINE_VIEWS = {
+    'pictures:dashboard': 5.0,
+}
+
+# Derive read timeouts from recently observed API latency percentile,
+# `PLACEHOLDER_API_TIMEOUT` is then used as an upper limit:
+PLACEHOLDER_API_ADAPTIVE_TIMEOUT = config(
+    'DJANGO_PLACEHOLDER_API_ADAPTIVE_TIMEOUT',
+    cast=bool,
+    default=False,
+)
+PLACEHOLDER_API_ADAPTIVE_TIMEOUT_PERCENTILE = config(
+    'DJANGO_PLACEHOLDER_API_ADAPTIVE_TIMEOUT_PERCENTILE',
+    cast=float,
+    default=0.99,
+)
+
+# Comma-separated base urls of Placeholder API mirrors, if any.
+# Requests are spread between `PLACEHOLDER_API_URL` and these hosts,
+# slow and failing ones get less traffic or are ejected for a while:
+PLACEHOLDER_API_MIRROR_URLS = config(
+    'DJANGO_PLACEHOLDER_API_MIRROR_URLS',
+    cast=Csv(),
+    default='',
+)
+
+# How long (in seconds) we wait for more profile edits before sending
+# the latest user state to the API, edits in between are merged:
+PLACEHOLDER_API_LEAD_UPDATE_DEBOUNCE = config(
+    'DJANGO_PLACEHOLDER_API_LEAD_UPDATE_DEBOUNCE',
+    cast=float,
+    default=5.0,
+)
+
+
+def _path_rate(limit: str) -> Tuple[str, float]:
+    path, rate = limit.split('=')
+    return path.strip(), float(rate)
+
+
+# Calls per second allowed for API paths by all workers sharing
+# `PLACEHOLDER_API_CACHE`, like `/photos=10,/users=5`, other paths
+# are not limited. Rates are lowered for a while when we get `429`:
+PLACEHOLDER_API_RATE_LIMITS = config(
+    'DJANGO_PLACEHOLDER_API_RATE_LIMITS',
+    cast=Csv(cast=_path_rate, post_process=dict),
+    default='',
+)
+
+# How long (in seconds) calls wait for the rate limit,
+# `0` makes them fail fast instead:
+PLACEHOLDER_API_RATE_LIMIT_MAX_WAIT = config(
+    'DJANGO_PLACEHOLDER_API_RATE_LIMIT_MAX_WAIT',
+    cast=float,
+    default=1.0,
+)
+
+# Thumbnails of favourite pictures are mirrored into `MEDIA_ROOT`,
+# bigger images are skipped:
+PLACEHOLDER_IMAGE_MIRROR_MAX_BYTES = config(
+    'DJANGO_PLACEHOLDER_IMAGE_MIRROR_MAX_BYTES',
+    cast=int,
+    default=5 * 1024 * 1024,  # 5 MiB
+)
+
+# Timeout (in seconds) for connecting to image hosts and for each read:
+PLACEHOLDER_IMAGE_MIRROR_TIMEOUT = config(
+    'DJANGO_PLACEHOLDER_IMAGE_MIRROR_TIMEOUT',
+    cast=float,
+    default=10.0,
+)
+
+# Comma-separated hosts thumbnails are mirrored from,
+# images hosted anywhere else are never downloaded:
+PLACEHOLDER_IMAGE_MIRROR_HOSTS = config(
+    'DJANGO_PLACEHOLDER_IMAGE_MIRROR_HOSTS',
+    cast=Csv(),
+    default='via.placeholder.com',
+)
@@ -6,6 +6,7 @@ values are overridden.
 """
 
 from server.settings.components import config
+from server.settings.components.caches import CACHES
 
 # Production flags:
 # https://docs.djangoproject.com/en/3.2/howto/deployment/
@@ -45,6 +46,20 @@ STATICFILES_STORAGE = (
 MEDIA_ROOT = '/var/www/django/media'
 
 
+# Caching
+# https://docs.djangoproject.com/en/3.2/topics/cache/#memcached
+
+# Placeholder API state is shared by all workers and services,
+# it needs atomic `add` and `incr`, like `memcached:11211`:
+CACHES = {
+    **CACHES,
+    'placeholder': {
+        'BACKEND': 'django.core.cache.backends.memcached.PyMemcacheCache',
+        'LOCATION': config('DJANGO_PLACEHOLDER_API_CACHE_LOCATION'),
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
 
@@ -10,6 +10,7 @@ pytest_plugins = [
     # Should be the first custom one:
     'plugins.django_settings',
     'plugins.identity.user',
+    'plugins.pictures.images',
 
     # TODO: add your own plugins here!
 ]
@@ -1,6 +1,8 @@
 import pytest
 from django.core.cache import BaseCache, caches
 
+from server.common.services import background
+
 
 @pytest.fixture(autouse=True)
 def _media_root(settings, tmpdir_factory) -> None:
@@ -33,6 +35,13 @@ def _debug(settings) -> None:
         template['OPTIONS']['debug'] = True
 
 
+@pytest.fixture(autouse=True)
+def _background_tasks(settings) -> None:
+    """Runs background tasks inline, so tests can see their results."""
+    settings.BACKGROUND_TASKS_WORKERS = 0
+    background.reset()
+
+
 @pytest.fixture(autouse=True)
 def cache(settings) -> BaseCache:
     """Modifies how cache is used in Django tests."""
@@ -44,6 +53,7 @@ def cache(settings) -> BaseCache:
     }
     settings.RATELIMIT_USE_CACHE = test_cache
     settings.AXES_CACHE = test_cache
+    settings.PLACEHOLDER_API_CACHE = test_cache
 
     # Clearing cache:
     caches[test_cache].clear()
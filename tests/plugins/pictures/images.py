@@ -0,0 +1,71 @@
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Iterator, List, Type, cast, final
+
+import pytest
+
+
+@final
+class ImageServer(object):
+    """Running local server that always returns the same image."""
+
+    def __init__(self, url: str) -> None:
+        """Server is already listening on `url`."""
+        self.url = url
+        self.hits = 0
+        self._lock = threading.Lock()
+
+    def record_hit(self) -> None:
+        """Count a single request served."""
+        with self._lock:
+            self.hits += 1
+
+
+#: Starts a server returning the given body with the given content type:
+ImageServerFactory = Callable[[bytes, str], ImageServer]
+
+
+@pytest.fixture
+def image_server() -> Iterator[ImageServerFactory]:
+    """Local stand-ins for third-party image hosts, stopped after a test."""
+    servers: List[ThreadingHTTPServer] = []
+
+    def factory(body: bytes, content_type: str) -> ImageServer:
+        handler_type = cast(Type[_Handler], type('Handler', (_Handler,), {
+            'body': body,
+            'content_type': content_type,
+        }))
+        server = ThreadingHTTPServer(('127.0.0.1', 0), handler_type)
+        server.daemon_threads = True
+        image_server = ImageServer(
+            'http://127.0.0.1:{0}/'.format(server.server_port),
+        )
+        handler_type.image_server = image_server
+        servers.append(server)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return image_server
+
+    yield factory
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+class _Handler(BaseHTTPRequestHandler):  # noqa: WPS110
+    protocol_version = 'HTTP/1.1'
+
+    image_server: ImageServer
+    body: bytes
+    content_type: str
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.image_server.record_hit()
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', self.content_type)
+        self.send_header('Content-Length', str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args: object) -> None:
+        """Keep test output clean."""
@@ -0,0 +1,80 @@
+from functools import partial
+from pathlib import Path
+from typing import Optional
+
+import pytest
+from django.core.management import call_command
+
+from server.apps.identity.intrastructure.services import placeholder
+from server.apps.identity.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+def test_backfill_resumes_from_checkpoint(
+    monkeypatch: pytest.MonkeyPatch,
+    user_data_factory,
+    user_password: str,
+    tmp_path: Path,
+) -> None:
+    """This test ensures that users after the checkpoint get their leads."""
+    monkeypatch.setattr(
+        placeholder.LeadCreate,
+        '__call__',
+        lambda fetcher, user: placeholder.UserResponse(id=user.id + 100),
+    )
+    skipped, backfilled = (
+        User.objects.create_user(password=user_password, **user_data_factory())
+        for _ in range(2)
+    )
+    checkpoint = tmp_path.joinpath('checkpoint')
+    checkpoint.write_text(str(skipped.id))
+
+    call_command('backfill_leads', checkpoint=checkpoint, rate=0)
+
+    assert User.objects.get(id=skipped.id).lead_id is None
+    assert User.objects.get(id=backfilled.id).lead_id == backfilled.id + 100
+    assert checkpoint.read_text() == str(backfilled.id)
+
+
+def test_failed_users_are_retried_on_resume(
+    monkeypatch: pytest.MonkeyPatch,
+    user_data_factory,
+    user_password: str,
+    tmp_path: Path,
+) -> None:
+    """This test ensures that the checkpoint stays before failed users."""
+    failed, created = (
+        User.objects.create_user(password=user_password, **user_data_factory())
+        for _ in range(2)
+    )
+    monkeypatch.setattr(
+        placeholder.LeadCreate,
+        '__call__',
+        partial(_lead_unless_failed, failed.id),
+    )
+    checkpoint = tmp_path.joinpath('checkpoint')
+
+    call_command('backfill_leads', checkpoint=checkpoint, rate=0)
+
+    assert User.objects.get(id=created.id).lead_id == created.id + 100
+    assert checkpoint.read_text() == '0'
+
+    monkeypatch.setattr(
+        placeholder.LeadCreate,
+        '__call__',
+        partial(_lead_unless_failed, None),
+    )
+    call_command('backfill_leads', checkpoint=checkpoint, rate=0)
+
+    assert User.objects.get(id=failed.id).lead_id == failed.id + 100
+    assert checkpoint.read_text() == str(failed.id)
+
+
+def _lead_unless_failed(
+    failed_id: Optional[int],
+    user: User,
+) -> placeholder.UserResponse:
+    if user.id == failed_id:
+        raise ConnectionError('API is down')
+    return placeholder.UserResponse(id=user.id + 100)
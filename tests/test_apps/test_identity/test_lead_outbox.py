@@ -0,0 +1,207 @@
+import datetime as dt
+from http import HTTPStatus
+from typing import Any, List
+
+import pytest
+import requests
+from django.core.management import call_command
+from django.utils import timezone
+
+from server.apps.identity.container import container
+from server.apps.identity.intrastructure.services import placeholder
+from server.apps.identity.logic.repo.queries import lead_outbox
+from server.apps.identity.logic.usecases.lead_outbox_dispatch import (
+    DispatchResult,
+    LeadOutboxDispatch,
+)
+from server.apps.identity.logic.usecases.user_create_new import UserCreateNew
+from server.apps.identity.logic.usecases.user_update import UserUpdate
+from server.apps.identity.models import LeadOutbox, LeadOutboxKind, User
+from server.common.services import sessions
+
+pytestmark = pytest.mark.django_db
+
+_LEAD_ID = 42
+
+
+@pytest.fixture
+def user(user_data, user_password: str) -> User:
+    """Registered user with a pending outbox row."""
+    registered = User.objects.create_user(
+        password=user_password,
+        **user_data,
+    )
+    container.instantiate(UserCreateNew)(registered)
+    return User.objects.get(id=registered.id)
+
+
+class _LeadsSession(object):
+    """Records sent idempotency keys, fails the first `failures` calls."""
+
+    def __init__(self, failures: int) -> None:
+        self.keys: List[str] = []
+        self._failures = failures
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        self.keys.append(kwargs['headers']['Idempotency-Key'])
+        if len(self.keys) <= self._failures:
+            raise requests.Timeout(url)
+        response = requests.Response()
+        response.status_code = HTTPStatus.CREATED
+        response._content = b'{"id": 42}'  # noqa: WPS437
+        return response
+
+
+def _leads_session(
+    monkeypatch: pytest.MonkeyPatch,
+    *,
+    failures: int = 0,
+) -> _LeadsSession:
+    session = _LeadsSession(failures)
+    monkeypatch.setattr(sessions, 'pooled_session', lambda pool_size: session)
+    return session
+
+
+def _dispatch() -> DispatchResult:
+    dispatch = container.instantiate(LeadOutboxDispatch)
+    return dispatch(batch_size=10, concurrency=2)
+
+
+def test_lead_id_is_saved(
+    monkeypatch: pytest.MonkeyPatch,
+    user: User,
+) -> None:
+    """This test ensures that dispatched users get their lead ids."""
+    monkeypatch.setattr(
+        placeholder.LeadCreate,
+        '__call__',
+        lambda fetcher, user: placeholder.UserResponse(id=_LEAD_ID),
+    )
+
+    assert _dispatch() == DispatchResult(sent=1)
+    assert User.objects.get(id=user.id).lead_id == _LEAD_ID
+    assert not LeadOutbox.objects.exists()
+
+
+def _failing_lead_create(
+    fetcher: placeholder.LeadCreate,
+    user: User,
+) -> placeholder.UserResponse:
+    raise ConnectionError('Placeholder API is down')
+
+
+def test_failed_rows_are_retried_later(
+    monkeypatch: pytest.MonkeyPatch,
+    user: User,
+) -> None:
+    """This test ensures that failed rows stay in the outbox with backoff."""
+    monkeypatch.setattr(
+        placeholder.LeadCreate,
+        '__call__',
+        _failing_lead_create,
+    )
+
+    assert _dispatch() == DispatchResult(failed=1)
+    assert _dispatch() == DispatchResult()  # not available yet
+    assert LeadOutbox.objects.get(user=user).attempts == 1
+
+
+def test_updates_are_merged(
+    monkeypatch: pytest.MonkeyPatch,
+    settings,
+    user: User,
+) -> None:
+    """This test ensures that repeated updates are sent once."""
+    settings.PLACEHOLDER_API_LEAD_UPDATE_DEBOUNCE = 0
+    sent_updates = []
+    monkeypatch.setattr(
+        placeholder.LeadUpdate,
+        '__call__',
+        lambda fetcher, user: sent_updates.append(user.first_name),
+    )
+    User.objects.filter(id=user.id).update(lead_id=_LEAD_ID)
+    LeadOutbox.objects.filter(user=user).delete()
+
+    user_update = container.instantiate(UserUpdate)
+    for first_name in ('first', 'latest'):
+        User.objects.filter(id=user.id).update(first_name=first_name)
+        user_update(user)
+
+    assert _dispatch() == DispatchResult(sent=1)
+    assert sent_updates == ['latest']
+    assert not LeadOutbox.objects.exists()
+
+
+def test_update_merged_in_flight_is_kept(user: User) -> None:
+    """This test ensures that updates made while sending are not lost."""
+    lead_outbox.merge_update(user, available_at=timezone.now())
+    in_flight = lead_outbox.claim(10, lease=dt.timedelta(minutes=1))
+    lead_outbox.merge_update(user, available_at=timezone.now())
+
+    lead_outbox.delete_processed(in_flight)
+
+    kept = LeadOutbox.objects.get()
+    assert kept.kind == LeadOutboxKind.UPDATE
+    assert kept.version == 1
+
+
+def test_update_merged_in_flight_keeps_lease(user: User) -> None:
+    """This test ensures that merged updates are not claimed twice."""
+    lead_outbox.merge_update(user, available_at=timezone.now())
+    assert lead_outbox.claim(10, lease=dt.timedelta(minutes=5))
+
+    lead_outbox.merge_update(user, available_at=timezone.now())
+
+    assert not lead_outbox.claim(10, lease=dt.timedelta(minutes=5))
+
+
+def test_no_op_updates_are_skipped(user: User) -> None:
+    """This test ensures that unchanged users are not sent again."""
+    user.lead_id = _LEAD_ID
+    user.lead_fingerprint = placeholder.fingerprint(user)
+    user.save(update_fields=['lead_id', 'lead_fingerprint'])
+
+    container.instantiate(UserUpdate)(user)
+    assert not LeadOutbox.objects.filter(kind=LeadOutboxKind.UPDATE).exists()
+
+    User.objects.filter(id=user.id).update(job_title='Changed')
+    call_command('resync_leads')
+    assert LeadOutbox.objects.filter(kind=LeadOutboxKind.UPDATE).exists()
+
+
+def test_lead_create_retries_reuse_key(
+    monkeypatch: pytest.MonkeyPatch,
+    settings,
+    user: User,
+) -> None:
+    """This test ensures that every attempt sends the same key."""
+    settings.PLACEHOLDER_API_RETRIES = 0
+    session = _leads_session(monkeypatch, failures=1)
+
+    assert _dispatch() == DispatchResult(failed=1)
+    LeadOutbox.objects.update(available_at=timezone.now())
+    assert _dispatch() == DispatchResult(sent=1)
+
+    key = str(User.objects.get(id=user.id).lead_idempotency_key)
+    assert session.keys == [key, key]
+
+
+def test_created_lead_saved_before_batch(
+    monkeypatch: pytest.MonkeyPatch,
+    user: User,
+) -> None:
+    """This test ensures that created leads survive failed batches."""
+    session = _leads_session(monkeypatch)
+    with monkeypatch.context() as patched:
+        patched.setattr(lead_outbox, 'delete_processed', _crash)
+        with pytest.raises(RuntimeError):
+            _dispatch()
+
+    LeadOutbox.objects.update(available_at=timezone.now())
+    assert _dispatch() == DispatchResult(sent=1)
+    assert User.objects.get(id=user.id).lead_id == _LEAD_ID
+    assert len(session.keys) == 1
+
+
+def _crash(processed: List[LeadOutbox]) -> None:
+    raise RuntimeError('Worker is killed')
@@ -0,0 +1,59 @@
+from typing import List
+
+import pytest
+
+from server.apps.pictures.container import container
+from server.apps.pictures.intrastructure.services import placeholder
+from server.apps.pictures.logic.usecases.catalog_sync import (
+    CatalogSync,
+    SyncResult,
+)
+from server.apps.pictures.models import PictureCatalog
+
+pytestmark = pytest.mark.django_db
+
+
+def _picture(
+    picture_id: int,
+    title: str = 'title',
+) -> placeholder.PictureResponse:
+    return placeholder.PictureResponse(
+        id=picture_id,
+        url='https://via.placeholder.com/600/{0}'.format(picture_id),
+        thumbnailUrl='https://via.placeholder.com/150/{0}'.format(picture_id),
+        title=title,
+    )
+
+
+@pytest.fixture
+def remote_pictures(
+    monkeypatch: pytest.MonkeyPatch,
+) -> List[placeholder.PictureResponse]:
+    """Replaces remote API with a local list of pictures."""
+    pictures = [_picture(picture_id) for picture_id in range(1, 6)]
+
+    def factory(self, *, max_bytes: int, max_items: int):
+        return iter(pictures[:max_items])
+
+    monkeypatch.setattr(placeholder.PicturesFetch, 'stream', factory)
+    return pictures
+
+
+def _sync() -> SyncResult:
+    catalog_sync = container.instantiate(CatalogSync)
+    return sum(catalog_sync(batch_size=2), SyncResult())
+
+
+def test_sync_creates_rows(remote_pictures) -> None:
+    """This test ensures that all remote pages are synced."""
+    assert _sync() == SyncResult(created=5)
+    assert PictureCatalog.objects.count() == len(remote_pictures)
+
+
+def test_sync_only_touches_changed_rows(remote_pictures) -> None:
+    """This test ensures that unchanged rows are not written."""
+    _sync()
+    remote_pictures[0] = _picture(1, title='new title')
+
+    assert _sync() == SyncResult(updated=1, unchanged=4)
+    assert PictureCatalog.objects.get(id=1).title == 'new title'
@@ -0,0 +1,150 @@
+from http import HTTPStatus
+from typing import List, final
+
+import pytest
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from server.apps.pictures.intrastructure.services import images
+from server.apps.pictures.models import FavouritePicture, PictureCatalog
+
+pytestmark = pytest.mark.django_db
+
+_URL = 'https://via.placeholder.com/600/92c952'
+_THUMBNAIL_URL = 'https://via.placeholder.com/150/92c952'
+
+
+@final
+class _Downloads(object):
+    """Records downloaded urls instead of downloading them."""
+
+    def __init__(self) -> None:
+        self.urls: List[str] = []
+
+    def __call__(self, url: str) -> str:
+        self.urls.append(url)
+        return 'mirror/local.jpg'
+
+
+def test_dashboard_shows_thumbnails(admin_client: Client) -> None:
+    """This test ensures that full-size images are only linked."""
+    _catalog_picture()
+
+    response = admin_client.get(reverse('pictures:dashboard'))
+
+    assert response.status_code == HTTPStatus.OK
+    assert 'src="{0}"'.format(_THUMBNAIL_URL) in response.content.decode()
+    assert 'src="{0}"'.format(_URL) not in response.content.decode()
+
+
+def test_favourites_store_thumbnails(
+    admin_client: Client,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """This test ensures that thumbnails are saved and mirrored."""
+    monkeypatch.setattr(
+        images.ImageDownload,
+        '__call__',
+        lambda *args, **kwargs: 'mirror/local.jpg',
+    )
+
+    _catalog_picture()
+
+    response = admin_client.post(reverse('pictures:dashboard'), data={
+        'foreign_id': 1,
+        'url': 'http://169.254.169.254/',
+        'thumbnail_url': 'http://169.254.169.254/',
+    })
+
+    assert response.status_code == HTTPStatus.FOUND
+    picture = FavouritePicture.objects.get()
+    assert picture.url == _URL
+    assert picture.thumbnail_url == _THUMBNAIL_URL
+    assert picture.thumbnail == '/media/mirror/local.jpg'
+
+
+def test_favourites_added_once(
+    admin_client: Client,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """This test ensures that adding the same picture twice is a no-op."""
+    downloads = _Downloads()
+    monkeypatch.setattr(
+        images.ImageDownload,
+        '__call__',
+        lambda _, url, store: downloads(url),
+    )
+    _catalog_picture()
+
+    for _ in range(2):
+        response = admin_client.post(reverse('pictures:dashboard'), data={
+            'foreign_id': 1,
+        })
+
+        assert response.status_code == HTTPStatus.FOUND
+    assert FavouritePicture.objects.count() == 1
+    assert downloads.urls == [_THUMBNAIL_URL]
+
+
+def test_favourites_only_from_catalog(admin_client: Client) -> None:
+    """This test ensures that pictures missing in the catalog are rejected."""
+    _catalog_picture()
+
+    response = admin_client.post(reverse('pictures:dashboard'), data={
+        'foreign_id': 2,
+    })
+
+    assert response.status_code == HTTPStatus.OK
+    assert not FavouritePicture.objects.exists()
+
+
+def test_favourites_selected_at_once(
+    admin_client: Client,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """This test ensures that selected pictures are saved with one insert."""
+    monkeypatch.setattr(
+        images.ImageDownload,
+        '__call__',
+        lambda *args, **kwargs: 'mirror/local.jpg',
+    )
+    PictureCatalog.objects.bulk_create([
+        PictureCatalog(
+            id=picture_id,
+            url=_URL,
+            thumbnail_url=_THUMBNAIL_URL,
+            title='title',
+        )
+        for picture_id in range(1, 4)
+    ])
+
+    captured = CaptureQueriesContext(connection)
+    with captured:
+        response = admin_client.post(
+            reverse('pictures:dashboard_selected'),
+            data={'selected': [1, 3]},
+        )
+
+    assert response.status_code == HTTPStatus.FOUND
+    assert sorted(
+        FavouritePicture.objects.values_list('foreign_id', flat=True),
+    ) == [1, 3]
+    inserts = [
+        query['sql']
+        for query in captured.captured_queries
+        if query['sql'].startswith('INSERT')
+    ]
+    assert len([
+        sql for sql in inserts if '"pictures_favouritepicture"' in sql
+    ]) == 1
+
+
+def _catalog_picture() -> PictureCatalog:
+    return PictureCatalog.objects.create(
+        id=1,
+        url=_URL,
+        thumbnail_url=_THUMBNAIL_URL,
+        title='title',
+    )
@@ -0,0 +1,67 @@
+import csv
+import json
+from http import HTTPStatus
+from typing import cast
+
+import pytest
+from django.http import StreamingHttpResponse
+from django.test import Client
+from django.urls import reverse
+
+from server.apps.identity.models import User
+from server.apps.pictures.models import FavouritePicture
+
+pytestmark = pytest.mark.django_db
+
+_URL = 'https://via.placeholder.com/600/92c952'
+
+
+@pytest.fixture
+def _favourites(admin_user: User) -> None:
+    FavouritePicture.objects.bulk_create([
+        FavouritePicture(user=admin_user, foreign_id=foreign_id, url=_URL)
+        for foreign_id in range(3)
+    ])
+
+
+@pytest.mark.usefixtures('_favourites')
+def test_favourites_export_ndjson(admin_client: Client) -> None:
+    """This test ensures that favourites are streamed newest first."""
+    response = admin_client.get(reverse('pictures:favourites_export'))
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.streaming
+    assert response['Content-Type'] == 'application/x-ndjson'
+    lines = _streamed(response).splitlines()
+    exported = [json.loads(line) for line in lines]
+    assert [picture['foreign_id'] for picture in exported] == [2, 1, 0]
+
+
+@pytest.mark.usefixtures('_favourites')
+def test_favourites_export_csv(admin_client: Client) -> None:
+    """This test ensures that csv export has a header."""
+    response = admin_client.get(
+        reverse('pictures:favourites_export'),
+        data={'format': 'csv'},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    rows = list(csv.DictReader(
+        _streamed(response).decode().splitlines(),
+    ))
+    assert [row['foreign_id'] for row in rows] == ['2', '1', '0']
+    assert rows[0]['url'] == _URL
+
+
+def test_favourites_export_unknown_format(admin_client: Client) -> None:
+    """This test ensures that unknown formats are not found."""
+    response = admin_client.get(
+        reverse('pictures:favourites_export'),
+        data={'format': 'xml'},
+    )
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def _streamed(response: object) -> bytes:
+    return b''.join(cast(StreamingHttpResponse, response).streaming_content)
@@ -0,0 +1,64 @@
+from http import HTTPStatus
+
+import pytest
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+from server.apps.identity.models import User
+from server.apps.pictures.logic.usecases.favourites_list import FavouritesList
+from server.apps.pictures.models import FavouritePicture
+
+pytestmark = pytest.mark.django_db
+
+
+def test_favourites_keyset_pages(admin_user: User) -> None:
+    """This test ensures that pages do not skip pictures created at once."""
+    FavouritePicture.objects.bulk_create([
+        FavouritePicture(user=admin_user, foreign_id=foreign_id, url='')
+        for foreign_id in range(5)
+    ])
+    FavouritePicture.objects.update(created_at=timezone.now())
+    list_favourites = FavouritesList()
+
+    first_page = list_favourites(admin_user.id, limit=2)
+    second_page = list_favourites(
+        admin_user.id, cursor=first_page.next_cursor, limit=2,
+    )
+    last_page = list_favourites(
+        admin_user.id, cursor=second_page.next_cursor, limit=2,
+    )
+
+    assert [
+        picture.foreign_id
+        for page in (first_page, second_page, last_page)
+        for picture in page.pictures
+    ] == [4, 3, 2, 1, 0]
+    assert last_page.next_cursor is None
+
+
+def test_favourites_next_page_link(admin_client: Client) -> None:
+    """This test ensures that broken cursors show the first page."""
+    response = admin_client.get(
+        reverse('pictures:favourites'),
+        data={'after': 'broken'},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert b'favourites-next-page' not in response.content
+
+
+def test_favourites_rows_thumbnails(admin_user: User) -> None:
+    """This test ensures that projection rows prefer local thumbnails."""
+    FavouritePicture.objects.create(
+        user=admin_user,
+        foreign_id=1,
+        url='https://via.placeholder.com/600/92c952',
+        local_thumbnail='mirror/local.jpg',
+    )
+
+    page = FavouritesList()(admin_user.id)
+
+    assert [picture.thumbnail for picture in page.pictures] == [
+        '/media/mirror/local.jpg',
+    ]
@@ -0,0 +1,33 @@
+import pytest
+from django_test_migrations.migrator import Migrator
+
+
+@pytest.mark.django_db
+def test_favourites_duplicates_removed(migrator: Migrator) -> None:
+    """This test ensures that the first copy of each picture is kept."""
+    old_state = migrator.apply_initial_migration(
+        ('pictures', '0005_favouritepicture_user_recent'),
+    )
+    user = old_state.apps.get_model('identity', 'User').objects.create(
+        email='duplicates@example.com',
+    )
+    favourite_picture = old_state.apps.get_model(
+        'pictures', 'FavouritePicture',
+    )
+    originals = [
+        favourite_picture.objects.create(
+            user=user, foreign_id=foreign_id, url='',
+        ).id
+        for foreign_id in (1, 2, 1, 2, 1)
+    ][:2]
+
+    new_state = migrator.apply_tested_migration(
+        ('pictures', '0006_favouritepicture_user_foreign_id'),
+    )
+
+    favourite_picture = new_state.apps.get_model(
+        'pictures', 'FavouritePicture',
+    )
+    assert list(
+        favourite_picture.objects.order_by('id').values_list('id', flat=True),
+    ) == originals
@@ -0,0 +1,81 @@
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+
+from server.apps.identity.models import User
+from server.apps.pictures.models import FavouritePicture
+
+if TYPE_CHECKING:
+    from tests.plugins.pictures.images import ImageServerFactory
+
+pytestmark = pytest.mark.django_db
+
+_IMAGE = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR'
+
+
+def _favourite(user: User, url: str, foreign_id: int) -> FavouritePicture:
+    return FavouritePicture.objects.create(
+        user=user,
+        foreign_id=foreign_id,
+        url=url,
+        thumbnail_url=url,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _allow_local_images(settings) -> None:
+    """Images from our local stand-in server can be mirrored."""
+    settings.PLACEHOLDER_IMAGE_MIRROR_HOSTS = ['127.0.0.1']
+
+
+def test_mirror_deduplicates_images(
+    admin_user: User,
+    image_server: 'ImageServerFactory',
+) -> None:
+    """This test ensures that same images are stored once and resumed."""
+    standin = image_server(_IMAGE, 'image/png')
+    for index in range(3):
+        _favourite(admin_user, standin.url, index)
+    call_command('mirror_pictures', chunk_size=2, concurrency=2)
+    call_command('mirror_pictures')
+
+    assert standin.hits == FavouritePicture.objects.count()
+
+    local_thumbnails = FavouritePicture.objects.values_list(
+        'local_thumbnail', flat=True,
+    ).distinct()
+    assert len(local_thumbnails) == 1
+    local_thumbnail = local_thumbnails[0]
+    assert local_thumbnail.startswith('mirror/')
+    assert local_thumbnail.endswith('.png')
+    with default_storage.open(local_thumbnail) as stored:
+        assert stored.read() == _IMAGE
+
+
+def test_not_images_are_skipped(
+    admin_user: User,
+    image_server: 'ImageServerFactory',
+) -> None:
+    """This test ensures that failed pictures are left for the next run."""
+    standin = image_server(b'{"not": "image"}', 'application/json')
+    _favourite(admin_user, standin.url, 1)
+    call_command('mirror_pictures')
+
+    assert FavouritePicture.objects.get().local_thumbnail.name == ''
+
+
+def test_unknown_hosts_are_not_requested(
+    admin_user: User,
+    image_server: 'ImageServerFactory',
+    settings,
+) -> None:
+    """This test ensures that images are only fetched from allowed hosts."""
+    settings.PLACEHOLDER_IMAGE_MIRROR_HOSTS = ['via.placeholder.com']
+    standin = image_server(_IMAGE, 'image/png')
+    _favourite(admin_user, standin.url, 1)
+    call_command('mirror_pictures')
+
+    assert standin.hits == 0
+    assert FavouritePicture.objects.get().local_thumbnail.name == ''
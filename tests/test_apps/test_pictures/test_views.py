@@ -0,0 +1,22 @@
+from http import HTTPStatus
+
+import pytest
+from django.test import Client
+from django.urls import reverse
+
+from server.apps.pictures.models import PictureCatalog
+
+
+@pytest.mark.django_db
+def test_dashboard_resolves_dependencies(admin_client: Client) -> None:
+    """This test ensures that use cases get the background executor."""
+    PictureCatalog.objects.create(
+        id=1,
+        url='https://via.placeholder.com/600/92c952',
+        thumbnail_url='https://via.placeholder.com/150/92c952',
+        title='title',
+    )
+
+    response = admin_client.get(reverse('pictures:dashboard'))
+
+    assert response.status_code == HTTPStatus.OK
@@ -0,0 +1,31 @@
+from types import MappingProxyType
+
+import pydantic
+import pytest
+
+from server.apps.pictures.intrastructure.services.placeholder import (
+    PictureResponse,
+)
+
+_RAW_PICTURE = MappingProxyType({
+    'id': 1,
+    'url': 'https://via.placeholder.com/600/92c952',
+    'thumbnailUrl': 'https://via.placeholder.com/150/92c952',
+    'title': 'accusamus beatae ad facilis',
+})
+
+
+def test_trusted_decoding_matches_strict() -> None:
+    """This test ensures that trusted decoding builds the same models."""
+    assert PictureResponse.parse_trusted(
+        dict(_RAW_PICTURE),
+    ) == PictureResponse.parse_obj(dict(_RAW_PICTURE))
+
+
+def test_trusted_decoding_falls_back_on_mismatch() -> None:
+    """This test ensures that mismatched shapes are validated strictly."""
+    coerced = PictureResponse.parse_trusted({**_RAW_PICTURE, 'id': '1'})
+
+    assert coerced.id == 1
+    with pytest.raises(pydantic.ValidationError):
+        PictureResponse.parse_trusted({**_RAW_PICTURE, 'id': 'one'})
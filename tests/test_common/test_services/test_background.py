@@ -0,0 +1,60 @@
+import threading
+from functools import partial
+from typing import List
+
+from structlog.testing import capture_logs
+
+from server.common.services import background
+
+
+def test_full_queue_drops_tasks() -> None:
+    """This test ensures that callers are not blocked by a full queue."""
+    executor = background.BackgroundExecutor(max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    assert executor.submit(release.wait)
+    assert executor.submit(release.wait)
+    assert not executor.submit(release.wait)
+
+    release.set()
+    assert executor.drain(timeout=1)
+    assert executor.stats() == {
+        'submitted': 2,
+        'dropped': 1,
+        'completed': 2,
+        'failed': 0,
+        'pending': 0,
+    }
+
+
+def test_drain_waits_for_pending_tasks() -> None:
+    """This test ensures that pending tasks are finished on shutdown."""
+    executor = background.BackgroundExecutor(max_workers=2, max_queue=10)
+    finished: List[int] = []
+
+    for index in range(5):
+        executor.submit(partial(finished.append, index))
+    executor.submit(_failing_task)
+
+    assert executor.drain(timeout=1)
+    assert sorted(finished) == [0, 1, 2, 3, 4]
+    assert executor.stats()['failed'] == 1
+    assert not executor.submit(lambda: None)
+
+
+def test_drain_logs_counters(settings) -> None:
+    """This test ensures that dropped tasks are visible in logs."""
+    settings.BACKGROUND_TASKS_WORKERS = 1
+    background.executor(settings).submit(lambda: None)
+
+    with capture_logs() as logs:
+        background.drain(settings)
+        drained = logs[-1]
+
+    assert drained['event'] == 'background_tasks_drained'
+    assert drained['submitted'] == 1
+    assert drained['dropped'] == 0
+
+
+def _failing_task() -> None:
+    raise ValueError('task has failed')
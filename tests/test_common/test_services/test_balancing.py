@@ -0,0 +1,85 @@
+from typing import Any, ClassVar
+
+import pytest
+import requests
+from django.core.cache import BaseCache
+
+from server.common.services import http, resilience, sessions
+from server.common.services.balancing import EndpointPool
+
+_PRIMARY = 'https://primary.example.com/'
+_MIRROR = 'https://mirror.example.com/'
+
+
+class _PhotosFetcher(http.BaseFetcher):
+    _url_path: ClassVar[str] = 'photos'
+
+
+class _FlakySession(object):
+    """Session where all calls to the `broken` host fail."""
+
+    def __init__(self, broken: str) -> None:
+        self._broken = broken
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        if url.startswith(self._broken):
+            raise requests.ConnectionError(url)
+        response = requests.Response()
+        response.status_code = 200
+        return response
+
+
+def test_route_keeps_path() -> None:
+    """This test ensures that only the host of the url is replaced."""
+    pool = EndpointPool(urls=(_MIRROR,))
+
+    assert pool.route(
+        'https://primary.example.com/photos?_limit=1',
+    ) == 'https://mirror.example.com/photos?_limit=1'
+
+
+def test_failing_endpoint_is_ejected() -> None:
+    """This test ensures that failing endpoints get no traffic."""
+    pool = EndpointPool(urls=(_PRIMARY, _MIRROR), ejection_failures=2)
+    for _ in range(2):
+        pool.record(_PRIMARY, success=False, elapsed=0.1)
+
+    routed = {pool.route('{0}photos'.format(_PRIMARY)) for _ in range(10)}
+    assert routed == {'{0}photos'.format(_MIRROR)}
+
+
+def test_mirrors_have_own_breakers(
+    cache: BaseCache,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """This test ensures that a broken mirror does not open all circuits."""
+    broken = 'https://broken.example.com/'
+    monkeypatch.setattr(
+        sessions,
+        'pooled_session',
+        lambda pool_size: _FlakySession(broken),
+    )
+    fetcher = _PhotosFetcher(
+        api_url=broken,
+        api_timeout=1,
+        endpoints=EndpointPool(
+            urls=(broken, 'https://healthy.example.com/'),
+            ejection_failures=2,
+        ),
+        breaker=resilience.CircuitBreaker(
+            cache=cache,
+            failure_threshold=2,
+            cooldown=60,
+            slow_call=1,
+        ),
+    )
+
+    failures = 0
+    while failures < 2:
+        try:
+            fetcher._request('get', fetcher.url_path())  # noqa: WPS437
+        except requests.ConnectionError:
+            failures += 1
+
+    for _ in range(10):
+        fetcher._request('get', fetcher.url_path())  # noqa: WPS437
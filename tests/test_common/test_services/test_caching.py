@@ -0,0 +1,89 @@
+import itertools
+import pickle  # noqa: S403
+import threading
+from typing import Optional
+
+import attr
+import pytest
+from django.core.cache import BaseCache
+
+from server.common.services.caching import StaleWhileRevalidate
+from server.common.services.conditional import Validated
+
+
+@pytest.fixture
+def swr(cache: BaseCache) -> StaleWhileRevalidate:
+    """Cache where every entry is instantly stale."""
+    return StaleWhileRevalidate(cache=cache, ttl=0, stale_ttl=60)
+
+
+def _wait_for_refresh() -> None:
+    for thread in threading.enumerate():
+        if thread.name != threading.current_thread().name and thread.daemon:
+            thread.join(timeout=1)
+
+
+def _not_modified(cached: Optional[Validated[str]]) -> Validated[str]:
+    assert cached is not None
+    # Not modified values coalesced from other workers are new objects:
+    return pickle.loads(  # noqa: S301
+        pickle.dumps(attr.evolve(cached, not_modified=True)),
+    )
+
+
+def _is_not_modified(fetched: Validated[str]) -> bool:
+    return fetched.not_modified
+
+
+def test_miss_then_hit(cache: BaseCache) -> None:
+    """This test ensures that fresh values are served from cache."""
+    calls = itertools.count(1)
+    swr = StaleWhileRevalidate(cache=cache, ttl=60, stale_ttl=60)
+
+    assert swr('key', lambda: next(calls)) == 1
+    assert swr('key', lambda: next(calls)) == 1
+    assert swr.stats.snapshot() == {
+        'hit': 1,
+        'miss': 1,
+        'stale': 0,
+        'not_modified': 0,
+        'refresh_error': 0,
+    }
+
+
+def test_stale_is_served_and_refreshed(swr: StaleWhileRevalidate) -> None:
+    """This test ensures that stale values are refreshed in background."""
+    assert swr('key', lambda: 'old') == 'old'
+    assert swr('key', lambda: 'new') == 'old'
+
+    _wait_for_refresh()
+    assert swr('key', lambda: 'newest') == 'new'
+    assert swr.stats.snapshot()['stale'] == 2
+
+
+def _failing_fetch() -> str:
+    raise ConnectionError('upstream is down')
+
+
+def test_last_good_value_on_error(swr: StaleWhileRevalidate) -> None:
+    """This test ensures that failing refreshes keep the last good value."""
+    assert swr('key', lambda: 'good') == 'good'
+    assert swr('key', _failing_fetch) == 'good'
+
+    _wait_for_refresh()
+    assert swr('key', _failing_fetch) == 'good'
+    assert swr.stats.snapshot()['refresh_error'] >= 1
+
+
+def test_not_modified_is_reused(swr: StaleWhileRevalidate) -> None:
+    """This test ensures that revalidated values are kept and counted."""
+    original = Validated(value='decoded', etag='"v1"')
+    assert swr.revalidating(
+        'key', lambda cached: original, not_modified=_is_not_modified,
+    ) is original
+    assert swr.revalidating(
+        'key', _not_modified, not_modified=_is_not_modified,
+    ) == original
+
+    _wait_for_refresh()
+    assert swr.stats.snapshot()['not_modified'] == 1
@@ -0,0 +1,38 @@
+from http import HTTPStatus
+
+import requests
+
+from server.common.services.conditional import Validated, validated
+
+
+def _response(status_code: int, **headers: str) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers)
+    return response
+
+
+def test_validators_are_stored() -> None:
+    """This test ensures that validators are taken from the response."""
+    fetched = validated(
+        _response(HTTPStatus.OK, ETag='"v1"'),
+        lambda response: 'decoded',
+    )
+
+    assert fetched == Validated(value='decoded', etag='"v1"')
+    assert fetched.conditional_headers() == {'If-None-Match': '"v1"'}
+
+
+def test_not_modified_returns_previous() -> None:
+    """This test ensures that not modified responses are not decoded."""
+    previous = Validated(value='decoded', last_modified='yesterday')
+
+    fetched = validated(
+        _response(HTTPStatus.NOT_MODIFIED),
+        lambda response: 'never decoded',
+        previous,
+    )
+
+    assert fetched.value == 'decoded'
+    assert fetched.last_modified == 'yesterday'
+    assert fetched.not_modified
@@ -0,0 +1,62 @@
+from typing import Iterator
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from server.common.django.middleware import DeadlineMiddleware
+from server.common.services import deadline
+
+
+@pytest.fixture(autouse=True)
+def _clear_deadline() -> Iterator[None]:
+    yield
+    deadline.clear()
+
+
+def test_no_deadline() -> None:
+    """This test ensures that timeouts are kept without a deadline."""
+    assert deadline.remaining() is None
+    assert deadline.cap(5) == 5
+
+
+def test_timeouts_are_capped() -> None:
+    """This test ensures that timeouts never exceed the time left."""
+    deadline.start(2)
+
+    assert deadline.cap(5) <= 2
+    assert deadline.cap(1) == 1
+
+
+def test_deadline_exceeded() -> None:
+    """This test ensures that we do not call the API without time left."""
+    deadline.start(0)
+
+    with pytest.raises(deadline.DeadlineExceededError):
+        deadline.cap(5)
+
+
+def test_timeouts_share_time_left() -> None:
+    """This test ensures that connect and read fit in the time left."""
+    deadline.start(2)
+
+    connect_timeout, read_timeout = deadline.split(3, 5)
+
+    assert connect_timeout <= 1
+    assert connect_timeout + read_timeout <= 2
+
+
+def test_unresolved_requests_get_default_deadline(
+    rf: RequestFactory,
+    settings,
+) -> None:
+    """This test ensures that requests without resolved views are served."""
+    settings.REQUEST_DEADLINE = 3
+    request = rf.get('/')
+    middleware = DeadlineMiddleware(lambda request: HttpResponse())
+
+    middleware.process_view(request, HttpResponse, (), {})
+
+    remaining = deadline.remaining()
+    assert remaining is not None
+    assert 0 < remaining <= settings.REQUEST_DEADLINE
@@ -0,0 +1,20 @@
+import json
+
+import pytest
+
+from server.common.services import json_codec
+
+
+@pytest.mark.parametrize('codec', [
+    json_codec.STDLIB,
+    json_codec.DEFAULT,
+])
+def test_bytes_round_trip(codec: json_codec.JsonCodec) -> None:
+    """This test ensures that codecs work with raw bytes both ways."""
+    body = {'name': 'Имя', 'items': [1, 2.5, None, True]}
+    raw = codec.dumps(body)
+
+    assert isinstance(raw, bytes)
+    assert json.loads(raw) == body
+    assert codec.loads(raw) == body
+    assert codec.loads(json.dumps(body).encode('utf8')) == body
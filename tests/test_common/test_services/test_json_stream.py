@@ -0,0 +1,60 @@
+import json
+from typing import List
+
+import pytest
+
+from server.common.services.json_stream import PayloadTooLargeError, iter_array
+
+_PAYLOAD = (
+    {'id': 1, 'title': 'ünïcode'},
+    {'id': 2, 'nested': {'items': [1, 2]}},
+    12345,
+    -1.5e10,
+    'text',
+    None,
+)
+_RAW_PAYLOAD = json.dumps(_PAYLOAD).encode('utf8')
+
+
+def _chunks(chunk_size: int) -> List[bytes]:
+    return [
+        _RAW_PAYLOAD[index:index + chunk_size]
+        for index in range(0, len(_RAW_PAYLOAD), chunk_size)
+    ]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, len(_RAW_PAYLOAD)])
+def test_items_across_chunk_borders(chunk_size: int) -> None:
+    """This test ensures that items split between chunks are decoded."""
+    decoded = iter_array(
+        _chunks(chunk_size),
+        max_bytes=len(_RAW_PAYLOAD),
+        max_items=len(_PAYLOAD),
+    )
+
+    assert tuple(decoded) == _PAYLOAD
+
+
+def test_max_bytes() -> None:
+    """This test ensures that big payloads are rejected."""
+    decoded = iter_array(_chunks(1), max_bytes=10, max_items=len(_PAYLOAD))
+
+    with pytest.raises(PayloadTooLargeError):
+        list(decoded)
+
+
+def test_max_items() -> None:
+    """This test ensures that payloads with too many items are rejected."""
+    decoded = iter_array(_chunks(1), max_bytes=len(_RAW_PAYLOAD), max_items=2)
+
+    assert next(decoded) == _PAYLOAD[0]
+    assert next(decoded) == _PAYLOAD[1]
+    with pytest.raises(PayloadTooLargeError):
+        next(decoded)
+
+
+@pytest.mark.parametrize('raw_payload', [b'', b'"text"', b'[1, 2', b'["a": 1]'])
+def test_invalid_payload(raw_payload: bytes) -> None:
+    """This test ensures that invalid JSON raises errors."""
+    with pytest.raises(ValueError, match='.'):
+        list(iter_array([raw_payload], max_bytes=100, max_items=100))
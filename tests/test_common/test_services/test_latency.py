@@ -0,0 +1,21 @@
+from server.common.services.latency import AdaptiveTimeout
+
+_PERCENTILE = 0.99
+
+
+def test_default_until_enough_samples() -> None:
+    """This test ensures that static timeout is used for unknown latency."""
+    adaptive = AdaptiveTimeout(percentile=_PERCENTILE, min_samples=3)
+    adaptive.observe('unknown', 0.1)
+
+    assert adaptive.read_timeout('unknown', 5) == 5
+
+
+def test_timeout_follows_latency() -> None:
+    """This test ensures that timeout adapts to the observed latency."""
+    adaptive = AdaptiveTimeout(percentile=_PERCENTILE, min_samples=3, floor=0)
+    for elapsed in (0.1, 0.2, 1):
+        adaptive.observe('known', elapsed)
+
+    assert adaptive.read_timeout('known', 5) == 2
+    assert adaptive.read_timeout('known', 1) == 1
@@ -0,0 +1,72 @@
+import time
+from pathlib import Path
+
+import pytest
+import requests
+from django.core.cache import BaseCache
+from django.core.cache.backends.filebased import FileBasedCache
+from django.core.exceptions import ImproperlyConfigured
+
+from server.common.services import http
+from server.common.services.rate_limit import (
+    RateLimitedError,
+    SharedRateLimiter,
+)
+
+_NOW = 1700000000.5
+_RETRY_AFTER = 30
+
+
+@pytest.fixture
+def limiter(
+    cache: BaseCache,
+    monkeypatch: pytest.MonkeyPatch,
+) -> SharedRateLimiter:
+    """Fail-fast limiter for `/users` with time frozen in a single window."""
+    monkeypatch.setattr(time, 'time', lambda: _NOW)
+    return SharedRateLimiter(cache=cache, rates={'/users': 2}, max_wait=0)
+
+
+def test_fail_fast(limiter: SharedRateLimiter) -> None:
+    """This test ensures that calls over the rate fail without waiting."""
+    limiter.acquire('/users')
+    limiter.acquire('/users/{0}')
+    with pytest.raises(RateLimitedError):
+        limiter.acquire('/users')
+
+    limiter.acquire('/photos')  # not limited
+
+
+def test_retry_after_pauses_calls(limiter: SharedRateLimiter) -> None:
+    """This test ensures that throttled paths are paused and slowed down."""
+    limiter.throttled('/users', retry_after=None)
+    limiter.acquire('/users')
+    with pytest.raises(RateLimitedError):
+        limiter.acquire('/users')  # the rate is halved
+
+    limiter.throttled('/photos', retry_after=None)
+    limiter.throttled('/users/{0}', retry_after=_RETRY_AFTER)
+    with pytest.raises(RateLimitedError):
+        limiter.acquire('/users')
+
+
+def test_not_atomic_cache_is_rejected(tmp_path: Path) -> None:
+    """This test ensures that limits are never shared without atomic incr."""
+    with pytest.raises(ImproperlyConfigured):
+        SharedRateLimiter(
+            cache=FileBasedCache(str(tmp_path), {}),
+            rates={'/users': 2},
+            max_wait=0,
+        )
+
+
+@pytest.mark.parametrize('retry_after', [
+    'Wed, 21 Oct 2015 07:28:00 GMT',
+    'Wed, 21 Oct 2015 07:28:00 -0000',
+])
+def test_retry_after_http_date(retry_after: str) -> None:
+    """This test ensures that past HTTP-dates in any zone do not pause."""
+    response = requests.Response()
+    response.headers['Retry-After'] = retry_after
+
+    assert http._retry_after(response) == 0  # noqa: WPS437
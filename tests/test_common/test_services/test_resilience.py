@@ -0,0 +1,82 @@
+import time
+
+import pytest
+from django.core.cache import BaseCache
+
+from server.common.services.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryBudget,
+)
+
+_ENDPOINT = 'placeholder:endpoint'
+_COOLDOWN = 60
+
+
+@pytest.fixture
+def breaker(cache: BaseCache) -> CircuitBreaker:
+    """Breaker that opens after two failures."""
+    return CircuitBreaker(
+        cache=cache,
+        failure_threshold=2,
+        cooldown=_COOLDOWN,
+        slow_call=1,
+    )
+
+
+def _call(
+    breaker: CircuitBreaker,
+    *,
+    success: bool = False,
+    elapsed: float = 0,
+) -> None:
+    probe = breaker.guard(_ENDPOINT)
+    breaker.record(_ENDPOINT, probe=probe, success=success, elapsed=elapsed)
+
+
+def test_breaker_opens(breaker: CircuitBreaker) -> None:
+    """This test ensures that breaker fails fast after many failures."""
+    _call(breaker)
+    assert not breaker.guard(_ENDPOINT)
+
+    _call(breaker)
+    with pytest.raises(CircuitOpenError):
+        breaker.guard(_ENDPOINT)
+
+
+def test_slow_calls_are_failures(breaker: CircuitBreaker) -> None:
+    """This test ensures that slow successful calls count as failures."""
+    for _ in range(2):
+        _call(breaker, success=True, elapsed=2)
+
+    with pytest.raises(CircuitOpenError):
+        breaker.guard(_ENDPOINT)
+
+
+def test_half_open_probe(
+    breaker: CircuitBreaker,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """This test ensures that a single probe closes the circuit."""
+    _call(breaker)
+    _call(breaker)
+    cooldown_is_over = time.time() + _COOLDOWN + 1
+    monkeypatch.setattr(time, 'time', lambda: cooldown_is_over)
+
+    assert breaker.guard(_ENDPOINT)
+    with pytest.raises(CircuitOpenError):
+        breaker.guard(_ENDPOINT)  # only one probe at a time
+
+    breaker.record(_ENDPOINT, probe=True, success=True, elapsed=0)
+    assert not breaker.guard(_ENDPOINT)
+
+
+def test_retry_budget(cache: BaseCache) -> None:
+    """This test ensures that retries are capped by the budget."""
+    budget = RetryBudget(cache=cache, ratio=0.5, min_retries=1)
+    for _ in range(4):
+        budget.record_request()
+
+    spent = [budget.spend() for _ in range(4)]
+
+    assert spent == [True, True, True, False]
@@ -0,0 +1,20 @@
+import os
+
+import pytest
+
+from server.common.services import sessions
+
+
+def test_session_is_reused() -> None:
+    """This test ensures that the same process reuses its session."""
+    assert sessions.pooled_session(4) is sessions.pooled_session(4)
+
+
+def test_session_is_recreated_after_fork(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """This test ensures that forked processes do not share sessions."""
+    parent_session = sessions.pooled_session(4)
+    monkeypatch.setattr(os, 'getpid', lambda: -1)
+
+    assert sessions.pooled_session(4) is not parent_session
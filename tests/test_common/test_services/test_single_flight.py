@@ -0,0 +1,70 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, List
+
+from django.core.cache import BaseCache
+
+from server.common.services.single_flight import SingleFlight
+
+_CALLERS = 10
+_POLL_INTERVAL = 0.01
+
+
+def _fetch(calls: List[int]) -> int:
+    calls.append(1)
+    time.sleep(0.1)
+    return len(calls)
+
+
+def _call(
+    coalesced: SingleFlight,
+    barrier: threading.Barrier,
+    fetch: Callable[[], int],
+) -> int:
+    barrier.wait()
+    return coalesced('key', fetch)
+
+
+def test_threads_share_single_call(cache: BaseCache) -> None:
+    """This test ensures that concurrent identical calls are coalesced."""
+    coalesced = SingleFlight(cache=cache, timeout=1)
+    calls: List[int] = []
+    call = partial(
+        _call,
+        coalesced,
+        threading.Barrier(_CALLERS),
+        partial(_fetch, calls),
+    )
+
+    with ThreadPoolExecutor(max_workers=_CALLERS) as executor:
+        futures = [executor.submit(call) for _ in range(_CALLERS)]
+
+    assert {future.result() for future in futures} == {1}
+    assert len(calls) == 1
+
+
+def test_result_from_other_process(cache: BaseCache) -> None:
+    """This test ensures that lock owners from other processes are waited."""
+    coalesced = SingleFlight(
+        cache=cache,
+        timeout=1,
+        poll_interval=_POLL_INTERVAL,
+    )
+    cache.set('key:flight:lock', 1)
+    cache.set('key:flight:result', ('published',))
+
+    assert coalesced('key', lambda: 'fetched') == 'published'
+
+
+def test_fallback_on_lock_timeout(cache: BaseCache) -> None:
+    """This test ensures that we fetch on our own when waiting too long."""
+    coalesced = SingleFlight(
+        cache=cache,
+        timeout=0.1,
+        poll_interval=_POLL_INTERVAL,
+    )
+    cache.set('key:flight:lock', 1)
+
+    assert coalesced('key', lambda: 'fetched') == 'fetched'